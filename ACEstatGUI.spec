@@ -11,7 +11,8 @@ a = Analysis(['./src/Main.py'],
                 ('./resources', 'resources'),
                 *collect_data_files('acestatpy')
             ],
-             hiddenimports=[],
+             # Imported by name on first use, see Exporters.Registry
+             hiddenimports=['Exporters.ImageExporter', 'Exporters.MPLExporter'],
              hookspath=[],
              runtime_hooks=[],
              excludes=[],
@@ -0,0 +1,11 @@
+'''
+Puts src on sys.path, the application runs from there. Imported by each
+    benchmark before the application's modules:
+    import _path  # noqa: F401
+
+'''
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), "src"))
@@ -0,0 +1,68 @@
+'''
+Last Modified: 2026-10-18
+
+Compares GUI-thread time of Console against inserting every message into a
+    QPlainTextEdit, under a flood of serial messages:
+    python benchmarks/console.py [messages per second]
+
+'''
+import sys
+from time import perf_counter
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication, QPlainTextEdit
+# Local
+import _path  # noqa: F401
+from Widgets.Console import Console
+
+
+app = QApplication(sys.argv)
+rate = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+duration = 3.0
+line = "DATA,0.123456,-0.000123456,12345\n"
+
+
+def flood(write, widget):
+    # Deliver `rate` messages per second, in 1 ms bursts, and measure
+    #   the time the GUI thread spends handling them.
+    busy = [0.0]
+    sent = [0]
+    start = perf_counter()
+
+    def burst():
+        t0 = perf_counter()
+        due = int(rate * (t0 - start)) - sent[0]
+        for i in range(due):
+            write(line)
+        sent[0] += due
+        busy[0] += perf_counter() - t0
+        if t0 - start >= duration:
+            timer.stop()
+            app.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(burst)
+    timer.start(1)
+    app.exec_()
+    if isinstance(widget, Console):
+        widget.flush()
+        busy[0] += widget.stats()["flush_time"]
+    return sent[0], busy[0] / duration
+
+old = QPlainTextEdit()
+old.setMaximumBlockCount(500)
+old.show()
+
+
+def insert(msg):
+    old.insertPlainText(msg)
+    old.ensureCursorVisible()
+
+sent, busy = flood(insert, old)
+print(f"insertPlainText: {sent} messages, {1000 * busy:.0f} ms GUI time/s")
+old.close()
+
+new = Console()
+new.setMaximumBlockCount(500)
+new.show()
+sent, busy = flood(new.write, new)
+print(f"Console.write:   {sent} messages, {1000 * busy:.0f} ms GUI time/s")
@@ -0,0 +1,94 @@
+'''
+Last Modified: 2026-10-18
+
+Time to load test definitions by parsing them, against restoring them from
+    DefinitionCache, for generated definitions and creating ACEstatPy:
+    python benchmarks/definition_cache.py [tests ...]
+
+'''
+import json
+import os
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from types import SimpleNamespace as NS
+import acestatpy
+# Local
+import _path  # noqa: F401
+from Utilities.DefinitionCache import DefinitionCache
+
+
+class XMLDefinitions(dict):
+    # Stand-in for ACEstatPy's Definitions, parsing a similar XML layout
+    def importTests(self, path):
+        self.clear()
+        for t in ET.parse(path).getroot():
+            self[t.get("id")] = NS(
+                id=t.get("id"), name=t.get("name"),
+                technique=t.get("technique"), description=t.findtext("description"),
+                parameters={p.get("id"): NS(**p.attrib) for p in t.iter("parameter")},
+                outputs={o.get("id"): NS(type=o.get("type"), fields=[
+                    NS(**f.attrib) for f in o]) for o in t.iter("output")},
+                plots={p.get("id"): NS(**p.attrib) for p in t.iter("plot")},
+                presets={})
+
+    def loadCustomPreset(self, path):
+        with open(path) as f:
+            preset = json.load(f)
+        self[preset["test"]].presets[preset["name"]] = NS(
+            parameters=preset["parameters"])
+
+
+def writeTests(path, count):
+    root = ET.Element("tests")
+    for i in range(count):
+        t = ET.SubElement(root, "test", id=f"t{i}", name=f"Test {i}",
+                          technique=f"Technique {i % 10}")
+        ET.SubElement(t, "description").text = "A test " * 20
+        for j in range(15):
+            ET.SubElement(t, "parameter", id=f"p{j}", name=f"Parameter {j}",
+                          type="int", min="0", max="1000", units="mV")
+        for o in range(3):
+            output = ET.SubElement(t, "output", id=f"o{o}", type="matrix")
+            for f in range(4):
+                ET.SubElement(output, "field", label=f"F{f}", units="A")
+        ET.SubElement(t, "plot", id="main", x_label="t", y_label="i")
+    ET.ElementTree(root).write(path)
+
+directory = tempfile.mkdtemp()
+cache = DefinitionCache(os.path.join(directory, "definitions.cache"))
+preset = os.path.join(directory, "preset.json")
+with open(preset, "w") as f:
+    json.dump({"test": "t0", "name": "Custom",
+               "parameters": {"p0": "10"}}, f)
+print("Definitions loaded, ms (parse / cache), cache size:")
+for count in [int(c) for c in sys.argv[1:]] or (50, 500, 2000):
+    tests = os.path.join(directory, f"tests{count}.xml")
+    writeTests(tests, count)
+    cache.clear()
+    start = time.perf_counter()
+    XMLDefinitions().importTests(tests)
+    parse = time.perf_counter() - start
+    cache.load(XMLDefinitions(), tests, [preset])
+    definitions = XMLDefinitions()
+    start = time.perf_counter()
+    hit = cache.load(definitions, tests, [preset])
+    cached = time.perf_counter() - start
+    assert hit and "Custom" in definitions["t0"].presets
+    print(f"  {count:>5} tests {1000 * parse:8.1f} / {1000 * cached:6.1f}"
+          f"   {os.path.getsize(cache.path) / 2**20:.1f} MB")
+
+# Creating ACEstatPy, which parses its bundled tests, if it is installed
+try:
+    start = time.perf_counter()
+    acestatpy.ACEstatPy()
+    parse = time.perf_counter() - start
+    cache.clear()
+    cache.create(acestatpy.ACEstatPy)
+    start = time.perf_counter()
+    cache.create(acestatpy.ACEstatPy)
+    cached = time.perf_counter() - start
+    print(f"  ACEstatPy() {1000 * parse:12.1f} / {1000 * cached:6.1f}")
+except Exception as e:
+    print(f"  ACEstatPy(): unavailable ({e})")
@@ -0,0 +1,72 @@
+'''
+Last Modified: 2026-10-18
+
+Time to build TestForm for many tests, against building every panel, and
+    to import the same definitions again with one test changed:
+    python benchmarks/form.py [tests] [parameters]
+
+'''
+import sys
+import time
+from copy import deepcopy
+from types import SimpleNamespace as NS
+from PyQt5.QtCore import QEvent
+from PyQt5.QtWidgets import QApplication
+# Local
+import _path  # noqa: F401
+from Widgets.GroupComboBox import GroupComboBox
+from Widgets.TestForm import TestForm, TestPanel
+
+
+app = QApplication(sys.argv)
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+params = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+
+
+def parameter(i):
+    if i % 3 == 2:
+        return NS(name=f"Option {i}", type="select",
+                  options={f"o{j}": f"Option {j}" for j in range(8)})
+    return NS(name=f"Value {i}", type="int", min=0, max=1000, units="mV")
+
+tests = {f"t{i}": NS(
+    id=f"t{i}", name=f"Test {i}", technique=f"Technique {i % 10}",
+    description="", presets={},
+    parameters={f"p{j}": parameter(j) for j in range(params)})
+    for i in range(count)}
+
+start = time.perf_counter()
+panels = [TestPanel(t) for t in tests.values()]
+eager = time.perf_counter() - start
+for p in panels:
+    p.deleteLater()
+
+form = TestForm({})
+form.show()
+start = time.perf_counter()
+form.setTests(tests)
+app.processEvents()
+lazy = time.perf_counter() - start
+print(f"{count} tests, {params} parameters each:")
+print(f"  every panel built: {1000 * eager:8.1f} ms")
+print(f"  form, one panel:   {1000 * lazy:8.1f} ms")
+
+# Importing the same definitions again, with one test changed, once every
+#   panel has been built
+select = form.findChild(GroupComboBox)
+for i in range(select.count()):
+    select.setCurrentIndex(i)
+panels = set(form.findChildren(TestPanel))
+imported = deepcopy(tests)
+imported["t0"].parameters["p0"].max = 2000
+start = time.perf_counter()
+form.setTests(imported)
+app.processEvents()
+elapsed = time.perf_counter() - start
+QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+select = form.findChild(GroupComboBox)
+for i in range(select.count()):
+    select.setCurrentIndex(i)
+kept = len(panels & set(form.findChildren(TestPanel)))
+print(f"  import, 1 changed: {1000 * elapsed:8.1f} ms, "
+      f"{kept} of {len(panels)} panels kept")
@@ -0,0 +1,101 @@
+'''
+Last Modified: 2026-10-18
+
+Frame times of PlotWidget on a large series for each render option, with
+    and without the min/max pyramid, while streaming, and PointIndex lookups:
+    python benchmarks/plot_canvas.py [points]
+
+'''
+import sys
+import time
+import numpy as np
+from PyQt5.QtWidgets import QApplication
+# Local
+import _path  # noqa: F401
+from Widgets.PlotCanvas import PlotWidget, PointIndex
+
+
+app = QApplication(sys.argv)
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+x = np.arange(n, dtype=float)
+y = np.cumsum(np.random.standard_normal(n))
+
+
+def frameTimes(plot, frames=30):
+    # Pan across a window of each width, forcing a synchronous repaint.
+    results = {}
+    vb = plot.plotItem.vb
+    for width in (0.5, 0.1, 0.01):
+        span = n * width
+        times = []
+        for i in range(frames):
+            left = (n - span) * i / max(frames - 1, 1)
+            start = time.perf_counter()
+            vb.setXRange(left, left + span, padding=0)
+            app.processEvents()
+            plot.viewport().repaint()
+            times.append(time.perf_counter() - start)
+        results[width] = 1000 * np.median(times)
+    return results
+
+
+def addCurve(plot, lod, **data):
+    # The pyramid is used by CachedCurves, plotItem.plot is pyqtgraph's
+    #   own downsampling.
+    if lod:
+        item = plot.createCurve(**data)
+        plot.showCurves([item], legend=False)
+        return item
+    return plot.plotItem.plot(**data)
+
+print(f"{n} points, median ms/frame showing 50% / 10% / 1% of the series:")
+for mode, clip, lod in (("off", False, False), ("subsample", True, False),
+                        ("mean", True, False), ("peak", False, False),
+                        ("peak", True, False), ("peak", True, True)):
+    plot = PlotWidget()
+    plot.resize(800, 600)
+    plot.show()
+    plot.setRenderOptions(downsample=mode, clipToView=clip)
+    addCurve(plot, lod, x=x, y=y)
+    app.processEvents()
+    r = frameTimes(plot)
+    print(f"  {mode:>9} clip={clip!s:<5} {'pyramid' if lod else '':<7} "
+          + " / ".join(f"{r[w]:7.1f}" for w in sorted(r, reverse=True)))
+    plot.close()
+
+# Streaming: the series grows in chunks, redrawn after each one.
+chunks = 50
+print(f"Streaming {n} points in {chunks} chunks, median ms/update:")
+for lod in (False, True):
+    plot = PlotWidget()
+    plot.resize(800, 600)
+    plot.show()
+    plot.setRenderOptions(downsample="peak", clipToView=True)
+    curve = addCurve(plot, lod, x=x[:1], y=y[:1])
+    update = curve.appendData if lod else curve.setData
+    times = []
+    for i in range(1, chunks + 1):
+        end = n * i // chunks
+        start = time.perf_counter()
+        update(x=x[:end], y=y[:end])
+        app.processEvents()
+        plot.viewport().repaint()
+        times.append(time.perf_counter() - start)
+    print(f"  {'pyramid' if lod else 'pyqtgraph':>9} "
+          f"{1000 * np.median(times):7.1f}")
+    plot.close()
+
+# Snapping: one lookup per readout update, the index is built once.
+print("Nearest point lookup, ms (index build / lookup):")
+t = np.linspace(0, 8 * np.pi, n)
+for name, px, py in (("sorted x", x, y),
+                     ("unsorted x", np.sin(t) * n, np.cos(t) * n)):
+    start = time.perf_counter()
+    index = PointIndex(px, py)
+    build = time.perf_counter() - start
+    queries = np.random.uniform(-n, n, (1000, 2))
+    start = time.perf_counter()
+    for qx, qy in queries:
+        index.nearest(qx, qy, n / 400, n / 300)
+    lookup = (time.perf_counter() - start) / len(queries)
+    print(f"  {name:>10} {1000 * build:7.1f} / {1000 * lookup:.3f}")
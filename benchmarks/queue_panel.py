@@ -0,0 +1,36 @@
+'''
+Last Modified: 2026-10-18
+
+Time to list and update a long queue in QueuePanel:
+    python benchmarks/queue_panel.py [tests]
+
+'''
+import sys
+import time
+from types import SimpleNamespace
+from PyQt5.QtWidgets import QApplication
+# Local
+import _path  # noqa: F401
+from Widgets.QueuePanel import QueuePanel
+
+
+app = QApplication(sys.argv)
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+info = SimpleNamespace(name="Test", parameters={
+    "a": SimpleNamespace(name="Voltage", units="mV")})
+queue = [SimpleNamespace(info=info, parameters={"a": i}, iterations=1,
+                         run_forever=False, start_delay=0, inner_delay=0,
+                         export=False) for i in range(count)]
+start = time.perf_counter()
+panel = QueuePanel(False, queue)
+panel.resize(250, 600)
+panel.show()
+app.processEvents()
+print(f"{count} tests queued in {1000 * (time.perf_counter() - start):.1f} ms")
+queue[count // 2].iterations = 2
+del queue[0]
+queue.insert(1, queue.pop())
+start = time.perf_counter()
+panel.updateQueue()
+app.processEvents()
+print(f"Queue updated in {1000 * (time.perf_counter() - start):.1f} ms")
@@ -0,0 +1,122 @@
+'''
+Last Modified: 2026-10-18
+
+Memory of ResultDisplay over repeated plot switches, the time to switch plots
+    with and without the CurveCache, and the time to toggle overlaid results:
+    python benchmarks/result_display.py [switches]
+
+'''
+import gc
+import os
+import sys
+import time
+from types import SimpleNamespace as NS
+import numpy as np
+from PyQt5.QtWidgets import QApplication
+# Local
+import _path  # noqa: F401
+from Widgets.ResultDisplay import ResultDisplay
+
+
+def rss():
+    # Resident set size in MB
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 2**20
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        import resource
+        # Peak, not current, but still shows unbounded growth.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+
+
+class Result(NS):
+    # Compared by identity, like a test. Columns keeps weak references.
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+
+def fakeResult(n, curves):
+    fields = [NS(label="x", units="s")] + [
+        NS(label=f"y{i}", units="A") for i in range(curves)]
+    results = {"data": {"x": np.arange(n, dtype=float)}}
+    for i in range(curves):
+        results["data"][f"y{i}"] = np.random.random(n)
+    return Result(results=results, startTime=time.time(), info=NS(
+        name="Test",
+        outputs={"data": NS(type="matrix", fields=fields)},
+        plots={"plot": NS(x_label="x", y_label="y", series=[
+            NS(x=NS(output="data", field="x"),
+               y=NS(output="data", field=f"y{i}")) for i in range(curves)
+        ])}
+    ))
+
+app = QApplication(sys.argv)
+switches = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+display = ResultDisplay()
+display.resize(800, 600)
+display.show()
+tests = [fakeResult(5000, 1), fakeResult(20000, 3), fakeResult(500, 2)]
+
+start = None
+for i in range(switches):
+    test = tests[i % len(tests)]
+    display.plotResult("plot", test)
+    if i % 10 == 0:
+        display.tableResult("data", tests[2])
+    app.processEvents()
+    if i == 50:
+        gc.collect()
+        start = rss()
+    if i % 100 == 0:
+        print(f"{i:5d} switches: {rss():8.1f} MB")
+gc.collect()
+end = rss()
+print(f"RSS after warm-up: {start:.1f} MB, after {switches}: {end:.1f} MB "
+      f"({end - start:+.1f} MB)")
+
+# Drawn with the default render options from here on
+display.setRenderOptions(downsample="peak", clipToView=True)
+runs = [fakeResult(200000, 2) for i in range(5)]
+
+# Switching plots: the first view prepares the data, later views of
+#   recently plotted results reuse it.
+
+
+def switch(cache):
+    times = []
+    for i in range(20):
+        if not cache:
+            display.curves.clear()
+        start = time.perf_counter()
+        display.plotResult("plot", runs[i % len(runs)])
+        times.append(time.perf_counter() - start)
+        app.processEvents()
+    return 1000 * sum(times) / len(times)
+
+cold = switch(False)
+warm = switch(True)
+print(f"Switching plots takes {cold:.2f} ms uncached, {warm:.2f} ms "
+      f"cached, before drawing "
+      f"({display.curves.nbytes / 2**20:.1f} MB cached)")
+
+# Overlay: the first toggle creates the curves, later ones reuse them.
+start = time.perf_counter()
+for test in runs:
+    display.setOverlaid("plot", test, True)
+first = time.perf_counter() - start
+app.processEvents()
+toggle = draw = 0
+for i in range(50):
+    start = time.perf_counter()
+    display.setOverlaid("plot", runs[i % len(runs)], i % 2 == 1)
+    toggle += time.perf_counter() - start
+    app.processEvents()
+    draw += time.perf_counter() - start
+print(f"Overlay of {len(runs)} results created in {1000 * first:.1f} ms, "
+      f"toggling a result takes {1000 * toggle / 50:.2f} ms, "
+      f"{1000 * draw / 50:.1f} ms with drawing")
@@ -0,0 +1,59 @@
+'''
+Last Modified: 2026-10-18
+
+Time to list many results in ResultPanel, and to expand a result with long
+    list outputs:
+    python benchmarks/result_panel.py [results]
+
+'''
+import sys
+import time
+from types import SimpleNamespace
+import numpy as np
+from PyQt5.QtWidgets import QApplication, QLabel
+# Local
+import _path  # noqa: F401
+from Results import Columns
+from Widgets.ResultPanel import ResultItem, ResultPanel
+
+
+app = QApplication(sys.argv)
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+info = SimpleNamespace(name="Test")
+panel = ResultPanel(limit=count)
+panel.resize(300, 600)
+panel.show()
+start = time.perf_counter()
+for i in range(count):
+    panel.append(SimpleNamespace(info=info, startTime=time.time()))
+app.processEvents()
+print(f"{count} results listed in {1000 * (time.perf_counter() - start):.1f} ms")
+
+# Expanding a result with list outputs. The lists are converted to arrays
+#   when the test ends, which is not timed here.
+
+
+class Result(SimpleNamespace):
+    # Compared by identity, like a test. Columns keeps weak references.
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+fields = [SimpleNamespace(label=l, units="A") for l in ("a", "b")]
+info = SimpleNamespace(name="Test", parameters={}, plots={}, outputs={
+    "list": SimpleNamespace(type="list", fields=fields)})
+print("Result expanded, ms (value label / summary):")
+for n in (100, 10000, 1000000):
+    test = Result(info=info, startTime=time.time(), parameters={},
+                  results={"list": {f.label: np.random.random(n).tolist()
+                                    for f in fields}})
+    Columns(test)
+    start = time.perf_counter()
+    labels = [QLabel(f"{test.results['list'][f.label]}A") for f in fields]
+    for lbl in labels:
+        lbl.sizeHint()
+    before = time.perf_counter() - start
+    start = time.perf_counter()
+    item = ResultItem(test)
+    item.sizeHint()
+    after = time.perf_counter() - start
+    print(f"  {n:>8} {1000 * before:9.1f} / {1000 * after:.1f}")
@@ -0,0 +1,27 @@
+'''
+Last Modified: 2026-10-18
+
+Time to show a large table in ResultTable:
+    python benchmarks/result_table.py [rows]
+
+'''
+import sys
+import time
+import numpy as np
+from PyQt5.QtWidgets import QApplication
+# Local
+import _path  # noqa: F401
+from Widgets.ResultTable import ResultTable
+
+
+app = QApplication(sys.argv)
+rows = int(sys.argv[1]) if len(sys.argv) > 1 else 250000
+columns = [np.random.random(rows) for i in range(4)]
+table = ResultTable()
+table.resize(600, 400)
+table.show()
+start = time.perf_counter()
+table.setData([f"Column {i}" for i in range(len(columns))], columns)
+app.processEvents()
+print(f"{rows * len(columns)} cells shown in "
+      f"{1000 * (time.perf_counter() - start):.1f} ms")
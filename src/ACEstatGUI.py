@@ -1,5 +1,5 @@
 '''
-Last Modified: 2021-08-20
+Last Modified: 2026-10-18
 
 @author: Jesse M. Barr
 
@@ -7,6 +7,32 @@ Contains:
     -ACEstatGUI
 
 Changes:
+    -2026-10-18:
+        -Stream partial results into the plot while a test is running.
+        -Reuse a single plot canvas and result table for the result display.
+        -Apply downsampling/clip-to-view preferences to the plot.
+        -Convert results to numpy arrays once, when the test ends.
+        -Buffer console output and insert it once per frame.
+        -Status bar shows received data counters, updated a few times per
+            second at most.
+        -Received messages and results are delivered in batches.
+        -Added Tools->Signal Diagnostics.
+        -Queued tests can be reordered while the queue is paused.
+        -Finished results are archived to disk, the results panel pages
+            through the archive.
+        -Results can be autosaved as .npz, added File->Open Results.
+        -Results are saved and archived on a background thread, pending files
+            are written before closing.
+        -Open Results reads CSV and .npz files in the background, added
+            File->Open Results Folder.
+        -Results can be overlaid on one plot, from the results panel.
+        -Recently plotted results are kept prepared, within a memory budget.
+        -The window is shown before the instrument is initialized. Test
+            definitions are loaded and serial ports listed in the background,
+            then the test forms are built, with progress shown in the status
+            bar. sigStartupStage reports each stage, see Main.
+        -Test definitions, bundled or imported, and presets are cached once
+            parsed, and restored at start while their files are unchanged.
     -2021-08-20:
         -Added table to display matrix results.
     -2021-04-28:
@@ -16,20 +42,26 @@ Changes:
 ToDo:
 
 '''
+import os
 # PyQt
-from PyQt5.QtCore import Qt, QDir, QFile, QTextStream, QTimer
+from PyQt5.QtCore import (Qt, QDir, QFile, QTextStream, QTimer,
+                          pyqtSignal as Signal)
 from PyQt5.QtGui import QIcon
-from PyQt5.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
-                             QSplitter, QTabWidget, QPushButton, QLineEdit,
-                             QGroupBox, QComboBox, QLabel, QPlainTextEdit,
-                             QMessageBox, QStyleFactory, QFileDialog)
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QHBoxLayout,
+                             QVBoxLayout, QSplitter, QTabWidget, QPushButton,
+                             QLineEdit, QGroupBox, QComboBox, QLabel,
+                             QPlainTextEdit, QMessageBox, QStyleFactory,
+                             QFileDialog, QProgressBar)
 # Installed
 from acestatpy import ACEstatPy
 # Local
-from Settings import LoadConfig, SettingsDialog
-from Utilities import SignalTranslator, resource_path
-from Widgets import (FuncComboBox, PlotCanvas, QueuePanel, ResultPanel,
-                     ResultTable, TestForm)
+from Results import FILTERS, Columns, ResultArchive, ResultLoader, ResultWriter
+from Settings import LoadConfig, SettingsDialog, archivePath
+from Utilities import (BackgroundTask, DefinitionCache, SignalTranslator,
+                       data_path, resource_path)
+from Widgets import (Console, DiagnosticsDialog, FuncComboBox, LivePlot,
+                     QueuePanel, ResultDisplay, ResultPanel, StatusLabel,
+                     TestForm)
 
 QDir.addSearchPath('icons', resource_path("icons"))
 QDir.addSearchPath('styles', resource_path("styles"))
@@ -43,14 +75,19 @@ QDir.addSearchPath('light', resource_path("icons", "light"))
 DEFAULT_BAUD = 115200
 CONFIGFILE = 'config.ini'
 CONFIG = LoadConfig(CONFIGFILE)
+DEFINITION_CACHE = data_path('definitions.cache')
 
 
 class ACEstatGUI(QMainWindow):
+    # Start up stages as they finish: "definitions", "forms", "ports", then
+    #   "interactive". "failed" if the instrument could not be initialized.
+    sigStartupStage = Signal(str)
 
     def __init__(self):
         super().__init__()
         self.title = "ACEstatGUI"
-        self.acestat = ACEstatPy()
+        # Created in the background, see initUI
+        self.acestat = None
         xScale = self.logicalDpiX() / 96.0
         yScale = self.logicalDpiY() / 96.0
 
@@ -83,6 +120,13 @@ class ACEstatGUI(QMainWindow):
         msg.exec_()
 
     def closeEvent(self, event):
+        # Finish writing results before exiting
+        if self.writer.pending():
+            self.statusBar().showMessage(
+                "Saving {0} file(s)...".format(self.writer.pending()))
+            QApplication.processEvents()
+        self.loader.close()
+        self.writer.close()
         try:
             with open(CONFIGFILE, 'w') as configfile:
                 CONFIG.write(configfile)
@@ -94,17 +138,6 @@ class ACEstatGUI(QMainWindow):
         #######################
         ### LOCAL FUNCTIONS ###
         #######################
-        def updateCountdown():
-            rem = self.acestat.currentTest.estimateRemaining()
-            if rem is None:
-                testStatus.setText("Running {0}...".format(self.acestat.currentTest.id))
-                return
-            else:
-                testStatus.setText("Running {0}: ~{1}s".format(
-                    self.acestat.currentTest.id, round(rem)))
-            if rem == 0:
-                _timer.stop()
-
         def updatePreference(section, option, value):
             if section == "console":
                 if option == "show_console":
@@ -127,6 +160,83 @@ class ACEstatGUI(QMainWindow):
                     CONFIG.set(section, option, str(value))
                     value = CONFIG.getint(section, option)
                     resultList.setLimit(value)
+                elif option == "archive":
+                    CONFIG.set(section, option, str(value).lower())
+                    openArchive()
+                elif option == "archive_path":
+                    CONFIG.set(section, option, str(value))
+                    openArchive()
+                elif option == "archive_limit":
+                    CONFIG.set(section, option, str(value))
+                    value = CONFIG.getint(section, option)
+                    if resultList.archive() is not None:
+                        resultList.archive().setLimit(value)
+            elif section == "plots":
+                if option == "live_plot":
+                    CONFIG.set(section, option, str(value).lower())
+                    value = CONFIG.getboolean(section, option)
+                    if not value:
+                        livePlot.stop()
+                elif option == "live_rate":
+                    CONFIG.set(section, option, str(value))
+                    value = CONFIG.getint(section, option)
+                    livePlot.setRate(value)
+                elif option == "downsample":
+                    CONFIG.set(section, option, str(value))
+                    self.rDisplay.setRenderOptions(downsample=value)
+                elif option == "clip_to_view":
+                    CONFIG.set(section, option, str(value).lower())
+                    value = CONFIG.getboolean(section, option)
+                    self.rDisplay.setRenderOptions(clipToView=value)
+                elif option == "points_per_pixel":
+                    CONFIG.set(section, option, str(value))
+                    value = CONFIG.getint(section, option)
+                    self.rDisplay.setRenderOptions(pointsPerPixel=value)
+                elif option == "curve_cache":
+                    CONFIG.set(section, option, str(value))
+                    value = CONFIG.getint(section, option)
+                    self.rDisplay.setCacheBudget(value * 2**20)
+            elif section == "tests":
+                if option == "restore":
+                    CONFIG.set(section, option, str(value).lower())
+            elif section == "diagnostics":
+                if option == "signal_timing":
+                    CONFIG.set(section, option, str(value).lower())
+                    value = CONFIG.getboolean(section, option)
+                    SignalTranslator.setInstrumentation(value)
+
+        def openArchive():
+            current = resultList.archive()
+            if not CONFIG.getboolean("results", "archive"):
+                if current is not None:
+                    self.rDisplay.clearOverlay()
+                    resultList.setArchive(None)
+                    current.close()
+                return
+            if self.acestat is None:
+                # Opened once the definitions are loaded
+                return
+            path = archivePath(CONFIG)
+            if current is not None and current.path == path:
+                return
+            try:
+                archive = ResultArchive(
+                    path, self.writer, CONFIG.getint("results", "archive_limit"))
+            except Exception as e:
+                self.messageDialog(
+                    "Unable to open the result archive: {0}.".format(path),
+                    "Archive Error",
+                    QMessageBox.Warning,
+                    "{0}".format(e))
+                return
+            # Overlay keys are only meaningful within an archive
+            self.rDisplay.clearOverlay()
+            resultList.setArchive(archive, self.acestat.Definitions)
+            if current is not None:
+                current.close()
+
+        def importedPresets():
+            return [p for p in CONFIG.get("tests", "presets").split(os.pathsep) if p]
 
         def handleFileAction(action):
             if action == mLoadTests:
@@ -134,8 +244,11 @@ class ACEstatGUI(QMainWindow):
                     self, "Import Test Definitions", filter="XML (*.xml)")
                 if fpath[0]:
                     try:
-                        self.acestat.Definitions.importTests(fpath[0])
-                        testForm.initUI()
+                        definitionCache.load(self.acestat.Definitions, fpath[0])
+                        CONFIG.set("tests", "definitions", fpath[0])
+                        CONFIG.set("tests", "presets", "")
+                        # Only rebuilds forms of tests that changed
+                        testForm.setTests(self.acestat.Definitions)
                         self.acestat.clearQueue()
                         testQueue.updateQueue()
                         resultList.clear()
@@ -149,6 +262,20 @@ class ACEstatGUI(QMainWindow):
                     self, "Export Default Test Definitions", filter="XML (*.xml)")
                 if fpath[0]:
                     self.acestat.Definitions.copyDefaultTests(fpath[0])
+            elif action == mOpenResults:
+                fpaths = QFileDialog.getOpenFileNames(
+                    self, "Open Results", filter="Results (*.npz *.csv);;{0}".format(
+                        ";;".join(FILTERS.values())))
+                if fpaths[0]:
+                    self.loader.open(fpaths[0], self.acestat.Definitions)
+            elif action == mOpenFolder:
+                path = QFileDialog.getExistingDirectory(
+                    self, "Open Results Folder")
+                if path:
+                    self.loader.open(
+                        [os.path.join(path, f) for f in sorted(os.listdir(path))
+                         if os.path.splitext(f)[1].lower() in (".npz", ".csv")],
+                        self.acestat.Definitions)
             elif action == mPreferences:
                 dlg = SettingsDialog(self, config=CONFIG)
                 if dlg.exec_():
@@ -170,21 +297,37 @@ class ACEstatGUI(QMainWindow):
             elif action == mLoadPreset:
                 fpaths = QFileDialog.getOpenFileNames(
                     self, "Import Custom Presets", filter="JSON (*.json)")
+                presets = importedPresets()
                 for p in fpaths[0]:
                     try:
                         self.acestat.Definitions.loadCustomPreset(p)
+                        presets.append(p)
                     except Exception as e:
                         self.messageDialog(
                             "Error encountered when importing: {0}.".format(p),
                             "Import Error",
                             QMessageBox.Warning,
                             "{0}".format(e))
+                if fpaths[0]:
+                    CONFIG.set("tests", "presets", os.pathsep.join(presets))
+                    definitionCache.save(
+                        self.acestat.Definitions,
+                        CONFIG.get("tests", "definitions") or None, presets)
+            elif action == mDiagnostics:
+                dlg = DiagnosticsDialog(self)
+                dlg.exec_()
+                updatePreference("diagnostics", "signal_timing",
+                                 dlg.timingEnabled)
 
         def handleViewAction(action):
             if action == mToggleConsole:
                 updatePreference("console", "show_console", action.isChecked())
 
         def validateConnection():
+            if self.acestat is None:
+                btnConnect.setEnabled(False)
+                return
+            serialComms = self.acestat.Serial
             if portCB.currentText() and baudCB.currentText() \
                 and (not serialComms.isOpen() or portCB.currentText() != serialComms.port
                      or baudCB.currentText() != str(serialComms.baud)):
@@ -203,61 +346,87 @@ class ACEstatGUI(QMainWindow):
                     QMessageBox.Warning,
                     "{0}".format(e))
 
-        def addToQueue(*args, **kwargs):
-            self.acestat.addToQueue(*args, **kwargs)
-            testQueue.updateQueue()
+        # Autosave options for formats ACEstatPy doesn't write, by autosaveKey
+        autosaves = {}
+
+        def autosaveKey(id, params):
+            # The test as submitted, which the finished test reports back.
+            #   ACEstatPy doesn't say which queue entry a test came from.
+            return (id, tuple(sorted(
+                (str(k), str(v)) for k, v in dict(params or {}).items())))
+
+        def addToQueue(id, params, export_format="csv", **kwargs):
+            key = autosaveKey(id, params)
+            if export_format == "csv" or not kwargs.get("export"):
+                autosaves.pop(key, None)
+            else:
+                # ACEstatPy only writes CSV, other formats are saved here when
+                #   the test ends. Recorded first, the test may start at once.
+                autosaves[key] = (kwargs["export"], export_format)
+                kwargs["export"] = False
+            self.acestat.addToQueue(id, params, **kwargs)
+            testQueue.appendTest()
 
         def handlePause():
             self.acestat.togglePause()
             testQueue.setPause(self.acestat.paused)
+            updateMovable()
+
+        def queuedRow(test):
+            # Row of a queue entry, by identity, None if it left the queue
+            for i, t in enumerate(self.acestat.queue):
+                if t is test:
+                    return i
+            return None
+
+        def handleCancel(test):
+            idx = queuedRow(test)
+            if idx is not None:
+                self.acestat.removeFromQueue(idx, force=True)
+            testQueue.updateQueue()
 
-        def handleCancel(idx):
-            self.acestat.removeFromQueue(idx, force=True)
+        def updateMovable():
+            # See handleMove
+            testQueue.setMovable(self.acestat.paused and not self.acestat.running)
+
+        def handleMove(test, dst):
+            # ACEstatPy takes tests off the queue on its own thread and has
+            #   no lock or call to reorder it. Tests are only moved while the
+            #   queue is paused and no test is running, when ACEstatPy leaves
+            #   the queue alone.
+            if not self.acestat.paused or self.acestat.running:
+                updateMovable()
+                return
+            queue = self.acestat.queue
+            src = queuedRow(test)
+            if src is not None:
+                queue.insert(max(0, min(dst, len(queue) - 1)), queue.pop(src))
             testQueue.updateQueue()
 
-        def plotResult(id, test):
-            pltLayout.removeWidget(self.rDisplay)
-            self.rDisplay.close()
-            self.rDisplay = PlotCanvas(self)
-            pltLayout.addWidget(self.rDisplay)
-            pltLayout.update()
-            # self.rDisplay.clear()
-            labels = {}
-            axes = {}
-            info = test.info.plots[id]
-
-            title = info.title
-            self.rDisplay.setLabel("x", label=info.x_label)
-            self.rDisplay.setLabel("y", label=info.y_label)
-
-            for s in info.series:
-                self.rDisplay.plot({
-                    "x": test.results[s.x.output][s.x.field],
-                    "y": test.results[s.y.output][s.y.field],
-                })
-            self.rDisplay.setEnabled(True)
+        def plotResult(id, test, key=None):
+            livePlot.detach()
+            self.rDisplay.plotResult(id, test, key)
+
+        def overlayResult(id, test, key, shown):
+            livePlot.detach()
+            self.rDisplay.setOverlaid(id, test, shown, key)
 
         def showTable(id, test):
-            # print(id)
-            pltLayout.removeWidget(self.rDisplay)
-            self.rDisplay.close()
-
-            info = test.info.outputs[id]
-            # print([f.label for f in info.fields])
-
-            self.rDisplay = ResultTable([
-                f"{f.label}{f' ({f.units})' if hasattr(f, 'units') else ''}"
-                for f in info.fields], list(zip(*[
-                    test.results[id][f.label] for f in info.fields
-                ])), self)
-            pltLayout.addWidget(self.rDisplay)
-            pltLayout.update()
-            self.rDisplay.setEnabled(True)
+            livePlot.detach()
+            self.rDisplay.tableResult(id, test)
+
+        def streamResult(test):
+            # Plot the first plot of the technique while data is received.
+            plots = getattr(test.info, "plots", None)
+            if not CONFIG.getboolean("plots", "live_plot") or not plots:
+                return
+            self.rDisplay.clearOverlay()
+            livePlot.start(self.rDisplay.showCanvas(), test, next(iter(plots)))
 
         def handleSend():
             if inputLE.text():
                 try:
-                    serialComms.send(inputLE.text())
+                    self.acestat.Serial.send(inputLE.text())
                     inputLE.clear()
                 except Exception as e:
                     self.messageDialog(
@@ -280,43 +449,66 @@ class ACEstatGUI(QMainWindow):
                 QMessageBox.Warning,
                 "{0}".format(err))
 
-        def onResult(id):
-            # On result signal
-            print(id)
+        def onResult(batch):
+            # On result signal, batched
+            livePlot.update()
 
         def onReady(ready):
             # On ready signal
             if ready:
-                _timer.stop()
+                testStatus.stopTest()
                 testStatus.setText("Ready")
-            testQueue.updateQueue()
+                if not self.acestat.queue:
+                    autosaves.clear()
+            testQueue.updateFront()
+            updateMovable()
 
         def onStart(test, *args, **kwargs):
             # On test start signal
-            updateCountdown()
-            _timer.start(1000)
+            testStatus.startTest(test)
+            streamResult(test)
+            updateMovable()
 
         def onEnd(test, *args, **kwargs):
             # On test end signal
-            _timer.stop()
-            resultList.append(test)
+            testStatus.stopTest()
+            livePlot.stop()
+            # Convert the results to arrays, which all displays share.
+            Columns(test)
+            try:
+                resultList.append(test)
+            except Exception as e:
+                self.messageDialog(
+                    "Unable to archive the result.",
+                    "Archive Error",
+                    QMessageBox.Warning,
+                    "{0}".format(e))
+            autosave = autosaves.get(autosaveKey(test.id, test.parameters))
+            if autosave:
+                directory, ext = autosave
+                filepath = os.path.join(directory, "{0}.{1}".format(
+                    os.path.splitext(test.generateFilename())[0], ext))
+                self.writer.save(test, filepath)
 
         def sendingData(msg):
             # On serial sending signal
             if right_bottom.isVisible():
-                consoleTE.ensureCursorVisible()
-                consoleTE.insertPlainText("{0}\n".format(msg))
+                consoleTE.write("{0}\n".format(msg))
 
-        def receiveData(msg):
-            # On serial received signal
+        def receiveData(batch):
+            # On serial received signal, batched
+            msgs = [args[0] for args, kwargs in batch]
             if right_bottom.isVisible():
-                consoleTE.insertPlainText(msg)
-                consoleTE.ensureCursorVisible()
-            if self.acestat.running:
-                testStatus.setText("Receiving data...")
+                consoleTE.write("".join(msgs))
+            # Delivered before the test's end, see SignalTranslator.flush
+            if testStatus.test is not None:
+                for msg in msgs:
+                    testStatus.received(msg)
+                livePlot.update()
 
         def onConnected():
             # On serial connected signal
+            serialComms = self.acestat.Serial
             testStatus.setText("Waiting for board response...")
             btnConnect.setEnabled(False)
             connectionStatus.setText(
@@ -327,7 +519,8 @@ class ACEstatGUI(QMainWindow):
 
         def onDisconnect(err=None):
             # On serial disconnected signal
-            _timer.stop()
+            testStatus.stopTest()
+            livePlot.stop()
             # inputBtn.setEnabled(False)
             # inputLE.setEnabled(False)
             disconnectBtn.setEnabled(False)
@@ -346,15 +539,19 @@ class ACEstatGUI(QMainWindow):
         #################
         ### INTERFACE ###
         #################
-        _timer = QTimer(self)
-        _timer.timeout.connect(updateCountdown)
-
+        livePlot = LivePlot(CONFIG.getint("plots", "live_rate"), self)
+        # Results are saved and opened in the background
+        self.writer = ResultWriter(self)
+        self.loader = ResultLoader(parent=self)
         menuBar = self.menuBar()
 
         fileMenu = menuBar.addMenu("&File")
         mLoadTests = fileMenu.addAction("Import Tests")
         mExportTests = fileMenu.addAction("Export Default Tests")
         fileMenu.addSeparator()
+        mOpenResults = fileMenu.addAction("Open Results")
+        mOpenFolder = fileMenu.addAction("Open Results Folder")
+        fileMenu.addSeparator()
         mPreferences = fileMenu.addAction("Preferences")
         fileMenu.addSeparator()
         mQuit = fileMenu.addAction("Quit")
@@ -364,6 +561,8 @@ class ACEstatGUI(QMainWindow):
         mReset = toolMenu.addAction("Send Reset")
         mLoadPreset = toolMenu.addAction("Import Presets")
         mSavePreset = toolMenu.addAction("Save Preset")
+        toolMenu.addSeparator()
+        mDiagnostics = toolMenu.addAction("Signal Diagnostics")
         toolMenu.triggered.connect(handleToolAction)
 
         viewMenu = menuBar.addMenu("&View")
@@ -371,7 +570,11 @@ class ACEstatGUI(QMainWindow):
         mToggleConsole.setCheckable(True)
         viewMenu.triggered.connect(handleViewAction)
 
-        serialComms = self.acestat.Serial
+        # Need the definitions, enabled once they are loaded
+        startupActions = [mLoadTests, mExportTests, mOpenResults, mOpenFolder,
+                          mReset, mLoadPreset, mSavePreset]
+        for a in startupActions:
+            a.setEnabled(False)
 
         vLayout = QVBoxLayout()
 
@@ -379,14 +582,13 @@ class ACEstatGUI(QMainWindow):
         connLayout = QHBoxLayout()
         connLayout.addWidget(QLabel("Port:"))
 
-        portCB = FuncComboBox(self.acestat.Serial.PORTS)
+        # Ports are listed in the background, see onInstrument
+        portCB = FuncComboBox([])
         portCB.currentIndexChanged.connect(validateConnection)
         connLayout.addWidget(portCB)
 
         connLayout.addWidget(QLabel("Baud:"))
         baudCB = QComboBox()
-        baudCB.addItems([str(b) for b in self.acestat.Serial.BAUDRATES()])
-        baudCB.setCurrentText(str(DEFAULT_BAUD))
         baudCB.setSizeAdjustPolicy(QComboBox.AdjustToContentsOnFirstShow)
         baudCB.currentIndexChanged.connect(validateConnection)
         connLayout.addWidget(baudCB)
@@ -397,7 +599,7 @@ class ACEstatGUI(QMainWindow):
 
         disconnectBtn = QPushButton("Disconnect")
         connLayout.addWidget(disconnectBtn)
-        disconnectBtn.clicked.connect(self.acestat.disconnect)
+        disconnectBtn.clicked.connect(lambda: self.acestat.disconnect())
         disconnectBtn.setEnabled(False)
 
         connLayout.addStretch(1)
@@ -412,15 +614,20 @@ class ACEstatGUI(QMainWindow):
         leftPane = QTabWidget()
 
         ''' Start Test tab '''
-        testForm = TestForm(self.acestat.Definitions)
+        # Filled in once the definitions are loaded, see buildForms
+        testForm = TestForm({})
+        testForm.setEnabled(False)
         SignalTranslator(testForm.sigSubmit, addToQueue)
         leftPane.addTab(testForm, "Test")
         ''' End Test tab '''
 
         ''' Start Queue tab '''
-        testQueue = QueuePanel(self.acestat.paused, self.acestat.queue)
+        # Lists the queue once the instrument is initialized, see onInstrument
+        testQueue = QueuePanel(False, [])
+        testQueue.setEnabled(False)
         testQueue.onPause(handlePause)
         testQueue.onCancelItem(handleCancel)
+        testQueue.onMoveItem(handleMove)
         leftPane.addTab(testQueue, "Queue")
         ''' End Queue tab '''
 
@@ -438,13 +645,13 @@ class ACEstatGUI(QMainWindow):
 
         pltLayout = QVBoxLayout()
         pltLayout.setContentsMargins(0, 0, 0, 0)
-        # self.rDisplay = PlotCanvas(self)
-        self.rDisplay = QLabel("No results to display")
-        self.rDisplay.setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
+        # Holds a single plot canvas and result table, which are reused.
+        self.rDisplay = ResultDisplay(self)
+        self.rDisplay.sigOverlayChanged.connect(
+            lambda: resultList.setOverlaid(self.rDisplay.overlaid()))
         pltLayout.addWidget(self.rDisplay)
         # self.rDisplay.plot([random.uniform(-1, 1) for i in range(10)])
         middlePane.setLayout(pltLayout)
-        self.rDisplay.setEnabled(False)
 
         hPanes.addWidget(middlePane)
         hPanes.setStretchFactor(1, 1)
@@ -461,6 +668,8 @@ class ACEstatGUI(QMainWindow):
         resultList = ResultPanel()
         resultList.sigPlot.connect(plotResult)
         resultList.sigTable.connect(showTable)
+        resultList.sigOverlay.connect(overlayResult)
+        resultList.sigSave.connect(self.writer.save)
         rtLayout.addWidget(resultList)
         right_top.setLayout(rtLayout)
         rightPane.addWidget(right_top)
@@ -471,8 +680,8 @@ class ACEstatGUI(QMainWindow):
         rbLayout = QVBoxLayout()
         rbLayout.setContentsMargins(0, 0, 0, 0)
 
-        consoleTE = QPlainTextEdit()
-        consoleTE.setReadOnly(True)
+        # Buffers received text and inserts it once per frame
+        consoleTE = Console()
         rbLayout.addWidget(consoleTE)
 
         rbInputLayout = QHBoxLayout()
@@ -506,25 +715,62 @@ class ACEstatGUI(QMainWindow):
 
         vLayout.addWidget(hPanes)
 
-        ######################
-        ### ACEstatPy Signals ###
-        ######################
-        SignalTranslator(self.acestat.sigReady, onReady)
-        SignalTranslator(self.acestat.sigTestStart, onStart)
-        SignalTranslator(self.acestat.sigTestEnd, onEnd)
-        SignalTranslator(self.acestat.sigError, onError)
-        # SignalTranslator(self.acestat.sigResult, onResult)
-        SignalTranslator(serialComms.sigSendMessage, sendingData)
-        SignalTranslator(serialComms.sigMessageReceived, receiveData)
-        SignalTranslator(serialComms.sigConnected, onConnected)
-        SignalTranslator(serialComms.sigDisconnected, onDisconnect)
-
         validateConnection()
         connectionStatus = QLabel("Disconnected")
         self.statusBar().addPermanentWidget(connectionStatus, 1)
-        testStatus = QLabel("")
+        # Tracks the running test, repainted a few times per second at most
+        testStatus = StatusLabel("")
         self.statusBar().addPermanentWidget(testStatus, 3)
 
+        fileStatus = QLabel("")
+        self.statusBar().addPermanentWidget(fileStatus)
+        startupProgress = QProgressBar()
+        startupProgress.setRange(0, 3)
+        startupProgress.setMaximumWidth(int(200 * self.logicalDpiX() / 96.0))
+        self.statusBar().addPermanentWidget(startupProgress)
+        # Files that could not be opened, reported when opening finishes
+        openErrors = []
+
+        def onSaveProgress(pending):
+            if pending:
+                fileStatus.setText("Saving {0} file(s)...".format(pending))
+                fileStatus.setToolTip("")
+            elif not fileStatus.toolTip():
+                fileStatus.setText("")
+
+        def onSaveError(path, err):
+            fileStatus.setText("Unable to save {0}".format(os.path.basename(path)))
+            fileStatus.setToolTip("{0}: {1}".format(path, err))
+
+        def onOpenProgress(done, total):
+            if done < total:
+                fileStatus.setText("Opening {0}/{1}...".format(done, total))
+                return
+            if openErrors:
+                fileStatus.setText("Unable to open {0} of {1} file(s)".format(
+                    len(openErrors), total))
+                fileStatus.setToolTip("\n".join(openErrors))
+            else:
+                fileStatus.setText("Opened {0} file(s)".format(total))
+                fileStatus.setToolTip("")
+            openErrors.clear()
+
+        def onOpenError(path, err):
+            openErrors.append("{0}: {1}".format(path, err))
+
+        def onOpened(test, path):
+            try:
+                # Already on disk, listed without archiving it again
+                resultList.append(test, store=False)
+            except Exception as e:
+                onOpenError(path, e)
+
+        self.writer.sigProgress.connect(onSaveProgress)
+        self.writer.sigError.connect(onSaveError)
+        self.loader.sigProgress.connect(onOpenProgress)
+        self.loader.sigError.connect(onOpenError)
+        self.loader.sigLoaded.connect(onOpened)
+
         for s in CONFIG.sections():
             for o in CONFIG.items(s):
                 updatePreference(s, *o)
@@ -532,3 +778,117 @@ class ACEstatGUI(QMainWindow):
         ui = QWidget()
         ui.setLayout(vLayout)
         self.setCentralWidget(ui)
+
+        ###############
+        ### STARTUP ###
+        ###############
+        # The window is shown first. ACEstatPy loads the test definitions, and
+        #   serial ports are listed, on worker threads, the test forms are
+        #   built on the GUI thread once the window has been painted.
+        startup = {"pending": ["forms", "ports"]}
+        startupText = {
+            "definitions": "Loading test definitions...",
+            "forms": "Building test forms...",
+            "ports": "Listing serial ports...",
+        }
+
+        def startupStage(stage):
+            # Called as each stage finishes
+            startupProgress.setValue(startupProgress.value() + 1)
+            self.sigStartupStage.emit(stage)
+            if stage in startup["pending"]:
+                startup["pending"].remove(stage)
+            if startup["pending"]:
+                startupProgress.setFormat(startupText[startup["pending"][0]])
+                return
+            self.statusBar().removeWidget(startupProgress)
+            startupProgress.deleteLater()
+            self.sigStartupStage.emit("interactive")
+
+        def loadInstrument(tests, presets):
+            # Worker thread, restores the bundled definitions, and the
+            #   imported ones if configured, from the cache while unchanged
+            return definitionCache.create(ACEstatPy, tests, presets)
+
+        def onInstrument(result):
+            acestat, restoreError = result
+            self.acestat = acestat
+            serialComms = acestat.Serial
+            baudCB.addItems([str(b) for b in serialComms.BAUDRATES()])
+            baudCB.setCurrentText(str(DEFAULT_BAUD))
+            testQueue.setQueue(acestat.queue)
+            testQueue.setPause(acestat.paused)
+            testQueue.setEnabled(True)
+            updateMovable()
+
+            #########################
+            ### ACEstatPy Signals ###
+            #########################
+            SignalTranslator(acestat.sigReady, onReady)
+            SignalTranslator(acestat.sigTestStart, onStart)
+            SignalTranslator(acestat.sigTestEnd, onEnd)
+            SignalTranslator(acestat.sigError, onError)
+            # High frequency signals are delivered to the GUI in batches
+            SignalTranslator(acestat.sigResult, onResult, batch=True)
+            SignalTranslator(serialComms.sigSendMessage, sendingData)
+            SignalTranslator(serialComms.sigMessageReceived, receiveData, batch=True)
+            SignalTranslator(serialComms.sigConnected, onConnected)
+            SignalTranslator(serialComms.sigDisconnected, onDisconnect)
+
+            openArchive()
+            for a in startupActions:
+                a.setEnabled(True)
+            startupStage("definitions")
+
+            ports = BackgroundTask(listPorts, serialComms.PORTS, parent=self)
+            ports.sigDone.connect(onPorts)
+            ports.sigError.connect(lambda e: onPorts([]))
+            ports.start()
+            # After the definitions stage has been painted
+            QTimer.singleShot(0, buildForms)
+            if restoreError is not None:
+                failed = CONFIG.get("tests", "definitions")
+                CONFIG.set("tests", "definitions", "")
+                CONFIG.set("tests", "presets", "")
+                self.messageDialog(
+                    "Unable to restore imported tests: {0}.".format(
+                        failed or "presets"),
+                    "Import Error",
+                    QMessageBox.Warning,
+                    "{0}".format(restoreError))
+
+        def onInstrumentError(err):
+            startupProgress.setFormat("Unable to initialize")
+            self.sigStartupStage.emit("failed")
+            self.messageDialog(
+                "Unable to initialize ACEstatPy.",
+                "Startup Error",
+                QMessageBox.Critical,
+                "{0}".format(err))
+
+        def listPorts(ports):
+            # Worker thread, ports may be a list or a function
+            return ports() if callable(ports) else list(ports)
+
+        def onPorts(ports):
+            portCB.setItems(self.acestat.Serial.PORTS, refresh=False)
+            portCB.updateList(ports)
+            validateConnection()
+            startupStage("ports")
+
+        def buildForms():
+            testForm.setTests(self.acestat.Definitions)
+            testForm.setEnabled(True)
+            startupStage("forms")
+
+        startupProgress.setFormat(startupText["definitions"])
+        definitionCache = DefinitionCache(DEFINITION_CACHE)
+        restore = CONFIG.getboolean("tests", "restore")
+        instrument = BackgroundTask(
+            loadInstrument,
+            (CONFIG.get("tests", "definitions") if restore else "") or None,
+            importedPresets() if restore else [],
+            parent=self)
+        instrument.sigDone.connect(onInstrument)
+        instrument.sigError.connect(onInstrumentError)
+        instrument.start()
@@ -1,11 +1,16 @@
 '''
-Last Modified: 2020-04-10
+Last Modified: 2026-10-18
 
 @author: Jesse M. Barr
 
 Contains:
     -ExportDialog
 
+Changes:
+    -2026-10-18:
+        -Exporters are listed from the Registry and created when first shown,
+            so their modules are not imported until then.
+
 Description:
 
 ToDo:
@@ -19,11 +24,10 @@ from PyQt5.QtWidgets import (QVBoxLayout, QFileDialog, QStackedLayout,
 # PyQtGraph
 from pyqtgraph import PlotWidget
 # Local
-from . import Exporter, ImageExporter, MPLExporter
+from .Registry import EXPORTERS, exporterClass
 
 
 class ExportDialog(QMainWindow):
-    ExporterClasses = [ImageExporter, MPLExporter]
 
     def __init__(self, plot, *args, **kwargs):
         if not isinstance(plot, PlotWidget):
@@ -32,6 +36,7 @@ class ExportDialog(QMainWindow):
         # self.setStyleSheet(qdarkstyle.load_stylesheet(qt_api='pyqt5'))
 
         self.plot = plot
+        # Name: index in exporterWidgets, of the exporters created so far
         self.exporters = {}
 
         self.setWindowFlags(Qt.Dialog)
@@ -47,9 +52,8 @@ class ExportDialog(QMainWindow):
 
         self.exporterWidgets = QStackedLayout()
 
-        for e in self.ExporterClasses:
-            self.selection.addItem(e.Name)
-            self.exporters[e.Name] = self.exporterWidgets.addWidget(e(self.plot, self))
+        for name in EXPORTERS:
+            self.selection.addItem(name)
 
         self.selection.currentTextChanged.connect(self.showTool)
 
@@ -64,8 +68,15 @@ class ExportDialog(QMainWindow):
             return self.showTool(exp)
         self.selection.setCurrentText(exp)
 
+    def exporter(self, exp):
+        # The exporter widget, created on first use
+        if exp not in self.exporters:
+            self.exporters[exp] = self.exporterWidgets.addWidget(
+                exporterClass(exp)(self.plot, self))
+        return self.exporterWidgets.widget(self.exporters[exp])
+
     def showTool(self, exp):
-        self.exporterWidgets.setCurrentIndex(self.exporters[exp])
+        self.exporterWidgets.setCurrentWidget(self.exporter(exp))
         self.show()
         self.setWindowState(self.windowState() & ~Qt.WindowMinimized)
         self.raise_()
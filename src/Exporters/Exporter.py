@@ -1,11 +1,16 @@
 '''
-Last Modified: 2020-04-10
+Last Modified: 2026-10-18
 
 @author: Jesse M. Barr
 
 Contains:
     -Exporter
 
+Changes:
+    -2026-10-18:
+        -The first item is selected when created, exporters are created when
+            first shown, after the plot.
+
 Description:
 
 ToDo:
@@ -57,6 +62,7 @@ class Exporter(QWidget):
         vLayout.addWidget(self.itemTree)
 
         self.updateItemList()
+        self.itemTree.setCurrentItem(self.itemTree.topLevelItem(0))
 
         btnLayout = QHBoxLayout()
         if self.allowCopy:
@@ -1,11 +1,18 @@
 '''
-Last Modified: 2020-04-10
+Last Modified: 2026-10-18
 
 @author: Jesse M. Barr
 
 Contains:
+    -imageFormats
     -ImageExporter
 
+Changes:
+    -2026-10-18:
+        -Image formats are listed when first saving, not on import.
+        -The export item and default size are set when created, exporters are
+            created when first shown.
+
 Description:
 
 ToDo:
@@ -20,18 +27,25 @@ from pyqtgraph.exporters import ImageExporter as pyqtgraphImageExporter
 # Local
 from .Exporter import Exporter
 
-IMGFormats = ["*."+f.data().decode('utf-8') for f in QImageWriter.supportedImageFormats()]
-preferred = ['*.png', '*.jpg']
-for p in preferred[::-1]:
-    if p in IMGFormats:
-        IMGFormats.remove(p)
-        IMGFormats.insert(0, p)
+IMGFormats = None
+
+
+def imageFormats():
+    # File filters of the formats Qt can write, PNG and JPG first
+    global IMGFormats
+    if IMGFormats is None:
+        IMGFormats = ["*."+f.data().decode('utf-8') for f in QImageWriter.supportedImageFormats()]
+        preferred = ['*.png', '*.jpg']
+        for p in preferred[::-1]:
+            if p in IMGFormats:
+                IMGFormats.remove(p)
+                IMGFormats.insert(0, p)
+    return IMGFormats
 
 
 class ImageExporter(Exporter):
     Name = "Image File (PNG, TIF, JPG, ...)"
     allowCopy = True
-    Formats = IMGFormats
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -52,6 +66,8 @@ class ImageExporter(Exporter):
         # Need to maintain aspect ratio for width/height
 
         self.initUI()
+        self.exportItemChanged(self.itemTree.currentItem())
+        self.updateDefaultSize()
 
     def updateDefaultSize(self):
         sr = self.getTargetRect()
@@ -94,7 +110,7 @@ class ImageExporter(Exporter):
 
     def export(self, filename=None, toBytes=False, copy=False):
         if not toBytes and not copy and filename is None:
-            fname = self.fileSaveDialog(filter=self.Formats)
+            fname = self.fileSaveDialog(filter=imageFormats())
             if fname is not None:
                 self.export(fname)
             return
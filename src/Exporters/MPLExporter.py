@@ -1,5 +1,5 @@
 '''
-Last Modified: 2020-04-10
+Last Modified: 2026-10-18
 
 @author: Jesse M. Barr
 
@@ -7,6 +7,15 @@ Contains:
     -MatplotWindow
     -MPLExporter
 
+Changes:
+    -2026-10-18:
+        -Skip curves without data.
+        -Only rebuild the figure when the window is visible.
+        -Plot the full resolution data, rather than the displayed data, which
+            may be downsampled or clipped to the view.
+        -The export item is set when created, exporters are created when
+            first shown.
+
 Description:
 
 ToDo:
@@ -56,8 +65,12 @@ class MatplotWindow(QMainWindow):
         if not isinstance(value, PlotItem):
             raise Exception("Item must be PlotItem")
         self._item = value
-        # Whenever self.item is set, update the plot
-        self.updatePlot()
+        # Whenever self.item is set, update the plot. The plot item changes
+        #   with every plot, so do not rebuild the figure until it is shown.
+        if self.isVisible() and not self.isMinimized():
+            self.updatePlot()
+        else:
+            self.bgUpdate = True
 
     def updatePlot(self):
         self.clear()
@@ -76,7 +89,11 @@ class MatplotWindow(QMainWindow):
 
         # Let matplotlib handle plot colors
         for i in item.curves:
-            x, y = i.getData()
+            # xData/yData are the arrays given to setData, no copy is made.
+            x, y = i.xData, i.yData
+            if x is None or y is None:
+                # Curves can be empty, e.g. before live data arrives
+                continue
             axes.plot(x, y)
 
         if self.isVisible() and not self.isMinimized():
@@ -92,8 +109,9 @@ class MatplotWindow(QMainWindow):
 
     def showEvent(self, event):
         if self.bgUpdate:
-            self.canvas.draw()
             self.bgUpdate = False
+            self.updatePlot()
+            self.canvas.draw()
         super().showEvent(event)
 
 
@@ -105,6 +123,7 @@ class MPLExporter(Exporter):
         super().__init__(plot)
         self.exporter = MatplotWindow()
         self.initUI()
+        self.exportItemChanged(self.itemTree.currentItem())
 
     def initUI(self):
         vLayout = self.layout()
@@ -0,0 +1,33 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -EXPORTERS
+    -exporterClass
+
+Exporters by menu name, imported on first use.
+
+The exporter modules import matplotlib and pyqtgraph's parameter tree and
+    exporters, which take longer to import than the rest of the GUI. Menus are
+    built from the names, and an exporter's module is only imported when it
+    is first shown. Modules are imported by name, so they are listed as hidden
+    imports in ACEstatGUI.spec.
+
+ToDo:
+
+'''
+from collections import OrderedDict
+from importlib import import_module
+
+
+# Name: (module, class)
+EXPORTERS = OrderedDict([
+    ("Image File (PNG, TIF, JPG, ...)", ("ImageExporter", "ImageExporter")),
+    ("Matplotlib Window", ("MPLExporter", "MPLExporter")),
+])
+
+
+def exporterClass(name):
+    # Imports the exporter registered as name
+    module, cls = EXPORTERS[name]
+    return getattr(import_module(".{0}".format(module), __package__), cls)
@@ -1,6 +1,17 @@
 from .Exporter import Exporter
-from .MPLExporter import MPLExporter
-from .ImageExporter import ImageExporter
+from .Registry import EXPORTERS, exporterClass
 # from .SVGExporter import SVGExporter
 # from .CSVExporter import CSVExporter
 from .ExportDialog import ExportDialog
+
+
+def __getattr__(name):
+    # Exporter classes are imported on first use, see Registry. Importing
+    #   the module binds it to its name here, which is also the class's
+    #   name, so the class replaces it.
+    for e, (module, cls) in EXPORTERS.items():
+        if cls == name:
+            globals()[name] = exporterClass(e)
+            return globals()[name]
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(
+        __name__, name))
@@ -1,13 +1,34 @@
 '''
-Last Modified: 2020-06-30
+Last Modified: 2026-10-18
 
 @author: Jesse M. Barr
 
+Contains:
+    -processAge
+    -StartupReport
+
+Changes:
+    -2026-10-18:
+        -Added --startup-report[=path], which times start up to the first
+            paint of the main window and until it is interactive, reports it
+            and exits. See StartupReport.
+
 Runs ACEstatGUI application.
 
+Start up can be timed from source or from the build made with ACEstatGUI.spec:
+    python Main.py --startup-report
+    ACEstatGUI.exe --startup-report=startup.txt
+The build has no console, so give it a path. The exit status is 1 if a module
+    that is only needed to export plots was imported before the first paint.
+    For a breakdown by module, from source:
+    python -X importtime Main.py --startup-report
+
 '''
+import time
+START = time.perf_counter()
 import sys
-from PyQt5.QtCore import Qt
+from importlib import import_module
+from PyQt5.QtCore import Qt, QEvent, QObject, QTimer
 from PyQt5.QtWidgets import QApplication, QStyleFactory
 
 if hasattr(Qt, 'AA_EnableHighDpiScaling'):
@@ -17,11 +38,129 @@ if hasattr(Qt, 'AA_UseHighDpiPixmaps'):
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
 
 
+def processAge():
+    # Seconds since the process was created, None if unknown. For a one file
+    #   build this includes unpacking it.
+    try:
+        import psutil
+        return time.time() - psutil.Process().create_time()
+    except ImportError:
+        return None
+
+
+class StartupReport(QObject):
+    # Imported before the GUI, in this order, to split the import time
+    Packages = ("numpy", "pyqtgraph", "acestatpy")
+    # Only needed to export plots, must not be imported by the first paint
+    Deferred = ("matplotlib", "pyqtgraph.exporters")
+
+    def __init__(self, path=None, *args, **kwargs):
+        # path: File to write the report to, printed if None.
+        super().__init__(*args, **kwargs)
+        self.__path = path
+        # Before this module ran, e.g. the interpreter and bootloader
+        self.__before = processAge()
+        if self.__before is not None:
+            self.__before -= time.perf_counter() - START
+        # [(name, seconds since START)]
+        self.marks = []
+        self.__painted = False
+        self.__done = False
+
+    def mark(self, name):
+        self.marks.append((name, time.perf_counter() - START))
+
+    def importPackages(self):
+        for p in self.Packages:
+            try:
+                import_module(p)
+            except ImportError:
+                continue
+            self.mark("import {0}".format(p))
+
+    def watch(self, window):
+        # Reports once the window has been painted and its start up stages
+        #   have finished (ACEstatGUI.sigStartupStage), then quits
+        window.installEventFilter(self)
+        if hasattr(window, "sigStartupStage"):
+            window.sigStartupStage.connect(self.__stage)
+        else:
+            self.__done = True
+
+    def __stage(self, stage):
+        self.mark(stage)
+        if stage in ("interactive", "failed"):
+            self.__done = True
+            self.__finishWhenReady()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            self.mark("first paint")
+            self.__painted = True
+            self.__finishWhenReady()
+        return False
+
+    def __finishWhenReady(self):
+        if self.__painted and self.__done:
+            QTimer.singleShot(0, self.finish)
+
+    def elapsed(self, name):
+        # Seconds from START to a mark, including the time before START if
+        #   known, None if not marked
+        for n, t in self.marks:
+            if n == name:
+                return t + (self.__before or 0)
+        return None
+
+    def report(self):
+        lines = ["Startup (ms{0}), step and elapsed:".format(
+            ", frozen" if getattr(sys, "frozen", False) else "")]
+        last = 0
+        if self.__before is not None:
+            lines.append("  {0:<24}{1:8.1f}".format(
+                "process start", 1000 * self.__before))
+        for name, t in self.marks:
+            lines.append("  {0:<24}{1:8.1f}{2:9.1f}".format(
+                name, 1000 * (t - last), 1000 * (t + (self.__before or 0))))
+            last = t
+        for name in ("first paint", "interactive"):
+            if self.elapsed(name) is not None:
+                lines.append("Time to {0}: {1:.1f} ms".format(
+                    name, 1000 * self.elapsed(name)))
+        loaded = [m for m in self.Deferred if m in sys.modules]
+        lines.append("Deferred modules imported: {0}".format(
+            ", ".join(loaded) or "none"))
+        return "\n".join(lines), not loaded
+
+    def finish(self):
+        text, ok = self.report()
+        if self.__path:
+            with open(self.__path, "w") as f:
+                f.write(text + "\n")
+        elif sys.stdout is not None:
+            print(text)
+        QApplication.exit(0 if ok else 1)
+
+
 if __name__ == "__main__":
+    report = None
+    for arg in sys.argv[1:]:
+        if arg.split("=", 1)[0] == "--startup-report":
+            report = StartupReport(arg.partition("=")[2] or None)
+            report.mark("import PyQt5")
     app = QApplication(sys.argv)
+    if report:
+        report.mark("QApplication")
+        report.importPackages()
     # Import the main GUI after initializing app. This allows using message
     #   dialogs if any errors occur.
     from ACEstatGUI import ACEstatGUI
+    if report:
+        report.mark("import ACEstatGUI")
     ex = ACEstatGUI()
+    if report:
+        report.mark("create window")
+        report.watch(ex)
     ex.show()
     sys.exit(app.exec_())
@@ -0,0 +1,170 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -ArchiveRecord
+    -removeFile
+    -ResultArchive
+
+On-disk store for finished tests.
+
+Each result is written once to its own .npz file (see Formats), and indexed in
+    a SQLite database by start time, test, technique and parameters. The index
+    is small enough to page and search through thousands of results, the
+    arrays are only read when a result is opened. Files can be written by a
+    ResultWriter, in the background. With a limit, the oldest results are
+    removed once there are more, see prune.
+
+ToDo:
+
+'''
+import json
+import os
+import sqlite3
+from collections import namedtuple
+# Local
+from .Formats import loadResult, npzArrays, saveNpz, writeNpz
+
+
+ArchiveRecord = namedtuple(
+    "ArchiveRecord", ["key", "startTime", "id", "name", "technique", "parameters"])
+
+
+def removeFile(path):
+    # Already removed or never written is fine
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class ResultArchive(object):
+    Schema = """
+        CREATE TABLE IF NOT EXISTS results (
+            key INTEGER PRIMARY KEY AUTOINCREMENT,
+            start REAL,
+            id TEXT,
+            name TEXT,
+            technique TEXT,
+            parameters TEXT
+        );
+        CREATE INDEX IF NOT EXISTS results_start ON results (start);
+        CREATE INDEX IF NOT EXISTS results_id ON results (id);
+    """
+
+    def __init__(self, path, writer=None, limit=None):
+        # writer: A ResultWriter, files are written on its thread if given.
+        # limit: Number of results kept, all if None.
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.__writer = writer
+        self.__limit = limit
+        self.__db = sqlite3.connect(os.path.join(path, "index.sqlite"))
+        self.__db.executescript(self.Schema)
+
+    def __dataPath(self, key):
+        return os.path.join(self.path, "{0}.npz".format(key))
+
+    def add(self, test):
+        # Stores a finished test, returns its key.
+        info = test.info
+        with self.__db:
+            cursor = self.__db.execute(
+                "INSERT INTO results (start, id, name, technique, parameters)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (test.startTime, test.id, info.name,
+                 getattr(info, "technique", ""),
+                 json.dumps(dict(test.parameters), default=str)))
+            key = cursor.lastrowid
+            if self.__writer is None:
+                saveNpz(test, self.__dataPath(key))
+        if self.__writer is not None:
+            path = self.__dataPath(key)
+            self.__writer.submit(path, writeNpz, npzArrays(test), path)
+        return key
+
+    def setLimit(self, limit):
+        self.__limit = limit
+
+    def prune(self):
+        # Removes the oldest results over the limit, returns their keys.
+        if self.__limit is None:
+            return []
+        with self.__db:
+            keys = [r[0] for r in self.__db.execute(
+                "SELECT key FROM results ORDER BY start DESC, key DESC"
+                " LIMIT -1 OFFSET ?", (self.__limit,))]
+            self.__db.executemany(
+                "DELETE FROM results WHERE key = ?", [(k,) for k in keys])
+        for k in keys:
+            path = self.__dataPath(k)
+            if self.__writer is None:
+                removeFile(path)
+            else:
+                # After the file, if it is still being written
+                self.__writer.submit(path, removeFile, path)
+        return keys
+
+    def __where(self, search, ids=None):
+        # ids: Only results of these tests, e.g. those still defined
+        clauses = []
+        args = ()
+        if search:
+            clauses.append("(name LIKE ? OR id LIKE ? OR technique LIKE ?"
+                           " OR parameters LIKE ?)")
+            args += ("%{0}%".format(search),) * 4
+        if ids is not None:
+            ids = tuple(ids)
+            clauses.append("id IN ({0})".format(",".join("?" * len(ids))))
+            args += ids
+        if not clauses:
+            return "", ()
+        return " WHERE " + " AND ".join(clauses), args
+
+    def count(self, search="", ids=None):
+        where, args = self.__where(search, ids)
+        return self.__db.execute(
+            "SELECT COUNT(*) FROM results" + where, args).fetchone()[0]
+
+    def position(self, key, search="", ids=None, newestFirst=True):
+        # Index of a result in page order, None if it is not listed.
+        r = self.__db.execute(
+            "SELECT start FROM results WHERE key = ?", (key,)).fetchone()
+        where, args = self.__where(search, ids)
+        if r is None or not self.__db.execute(
+                "SELECT COUNT(*) FROM results" + (where + " AND" if where else
+                " WHERE") + " key = ?", args + (key,)).fetchone()[0]:
+            return None
+        before = "(start {0} ? OR (start = ? AND key {0} ?))".format(
+            ">" if newestFirst else "<")
+        return self.__db.execute(
+            "SELECT COUNT(*) FROM results" + (where + " AND " if where else
+            " WHERE ") + before, args + (r[0], r[0], key)).fetchone()[0]
+
+    def page(self, offset, limit, search="", newestFirst=True, ids=None):
+        # Records only, no result data is read.
+        where, args = self.__where(search, ids)
+        rows = self.__db.execute(
+            "SELECT key, start, id, name, technique, parameters FROM results"
+            + where + " ORDER BY start {0}, key {0} LIMIT ? OFFSET ?".format(
+                "DESC" if newestFirst else "ASC"),
+            args + (limit, offset))
+        return [ArchiveRecord(r[0], r[1], r[2], r[3], r[4], json.loads(r[5]))
+                for r in rows]
+
+    def record(self, key):
+        r = self.__db.execute(
+            "SELECT key, start, id, name, technique, parameters FROM results"
+            " WHERE key = ?", (key,)).fetchone()
+        if r is None:
+            raise Exception("Result {0} is not archived.".format(key))
+        return ArchiveRecord(r[0], r[1], r[2], r[3], r[4], json.loads(r[5]))
+
+    def load(self, key, definitions):
+        # Reads a stored result. definitions is used to find the test info.
+        test = loadResult(self.__dataPath(key), definitions)
+        test.archiveKey = key
+        return test
+
+    def close(self):
+        self.__db.close()
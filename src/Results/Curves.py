@@ -0,0 +1,122 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -PreparedCurve
+    -prepareCurves
+    -CurveCache
+
+Plot data, prepared once per result and plot id.
+
+A plot's series are resolved against the result's columns and kept as
+    contiguous float arrays with their bounds, so showing a recently viewed
+    plot again does not look up, convert or scan its data. CurveCache keeps the
+    most recently used plots within a memory budget, counting the arrays and
+    anything derived from them (see PreparedCurve.extra).
+
+ToDo:
+
+'''
+from collections import OrderedDict
+import numpy as np
+# Local
+from .Store import Columns
+
+
+class PreparedCurve(object):
+    # One series of a plot
+
+    def __init__(self, x, y, name=""):
+        self.x = self.__array(x)
+        self.y = self.__array(y)
+        self.name = name
+        # (min, max) of x and y, None without finite values
+        self.bounds = (self.__bounds(self.x), self.__bounds(self.y))
+        # Data derived from the curve, by name, counted by nbytes
+        self.extra = {}
+
+    @staticmethod
+    def __array(values):
+        array = np.ascontiguousarray(values, dtype=np.float64)
+        array.setflags(write=False)
+        return array
+
+    @staticmethod
+    def __bounds(array):
+        finite = array[np.isfinite(array)] if array.size else array
+        if not finite.size:
+            return None
+        return (float(finite.min()), float(finite.max()))
+
+    @property
+    def nbytes(self):
+        return self.x.nbytes + self.y.nbytes + sum(
+            getattr(v, "nbytes", 0) for v in self.extra.values())
+
+
+def prepareCurves(test, id):
+    # Curves of the plot id of a finished test
+    info = test.info.plots[id]
+    columns = Columns(test)
+    return [PreparedCurve(columns[s.x.output][s.x.field],
+                          columns[s.y.output][s.y.field],
+                          getattr(s, "name", ""))
+            for s in info.series]
+
+
+class CurveCache(object):
+
+    def __init__(self, budget=256 * 2**20):
+        # budget: Bytes of curve data kept, the most recently used plot is
+        #   kept even if it is larger.
+        self.__budget = budget
+        # (key, plot id): [curves], least recently used first
+        self.__cache = OrderedDict()
+        self.__pinned = set()
+
+    def __len__(self):
+        return len(self.__cache)
+
+    def __contains__(self, item):
+        return item in self.__cache
+
+    @property
+    def nbytes(self):
+        return sum(c.nbytes for curves in self.__cache.values() for c in curves)
+
+    def budget(self):
+        return self.__budget
+
+    def setBudget(self, budget):
+        self.__budget = budget
+        self.trim()
+
+    def get(self, key, id, test):
+        # Prepared curves of a test's plot id. key identifies the test, e.g.
+        #   its archive key, the test itself works as well.
+        curves = self.__cache.get((key, id))
+        if curves is not None:
+            self.__cache.move_to_end((key, id))
+            return curves
+        curves = prepareCurves(test, id)
+        self.__cache[(key, id)] = curves
+        self.trim()
+        return curves
+
+    def setPinned(self, items):
+        # (key, plot id) pairs that are not evicted, e.g. while shown
+        self.__pinned = set(items)
+        self.trim()
+
+    def trim(self):
+        # Evicts the least recently used plots until within budget
+        size = self.nbytes
+        for k in list(self.__cache)[:-1]:
+            if size <= self.__budget:
+                break
+            if k in self.__pinned:
+                continue
+            size -= sum(c.nbytes for c in self.__cache.pop(k))
+
+    def clear(self):
+        self.__cache.clear()
@@ -0,0 +1,483 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -StoredParameters
+    -StoredResult
+    -snapshot
+    -npzArrays
+    -writeNpz
+    -saveNpz
+    -readNpz
+    -labelKeys
+    -parameterValue
+    -storedParameters
+    -parseTime
+    -numericRows
+    -padColumns
+    -readRows
+    -testLabels
+    -matchTest
+    -readCsv
+    -readTable
+    -loadResult
+    -saveResult
+
+Result file formats.
+
+CSV is written by the test itself. NPZ files hold the result columns as
+    binary arrays, written without formatting each value as text, and a JSON
+    header with the test id, start time, parameters and the output/field of
+    each array, so they can be opened again without the original test.
+
+CSV files are read by the names in the test definition rather than by
+    position, so files exported by an ACEstatPy test and by
+    StoredResult.export can both be opened: parameters and field outputs are
+    rows starting with their id, name or label, matrix and list outputs are
+    columns under a row of field labels. Parameters are converted to the type
+    of their definition, parameters the test does not define are dropped.
+
+ToDo:
+
+'''
+import copy
+import csv
+import json
+import os
+import re
+from datetime import datetime
+import numpy as np
+# Local
+from .Store import Columns, toArray
+
+
+# File dialog filters, by extension
+FILTERS = {
+    "csv": "CSV (*.csv)",
+    "npz": "NumPy (*.npz)",
+}
+# Matrix rows converted at once when reading CSV
+CSV_CHUNK = 65536
+# A CSV row of numbers, e.g. "1.5,2", ",-2e3" or "nan,1"
+NUMERIC_ROW = re.compile(r"[\s,]*[-+]?(\d|\.\d|nan\b|inf(inity)?\b)", re.IGNORECASE)
+# Units after a name, e.g. "Current (A)" or "Current [uA]"
+UNITS = re.compile(r"\s*[\(\[][^\)\]]*[\)\]]$")
+# Names of the row holding the test id or name
+TEST_KEYS = ("test", "test id", "test name", "id", "name")
+# Start times other than ISO 8601
+TIME_FORMATS = ("%Y%m%d-%H%M%S", "%Y/%m/%d %H:%M:%S", "%m/%d/%Y %H:%M:%S",
+                "%m/%d/%Y %I:%M:%S %p", "%c")
+
+
+class StoredParameters(dict):
+    # Parameters of a stored result, exported as a custom preset.
+
+    def __init__(self, id, definitions, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__id = id
+        self.__definitions = definitions
+
+    def export(self, path):
+        self.__definitions.saveCustomPreset(self.__id, dict(self), path)
+
+
+class StoredResult(object):
+    # Read back from a file or archive, behaves like a finished ACEstatPy test.
+
+    def __init__(self, id, info, startTime, parameters, results, definitions):
+        self.id = id
+        self.info = info
+        self.startTime = startTime
+        self.parameters = StoredParameters(id, definitions, parameters)
+        self.results = results
+        # Set when read from a ResultArchive
+        self.archiveKey = None
+
+    def generateFilename(self):
+        return "{0}_{1}.csv".format(datetime.fromtimestamp(
+            self.startTime).strftime('%Y%m%d-%H%M%S'), self.id)
+
+    def export(self, path):
+        # Test id and start time as "#key,value" rows, then parameters as
+        #   "name,value" rows, fields and lists as "output.field,value" rows,
+        #   then each matrix after a blank line, its name and a header row.
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["#test", self.id])
+            writer.writerow(["#start", datetime.fromtimestamp(
+                self.startTime).isoformat()])
+            for p in self.parameters:
+                writer.writerow([p, self.parameters[p]])
+            matrices = []
+            for output, info in self.info.outputs.items():
+                values = self.results.get(output, {})
+                if info.type == "matrix":
+                    matrices.append((output, values))
+                    continue
+                for field, value in values.items():
+                    if isinstance(value, np.ndarray):
+                        writer.writerow(["{0}.{1}".format(output, field)] + value.tolist())
+                    else:
+                        writer.writerow(["{0}.{1}".format(output, field), value])
+            for output, values in matrices:
+                writer.writerow([])
+                writer.writerow([output])
+                writer.writerow(list(values))
+                writer.writerows(zip(*(np.atleast_1d(v).tolist()
+                                       for v in values.values())))
+
+
+def snapshot(test):
+    # Copy of a finished test that can be exported on another thread while the
+    #   test is used. Parameters and result lists are copied, read-only
+    #   arrays and the test definition are shared.
+    snap = copy.copy(test)
+    snap.parameters = copy.copy(test.parameters)
+    snap.results = {
+        output: {field: list(value) if isinstance(value, list) else value
+                 for field, value in values.items()}
+        for output, values in test.results.items()}
+    return snap
+
+
+def npzArrays(test):
+    # Snapshot of a test for writeNpz. The columns are read-only, so they can
+    #   be written from another thread.
+    fields = []
+    arrays = {}
+    for output, values in Columns(test).items():
+        for field, value in values.items():
+            arrays["a{0}".format(len(fields))] = np.asarray(value)
+            fields.append([output, field])
+    header = {
+        "id": test.id,
+        "startTime": test.startTime,
+        "parameters": dict(test.parameters),
+        "fields": fields,
+    }
+    arrays["header"] = np.array(json.dumps(header, default=str))
+    return arrays
+
+
+def writeNpz(arrays, path):
+    # Uncompressed, writing is limited by the disk rather than zlib
+    np.savez(path, **arrays)
+
+
+def saveNpz(test, path):
+    writeNpz(npzArrays(test), path)
+
+
+def readNpz(path):
+    # Returns the header and the results, as {output: {field: value}}
+    results = {}
+    with np.load(path) as data:
+        header = json.loads(data["header"].item())
+        for i, (output, field) in enumerate(header["fields"]):
+            value = data["a{0}".format(i)]
+            if value.ndim == 0:
+                value = value.item()
+            else:
+                value.setflags(write=False)
+            results.setdefault(output, {})[field] = value
+    return header, results
+
+
+def labelKeys(text):
+    # Names a cell may refer to, lower case: as written, without units, e.g.
+    #   "Current (A)", and without an output, e.g. "data.Current".
+    text = text.strip().lstrip("#").rstrip(":").strip().lower()
+    keys = [text]
+    bare = UNITS.sub("", text)
+    if bare != text:
+        keys.append(bare)
+    if "." in bare:
+        keys.append(bare.rsplit(".", 1)[1])
+    return keys
+
+
+def parameterValue(info, value):
+    # A parameter read from a file, as the type of its definition info.
+    #   Raises ValueError if it is not valid for the definition.
+    kind = getattr(info, "type", None)
+    if kind == "int":
+        return int(float(value))
+    if kind in ("float", "number"):
+        return float(value)
+    options = getattr(info, "options", None)
+    if options is not None:
+        for key, label in options.items():
+            if value in (key, str(key), label):
+                return key
+        raise ValueError("{0} is not an option".format(value))
+    return value
+
+
+def storedParameters(info, values):
+    # The parameters of test definition info in values, converted. Others,
+    #   and values that are not valid, are skipped.
+    parameters = {}
+    for p, value in values.items():
+        if p not in info.parameters:
+            continue
+        try:
+            parameters[p] = parameterValue(info.parameters[p], value)
+        except (TypeError, ValueError):
+            continue
+    return parameters
+
+
+def parseTime(text):
+    # Timestamp of a date and time, None if it is not one
+    text = text.strip()
+    try:
+        return datetime.fromisoformat(text).timestamp()
+    except ValueError:
+        pass
+    for f in TIME_FORMATS:
+        try:
+            return datetime.strptime(text, f).timestamp()
+        except ValueError:
+            pass
+    return None
+
+
+def numericRows(lines):
+    # Lines of numbers as a 2D array, empty or missing cells are nan
+    try:
+        return np.loadtxt(lines, delimiter=",", ndmin=2)
+    except ValueError:
+        pass
+    rows = []
+    for row in csv.reader(lines):
+        values = []
+        for c in row:
+            try:
+                values.append(float(c))
+            except ValueError:
+                values.append(np.nan)
+        rows.append(values)
+    return padColumns([np.array(r, ndmin=2) for r in rows])
+
+
+def padColumns(arrays):
+    # Stacks 2D arrays with different numbers of columns
+    width = max(a.shape[1] for a in arrays)
+    return np.concatenate([
+        np.pad(a, ((0, 0), (0, width - a.shape[1])), constant_values=np.nan)
+        for a in arrays])
+
+
+def readRows(path):
+    # Returns [(cells, table)]. Text rows have no table, runs of numeric rows
+    #   are a table with the text row directly above them as cells. Tables
+    #   are parsed CSV_CHUNK rows at a time, so large files are not held as
+    #   text at once.
+    def cells(line):
+        return next(csv.reader([line]))
+
+    rows = []
+    header = None
+    with open(path, newline="") as f:
+        line = f.readline()
+        while line:
+            if not NUMERIC_ROW.match(line):
+                header = cells(line) if line.strip().strip(",") else None
+                if header:
+                    rows.append((header, None))
+                line = f.readline()
+                continue
+            chunks = []
+            chunk = []
+            while line and NUMERIC_ROW.match(line):
+                chunk.append(line)
+                if len(chunk) >= CSV_CHUNK:
+                    chunks.append(numericRows(chunk))
+                    chunk = []
+                line = f.readline()
+            if chunk:
+                chunks.append(numericRows(chunk))
+            if header:
+                rows.pop()
+            rows.append((header or [], padColumns(chunks)))
+            header = None
+    return rows
+
+
+def testLabels(id, info):
+    # Row and column names a file exported from a test may contain
+    labels = set()
+    for p, pInfo in info.parameters.items():
+        labels.update((str(p).lower(), str(getattr(pInfo, "name", p)).lower()))
+    for output, oInfo in info.outputs.items():
+        for f in oInfo.fields:
+            labels.update((f.label.lower(),
+                           "{0}.{1}".format(output, f.label).lower()))
+    return labels
+
+
+def matchTest(definitions, rows, filename=""):
+    # The test a file was exported from. Named in a row such as "Test,<id>"
+    #   or "#test,<id>", by id or name, otherwise the test whose parameters
+    #   and outputs match the most row names and column headers. Ties go to
+    #   a test whose id is part of the file name.
+    ids = {}
+    for id, info in definitions.items():
+        ids.setdefault(str(id).lower(), id)
+        ids.setdefault(str(getattr(info, "name", id)).strip().lower(), id)
+    for cells, table in rows:
+        if table is None and len(cells) > 1 and labelKeys(cells[0])[0] in TEST_KEYS:
+            if cells[1].strip().lower() in ids:
+                return ids[cells[1].strip().lower()]
+    names = set()
+    for cells, table in rows:
+        for c in (cells if table is not None else cells[:1]):
+            names.update(labelKeys(c))
+    words = set(re.split(r"[^0-9A-Za-z]+", filename))
+    best, bestScore = None, 0
+    for id, info in definitions.items():
+        score = len(names & testLabels(id, info))
+        if score and id in words:
+            score += 0.5
+        if score > bestScore:
+            best, bestScore = id, score
+    return best
+
+
+def readCsv(path, definitions):
+    # Reads a CSV exported by an ACEstatPy test, or by StoredResult.export.
+    #   Values are found by the names in the test definition, i.e. parameter
+    #   ids or names, field labels, optionally with units or "output.", and
+    #   matrix or list columns under a header row of field labels.
+    rows = readRows(path)
+    id = matchTest(definitions, rows, os.path.basename(path))
+    if id is None:
+        raise Exception("Unable to find the test for {0}.".format(path))
+    info = definitions[id]
+
+    params = {}
+    for p, pInfo in info.parameters.items():
+        for name in (p, getattr(pInfo, "name", p)):
+            params.setdefault(str(name).strip().lower(), p)
+    # Name: [(output, field)], of field and list outputs
+    fields = {}
+    for output, oInfo in info.outputs.items():
+        if oInfo.type == "matrix":
+            continue
+        for f in oInfo.fields:
+            for name in (f.label, "{0}.{1}".format(output, f.label)):
+                fields.setdefault(name.strip().lower(), []).append((output, f.label))
+
+    def find(names, keys):
+        for k in keys:
+            if k in names:
+                return names[k]
+        return None
+
+    raw = {}
+    results = {}
+    startTime = None
+    previous = []
+    for cells, table in rows:
+        if table is not None:
+            readTable(info, cells, table, results,
+                      labelKeys(previous[0]) if len(previous) == 1 else [])
+            previous = []
+            continue
+        previous = cells
+        keys = labelKeys(cells[0])
+        p = find(params, keys)
+        if p is not None and p not in raw and len(cells) > 1:
+            raw[p] = cells[1]
+            continue
+        for output, field in find(fields, keys) or []:
+            if field in results.get(output, {}):
+                continue
+            values = cells[1:]
+            if info.outputs[output].type == "list":
+                while values and not values[-1].strip():
+                    values.pop()
+                value = toArray(values)
+            elif values:
+                value = values[0]
+                try:
+                    value = float(value)
+                except ValueError:
+                    pass
+            else:
+                break
+            results.setdefault(output, {})[field] = value
+            break
+        else:
+            if (startTime is None and len(cells) > 1
+                    and any(k in keys[0] for k in ("start", "time", "date"))):
+                startTime = parseTime(cells[1])
+
+    if startTime is None:
+        name = re.match(r"\d{8}-\d{6}", os.path.basename(path))
+        if name:
+            startTime = datetime.strptime(name.group(0), "%Y%m%d-%H%M%S").timestamp()
+        else:
+            startTime = os.path.getmtime(path)
+    return StoredResult(id, info, startTime, storedParameters(info, raw),
+                        results, definitions)
+
+
+def readTable(info, header, table, results, named=()):
+    # Adds the matrix and list outputs of info found in the columns of table
+    #   to results. A matrix needs a column for each of its fields, a column
+    #   is used once. named: Keys of the row above, a matrix named there is
+    #   matched first.
+    columns = [labelKeys(h) for h in header][:table.shape[1]]
+    used = set()
+
+    def column(output, label):
+        for i, keys in enumerate(columns):
+            if i not in used and (label.lower() in keys or "{0}.{1}".format(
+                    output, label).lower() in keys):
+                return i
+        return None
+
+    outputs = sorted(info.outputs, key=lambda o: o.lower() not in named)
+    for output in outputs:
+        oInfo = info.outputs[output]
+        if output in results or oInfo.type not in ("matrix", "list"):
+            continue
+        found = {}
+        for f in oInfo.fields:
+            i = column(output, f.label)
+            if i is None:
+                break
+            found[f.label] = i
+            used.add(i)
+        if len(found) < len(oInfo.fields):
+            used.difference_update(found.values())
+            continue
+        data = table[:, list(found.values())]
+        # Columns of different lengths end in empty cells
+        rows = len(data)
+        while rows and np.isnan(data[rows - 1]).all():
+            rows -= 1
+        results[output] = {
+            label: toArray(data[:rows, n]) for n, label in enumerate(found)}
+
+
+def loadResult(path, definitions):
+    # Opens a saved result, definitions is used to find the test info.
+    if not path.lower().endswith(".npz"):
+        return readCsv(path, definitions)
+    header, results = readNpz(path)
+    if header["id"] not in definitions:
+        raise Exception("Unknown test: {0}.".format(header["id"]))
+    info = definitions[header["id"]]
+    return StoredResult(header["id"], info, header["startTime"],
+                        storedParameters(info, header["parameters"]), results,
+                        definitions)
+
+
+def saveResult(test, path):
+    # The format is chosen by the file extension, CSV by default.
+    if path.lower().endswith(".npz"):
+        saveNpz(test, path)
+    else:
+        test.export(path)
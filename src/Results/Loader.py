@@ -0,0 +1,72 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -ResultLoader
+
+Opens saved result files on background threads.
+
+Files are parsed by a small pool of worker threads and each result is
+    delivered with sigLoaded, on the GUI thread, as soon as it is read, so
+    opening hundreds of files neither blocks the GUI nor waits for the slowest
+    file.
+
+ToDo:
+
+'''
+import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from PyQt5.QtCore import QObject, pyqtSignal as Signal
+# Local
+from .Formats import loadResult
+
+
+class ResultLoader(QObject):
+    # Test and path
+    sigLoaded = Signal(object, str)
+    # Path and error message
+    sigError = Signal(str, str)
+    # Files done and total, since the loader was last idle
+    sigProgress = Signal(int, int)
+
+    def __init__(self, workers=None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__executor = ThreadPoolExecutor(
+            max_workers=workers or min(4, os.cpu_count() or 1),
+            thread_name_prefix="ResultLoader")
+        self.__lock = Lock()
+        self.__done = 0
+        self.__total = 0
+        self.__closed = False
+
+    def pending(self):
+        return self.__total - self.__done
+
+    def open(self, paths, definitions):
+        paths = list(paths)
+        with self.__lock:
+            self.__total += len(paths)
+        for p in paths:
+            self.__executor.submit(self.__load, p, definitions)
+
+    def __load(self, path, definitions):
+        if self.__closed:
+            return
+        try:
+            test = loadResult(path, definitions)
+        except Exception as e:
+            self.sigError.emit(path, "{0}".format(e))
+        else:
+            self.sigLoaded.emit(test, path)
+        with self.__lock:
+            self.__done += 1
+            done, total = self.__done, self.__total
+            if done == total:
+                self.__done = self.__total = 0
+        self.sigProgress.emit(done, total)
+
+    def close(self):
+        # Files that have not been started are skipped.
+        self.__closed = True
+        self.__executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,118 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -Summary
+    -summarize
+    -ResultColumns
+    -Columns
+
+Columnar, typed view of a finished test's results.
+
+ACEstatPy stores each output field as a Python list. Plotting, tables and
+    exporters all need arrays, so the lists are converted to contiguous numpy
+    arrays once, when the test ends, and every reader shares them. The arrays
+    are read-only so they can be handed out (and to other threads) without
+    copying.
+
+List outputs are shown by their Summary rather than their values, computed
+    once per field with numpy.
+
+ToDo:
+
+'''
+from collections import namedtuple
+from weakref import WeakKeyDictionary
+import numpy as np
+
+
+# min, max and mean are None unless the values are numbers
+Summary = namedtuple(
+    "Summary", ["count", "min", "max", "mean", "first", "last"])
+
+
+def toArray(values):
+    # Lists become typed arrays. Scalars (e.g. "field" outputs) are returned
+    #   as-is.
+    if isinstance(values, np.ndarray):
+        array = values.view()
+    elif isinstance(values, (list, tuple)):
+        array = np.asarray(values)
+        if array.dtype.kind in "SU":
+            # Numbers that arrived as text
+            try:
+                array = array.astype(np.float64)
+            except ValueError:
+                pass
+    else:
+        return values
+    array = np.ascontiguousarray(array)
+    array.setflags(write=False)
+    return array
+
+
+def summarize(array):
+    # Summary of a list output. min, max and mean skip values that are not
+    #   finite.
+    count = len(array)
+    if not count:
+        return Summary(0, None, None, None, None, None)
+    first, last = array[0].item(), array[-1].item()
+    if array.dtype.kind not in "iuf":
+        return Summary(count, None, None, None, first, last)
+    if array.dtype.kind == "f":
+        array = array[np.isfinite(array)]
+        if not array.size:
+            return Summary(count, None, None, None, first, last)
+    return Summary(count, array.min().item(), array.max().item(),
+                   array.mean(dtype=np.float64).item(), first, last)
+
+
+class ResultColumns(object):
+
+    def __init__(self, test):
+        self.__columns = {}
+        # (output, field): Summary
+        self.__summaries = {}
+        results = getattr(test, "results", None) or {}
+        for output in results:
+            self.__columns[output] = {
+                field: toArray(value)
+                for field, value in results[output].items()
+            }
+
+    def __getitem__(self, output):
+        return self.__columns[output]
+
+    def __contains__(self, output):
+        return output in self.__columns
+
+    def __iter__(self):
+        return iter(self.__columns)
+
+    def items(self):
+        return self.__columns.items()
+
+    def summary(self, output, field):
+        # Summary of a list field, computed on first use
+        summary = self.__summaries.get((output, field))
+        if summary is None:
+            summary = self.__summaries[(output, field)] = summarize(
+                self.__columns[output][field])
+        return summary
+
+    @property
+    def nbytes(self):
+        return sum(v.nbytes for o in self.__columns.values()
+                   for v in o.values() if isinstance(v, np.ndarray))
+
+
+_columns = WeakKeyDictionary()
+
+
+def Columns(test):
+    # Returns the cached columns of a test, converting them on first use.
+    columns = _columns.get(test)
+    if columns is None:
+        columns = _columns[test] = ResultColumns(test)
+    return columns
@@ -0,0 +1,76 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -ResultWriter
+
+Writes result files on a background thread, so saving never blocks the GUI.
+
+A single worker thread writes files in the order they were submitted. Data is
+    captured when a file is submitted, on the GUI thread, and the worker only
+    sees the copy: .npz files are written from the test's read-only columns,
+    CSV by a snapshot of the test (see Formats.snapshot). Progress and errors
+    are reported with Qt signals, delivered on the GUI thread.
+
+ToDo:
+
+'''
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from PyQt5.QtCore import QObject, pyqtSignal as Signal
+# Local
+from .Formats import npzArrays, snapshot, writeNpz
+
+
+class ResultWriter(QObject):
+    # Number of files waiting to be written, including the current one
+    sigProgress = Signal(int)
+    sigSaved = Signal(str)
+    # Path and error message
+    sigError = Signal(str, str)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ResultWriter")
+        self.__lock = Lock()
+        self.__pending = 0
+
+    def pending(self):
+        return self.__pending
+
+    def save(self, test, path):
+        # The format is chosen by the file extension, CSV by default.
+        if path.lower().endswith(".npz"):
+            self.submit(path, writeNpz, npzArrays(test), path)
+        else:
+            self.submit(path, snapshot(test).export, path)
+
+    def submit(self, path, fn, *args):
+        # Runs fn(*args) on the worker thread, path is used for reporting.
+        with self.__lock:
+            self.__pending += 1
+            pending = self.__pending
+        self.sigProgress.emit(pending)
+        self.__executor.submit(self.__run, path, fn, args)
+
+    def __run(self, path, fn, args):
+        try:
+            fn(*args)
+        except Exception as e:
+            self.sigError.emit(path, "{0}".format(e))
+        else:
+            self.sigSaved.emit(path)
+        finally:
+            with self.__lock:
+                self.__pending -= 1
+                pending = self.__pending
+            self.sigProgress.emit(pending)
+
+    def flush(self):
+        # Blocks until everything submitted so far is written.
+        self.__executor.submit(lambda: None).result()
+
+    def close(self):
+        # Writes the remaining files, nothing can be submitted afterwards.
+        self.__executor.shutdown(wait=True)
@@ -0,0 +1,6 @@
+from .Archive import ArchiveRecord, ResultArchive
+from .Curves import CurveCache, PreparedCurve, prepareCurves
+from .Formats import FILTERS, StoredResult, loadResult, saveResult
+from .Loader import ResultLoader
+from .Store import Columns, ResultColumns, Summary, summarize
+from .Writer import ResultWriter
@@ -1,12 +1,24 @@
 '''
-Last Modified: 2021-05-07
+Last Modified: 2026-10-18
 
 @author: Jesse M. Barr
 
 Contains:
+    -LoadConfig
+    -archivePath
     -PreferenceDialog
 
 Changes:
+    -2026-10-18:
+        -Added live plot preferences.
+        -Added plot downsampling preferences.
+        -Added signal timing diagnostics option.
+        -Raised the result limit to 10000.
+        -Added result archive option, off by default, with a limit on the
+            number of results kept. Relative archive paths are in the
+            per-user data directory, see archivePath.
+        -Added plot cache size.
+        -Added option to restore imported tests and presets at start.
 
 ToDo:
 
@@ -18,6 +30,17 @@ from PyQt5.QtWidgets import (
 )
 # Installed
 from configparser import SafeConfigParser
+import os
+# Local
+from Utilities import data_path
+
+# Values match PlotWidget.DownsampleModes
+DOWNSAMPLE_MODES = {
+    "off": "Off",
+    "peak": "Peak (min/max)",
+    "mean": "Mean",
+    "subsample": "Subsample",
+}
 
 
 def LoadConfig(fPath):
@@ -42,13 +65,75 @@ def LoadConfig(fPath):
     except: config.set('results', 'result_limit', '10')
     try: config.getint('results', 'result_sort')
     except: config.set('results', 'result_sort', '-1')
+    try: config.getboolean('results', 'archive')
+    except: config.set('results', 'archive', 'false')
+    if not config.get('results', 'archive_path', fallback=''):
+        config.set('results', 'archive_path', 'archive')
+    try: config.getint('results', 'archive_limit')
+    except: config.set('results', 'archive_limit', '1000')
+
+    config.set("results", "archive_limit", str(min(config.getint("results", "archive_limit"), 100000)))
+    config.set("results", "archive_limit", str(max(config.getint("results", "archive_limit"), 1)))
 
-    config.set("results", "result_limit", str(min(config.getint("results", "result_limit"), 100)))
+    config.set("results", "result_limit", str(min(config.getint("results", "result_limit"), 10000)))
     config.set("results", "result_limit", str(max(config.getint("results", "result_limit"), 1)))
 
+    if not config.has_section("plots"):
+        config.add_section("plots")
+
+    try: config.getboolean('plots', 'live_plot')
+    except: config.set('plots', 'live_plot', 'true')
+    try: config.getint('plots', 'live_rate')
+    except: config.set('plots', 'live_rate', '25')
+
+    config.set("plots", "live_rate", str(min(config.getint("plots", "live_rate"), 60)))
+    config.set("plots", "live_rate", str(max(config.getint("plots", "live_rate"), 1)))
+
+    if config.get('plots', 'downsample', fallback=None) not in DOWNSAMPLE_MODES:
+        config.set('plots', 'downsample', 'peak')
+    try: config.getboolean('plots', 'clip_to_view')
+    except: config.set('plots', 'clip_to_view', 'true')
+    try: config.getint('plots', 'points_per_pixel')
+    except: config.set('plots', 'points_per_pixel', '5')
+
+    config.set("plots", "points_per_pixel", str(min(config.getint("plots", "points_per_pixel"), 100)))
+    config.set("plots", "points_per_pixel", str(max(config.getint("plots", "points_per_pixel"), 1)))
+
+    # MB of prepared plot data kept for recently viewed results
+    try: config.getint('plots', 'curve_cache')
+    except: config.set('plots', 'curve_cache', '256')
+
+    config.set("plots", "curve_cache", str(min(config.getint("plots", "curve_cache"), 8192)))
+    config.set("plots", "curve_cache", str(max(config.getint("plots", "curve_cache"), 16)))
+
+    if not config.has_section("tests"):
+        config.add_section("tests")
+
+    try: config.getboolean('tests', 'restore')
+    except: config.set('tests', 'restore', 'false')
+    # Last imported test definitions, and presets imported since, separated
+    #   by os.pathsep. Restored at start through the definitions cache.
+    if not config.has_option('tests', 'definitions'):
+        config.set('tests', 'definitions', '')
+    if not config.has_option('tests', 'presets'):
+        config.set('tests', 'presets', '')
+
+    if not config.has_section("diagnostics"):
+        config.add_section("diagnostics")
+
+    try: config.getboolean('diagnostics', 'signal_timing')
+    except: config.set('diagnostics', 'signal_timing', 'false')
+
     return config
 
 
+def archivePath(config):
+    # The result archive directory. A relative archive_path is in the per-user
+    #   data directory, not the working directory.
+    return os.path.join(data_path(), os.path.expanduser(
+        config.get("results", "archive_path")))
+
+
 class SettingsDialog(QDialog):
     def __init__(self, *args, **kwargs):
         config = kwargs.pop("config")
@@ -116,7 +201,7 @@ class SettingsDialog(QDialog):
 
         resultsLayout.addWidget(QLabel("Result Limit:"), resultsLayout.rowCount(), 0)
         resultLimit = QSpinBox()
-        resultLimit.setRange(1, 100)
+        resultLimit.setRange(1, 10000)
         resultLimit.setValue(config.getint("results", "result_limit"))
         resultsLayout.addWidget(resultLimit, resultsLayout.rowCount()-1, 1)
 
@@ -125,7 +210,125 @@ class SettingsDialog(QDialog):
 
         resultLimit.valueChanged.connect(setResultLimit)
 
+        resultsLayout.addWidget(QLabel("Archive Results:"), resultsLayout.rowCount(), 0)
+        archive = QCheckBox()
+        archive.setToolTip("Store finished results in {0}, so older results can be browsed.".format(
+            archivePath(config)))
+        archive.setChecked(config.getboolean("results", "archive"))
+        resultsLayout.addWidget(archive, resultsLayout.rowCount()-1, 1)
+
+        def setArchive(enabled):
+            self.__changes[('results', 'archive')] = enabled
+
+        archive.toggled.connect(setArchive)
+
+        resultsLayout.addWidget(QLabel("Archive Limit:"), resultsLayout.rowCount(), 0)
+        archiveLimit = QSpinBox()
+        archiveLimit.setRange(1, 100000)
+        archiveLimit.setValue(config.getint("results", "archive_limit"))
+        archiveLimit.setToolTip("Oldest archived results are removed beyond this number.")
+        resultsLayout.addWidget(archiveLimit, resultsLayout.rowCount()-1, 1)
+
+        def setArchiveLimit(lim):
+            self.__changes[('results', 'archive_limit')] = lim
+
+        archiveLimit.valueChanged.connect(setArchiveLimit)
+
         layout.addLayout(resultsLayout)
+
+        ''' PLOTS '''
+        layout.addWidget(QLabel("Plots:"))
+
+        plotsLayout = QGridLayout()
+        plotsLayout.setContentsMargins(15, 0, 0, 5)
+
+        plotsLayout.addWidget(QLabel("Live Plotting:"), plotsLayout.rowCount(), 0)
+        livePlot = QCheckBox()
+        livePlot.setChecked(config.getboolean("plots", "live_plot"))
+        plotsLayout.addWidget(livePlot, plotsLayout.rowCount()-1, 1)
+
+        def setLivePlot(live):
+            self.__changes[('plots', 'live_plot')] = live
+
+        livePlot.toggled.connect(setLivePlot)
+
+        plotsLayout.addWidget(QLabel("Live Update Rate (Hz):"), plotsLayout.rowCount(), 0)
+        liveRate = QSpinBox()
+        liveRate.setRange(1, 60)
+        liveRate.setValue(config.getint("plots", "live_rate"))
+        plotsLayout.addWidget(liveRate, plotsLayout.rowCount()-1, 1)
+
+        def setLiveRate(rate):
+            self.__changes[('plots', 'live_rate')] = rate
+
+        liveRate.valueChanged.connect(setLiveRate)
+
+        plotsLayout.addWidget(QLabel("Downsampling:"), plotsLayout.rowCount(), 0)
+        downsample = QComboBox()
+        downsample.addItems(DOWNSAMPLE_MODES.values())
+        downsample.setCurrentIndex(
+            list(DOWNSAMPLE_MODES).index(config.get("plots", "downsample")))
+        plotsLayout.addWidget(downsample, plotsLayout.rowCount()-1, 1)
+
+        def setDownsample(idx):
+            self.__changes[('plots', 'downsample')] = list(DOWNSAMPLE_MODES)[idx]
+
+        downsample.currentIndexChanged.connect(setDownsample)
+
+        plotsLayout.addWidget(QLabel("Points per Pixel:"), plotsLayout.rowCount(), 0)
+        pointsPerPixel = QSpinBox()
+        pointsPerPixel.setRange(1, 100)
+        pointsPerPixel.setValue(config.getint("plots", "points_per_pixel"))
+        plotsLayout.addWidget(pointsPerPixel, plotsLayout.rowCount()-1, 1)
+
+        def setPointsPerPixel(ppp):
+            self.__changes[('plots', 'points_per_pixel')] = ppp
+
+        pointsPerPixel.valueChanged.connect(setPointsPerPixel)
+
+        plotsLayout.addWidget(QLabel("Clip to View:"), plotsLayout.rowCount(), 0)
+        clipToView = QCheckBox()
+        clipToView.setChecked(config.getboolean("plots", "clip_to_view"))
+        plotsLayout.addWidget(clipToView, plotsLayout.rowCount()-1, 1)
+
+        def setClipToView(clip):
+            self.__changes[('plots', 'clip_to_view')] = clip
+
+        clipToView.toggled.connect(setClipToView)
+
+        plotsLayout.addWidget(QLabel("Plot Cache (MB):"), plotsLayout.rowCount(), 0)
+        curveCache = QSpinBox()
+        curveCache.setRange(16, 8192)
+        curveCache.setSingleStep(64)
+        curveCache.setValue(config.getint("plots", "curve_cache"))
+        curveCache.setToolTip("Memory used to keep recently viewed plots ready")
+        plotsLayout.addWidget(curveCache, plotsLayout.rowCount()-1, 1)
+
+        def setCurveCache(size):
+            self.__changes[('plots', 'curve_cache')] = size
+
+        curveCache.valueChanged.connect(setCurveCache)
+
+        layout.addLayout(plotsLayout)
+
+        ''' TESTS '''
+        layout.addWidget(QLabel("Tests:"))
+
+        testsLayout = QGridLayout()
+        testsLayout.setContentsMargins(15, 0, 0, 5)
+
+        testsLayout.addWidget(QLabel("Restore Imported Tests:"), testsLayout.rowCount(), 0)
+        restoreTests = QCheckBox()
+        restoreTests.setToolTip("Load the last imported test definitions and presets at start.")
+        restoreTests.setChecked(config.getboolean("tests", "restore"))
+        testsLayout.addWidget(restoreTests, testsLayout.rowCount()-1, 1)
+
+        def setRestoreTests(restore):
+            self.__changes[('tests', 'restore')] = restore
+
+        restoreTests.toggled.connect(setRestoreTests)
+
+        layout.addLayout(testsLayout)
         layout.addWidget(buttonBox)
         self.setLayout(layout)
 
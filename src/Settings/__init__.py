@@ -1 +1 @@
-from .Settings import LoadConfig, SettingsDialog
+from .Settings import LoadConfig, SettingsDialog, archivePath
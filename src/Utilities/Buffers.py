@@ -0,0 +1,55 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -SeriesBuffer
+
+A growable, contiguous numpy array. Appending is amortized O(1) by doubling
+    the allocated capacity, and `data` is a view of the filled region, so
+    readers (e.g. pyqtgraph) never receive a copy of the whole series.
+
+ToDo:
+
+'''
+import numpy as np
+
+
+class SeriesBuffer(object):
+
+    def __init__(self, dtype=np.float64, capacity=1024):
+        self.__data = np.empty(max(int(capacity), 1), dtype=dtype)
+        self.__size = 0
+
+    def __len__(self):
+        return self.__size
+
+    @property
+    def data(self):
+        return self.__data[:self.__size]
+
+    @property
+    def capacity(self):
+        return len(self.__data)
+
+    def reserve(self, capacity):
+        if capacity <= len(self.__data):
+            return
+        data = np.empty(max(capacity, 2 * len(self.__data)),
+                        dtype=self.__data.dtype)
+        data[:self.__size] = self.__data[:self.__size]
+        self.__data = data
+
+    def append(self, value):
+        self.reserve(self.__size + 1)
+        self.__data[self.__size] = value
+        self.__size += 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self.__data.dtype)
+        end = self.__size + len(values)
+        self.reserve(end)
+        self.__data[self.__size:end] = values
+        self.__size = end
+
+    def clear(self):
+        self.__size = 0
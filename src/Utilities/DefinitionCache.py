@@ -0,0 +1,202 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -acestatpyVersion
+    -DefinitionCache
+
+Parsed test definitions, stored by the files they were read from.
+
+ACEstatPy parses its bundled definitions as it is created, importing a
+    definitions file parses its XML, and each custom preset reads a JSON
+    file. DefinitionCache applies a test file and presets to ACEstatPy's
+    Definitions once, then pickles the Definitions, i.e. the techniques with
+    their parameters, outputs, plots and presets. While none of the files has
+    changed (path, size and modification time) and the same ACEstatPy version
+    is installed, they are restored from the pickle instead. Only the most
+    recent set of files is kept, no files at all being the bundled
+    definitions. If the definitions can not be pickled, or the ACEstatPy
+    version is unknown, they are always parsed.
+
+create restores them before ACEstatPy would parse its own: while ACEstatPy
+    is created, the Definitions class in its module is replaced by one that
+    returns the restored object. The class is found by identity, from the
+    object that was pickled. If ACEstatPy doesn't use it, or only the tests
+    could be pickled, the bundled definitions are parsed and the cached tests
+    put in their place. That, and load, replace the tests of an existing
+    Definitions, which needs a dict, as ACEstatPy's Definitions is. Anything
+    else is always parsed.
+
+The file starts with a JSON line holding the key, which is compared before
+    anything is unpickled. The cache belongs in the per-user data directory,
+    pickles must not be loaded from elsewhere.
+
+ToDo:
+
+'''
+import json
+import os
+import pickle
+import sys
+
+
+def acestatpyVersion():
+    # Installed ACEstatPy version, None if unknown
+    try:
+        from importlib.metadata import version
+        return version("acestatpy")
+    except Exception:
+        pass
+    try:
+        import acestatpy
+        return getattr(acestatpy, "__version__", None)
+    except ImportError:
+        return None
+
+
+class DefinitionCache(object):
+    # Changed when the stored layout changes
+    Format = 3
+    # Longest header line read before giving up on a file
+    HeaderLimit = 1 << 16
+
+    def __init__(self, path):
+        # path: The cache file, e.g. in Utilities.data_path()
+        self.path = path
+
+    def __key(self, tests, presets):
+        # What the result depends on, as stored in the header. Raises if a
+        #   file is missing.
+        files = [("preset", p) for p in presets]
+        if tests:
+            files.insert(0, ("tests", tests))
+        sources = []
+        for kind, path in files:
+            path = os.path.abspath(path)
+            stat = os.stat(path)
+            sources.append([kind, path, stat.st_size, stat.st_mtime_ns])
+        return {"format": self.Format, "acestatpy": acestatpyVersion(),
+                "sources": sources}
+
+    def __header(self):
+        # Key stored in the cache file, None if missing or not a header
+        try:
+            with open(self.path, "rb") as f:
+                return json.loads(f.readline(self.HeaderLimit))
+        except (OSError, ValueError):
+            return None
+
+    def __restore(self, key):
+        # Stored ("object", Definitions) or ("items", tests), None unless the
+        #   key matches and it could be read.
+        if key["acestatpy"] is None or self.__header() != key:
+            return None
+        try:
+            with open(self.path, "rb") as f:
+                f.readline(self.HeaderLimit)
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    @staticmethod
+    def __creating(factory, definitions):
+        # factory(), with definitions in place of any Definitions created
+        #   meanwhile. None if the class isn't in the factory's module. Only
+        #   one thread may create ACEstatPy at a time.
+        cls = type(definitions)
+        module = sys.modules.get(getattr(factory, "__module__", None))
+        names = [n for n, v in vars(module).items() if v is cls] if module else []
+        if not names:
+            return None
+
+        class Restored(cls):
+            # definitions is not a Restored, so its __init__ isn't called
+            def __new__(c, *args, **kwargs):
+                return definitions
+
+        for n in names:
+            setattr(module, n, Restored)
+        try:
+            return factory()
+        finally:
+            for n in names:
+                setattr(module, n, cls)
+
+    def create(self, factory, tests=None, presets=()):
+        # Creates factory(), i.e. ACEstatPy, and applies a test definitions
+        #   file, then custom presets, to its Definitions. Returns it and the
+        #   exception raised reading tests or presets, if any. If a file is
+        #   missing only the bundled definitions are used.
+        try:
+            key = self.__key(tests, presets)
+        except OSError as e:
+            instance, error = self.create(factory)
+            return instance, error or e
+        state = self.__restore(key)
+        instance = None
+        if state is not None and state[0] == "object":
+            try:
+                instance = self.__creating(factory, state[1])
+            except TypeError:
+                # Can't be subclassed
+                pass
+            if instance is not None and instance.Definitions is state[1]:
+                return instance, None
+        if instance is None:
+            instance = factory()
+        try:
+            self.load(instance.Definitions, tests, presets)
+        except Exception as e:
+            return instance, e
+        return instance, None
+
+    def load(self, definitions, tests=None, presets=()):
+        # Applies a test definitions file, then custom presets, in order, to
+        #   definitions. Returns True if they were restored from the cache,
+        #   which replaces the items of definitions, a dict.
+        state = self.__restore(self.__key(tests, presets))
+        if state is not None and isinstance(definitions, dict):
+            kind, stored = state
+            definitions.clear()
+            definitions.update(stored.items() if kind == "object" else stored)
+            return True
+        if tests:
+            definitions.importTests(tests)
+        for p in presets:
+            definitions.loadCustomPreset(p)
+        self.save(definitions, tests, presets)
+        return False
+
+    def save(self, definitions, tests=None, presets=()):
+        # Stores definitions as the result of the files, e.g. after another
+        #   preset has been loaded. If the Definitions object can't be
+        #   pickled, only its tests are stored, with their presets.
+        try:
+            key = self.__key(tests, presets)
+            if key["acestatpy"] is None:
+                raise Exception("Unknown ACEstatPy version")
+            try:
+                data = pickle.dumps(("object", definitions),
+                                    protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                data = pickle.dumps(("items", dict(definitions.items())),
+                                    protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            self.clear()
+            return False
+        tmp = "{0}.tmp".format(self.path)
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(json.dumps(key).encode() + b"\n")
+                f.write(data)
+            os.replace(tmp, self.path)
+        except OSError:
+            return False
+        return True
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
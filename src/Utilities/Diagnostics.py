@@ -0,0 +1,67 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -LatencyHistogram
+
+Fixed-size, log-spaced histogram of durations. Recording is O(1) and memory
+    does not grow with the number of samples; percentiles are accurate to the
+    bucket width (~12%).
+
+ToDo:
+
+'''
+from math import log10
+
+
+class LatencyHistogram(object):
+    # Buckets from 1 us to 100 s
+    Min = 1e-6
+    PerDecade = 20
+    Decades = 8
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.__counts = [0] * (self.PerDecade * self.Decades + 2)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        if seconds <= self.Min:
+            i = 0
+        else:
+            i = min(int(log10(seconds / self.Min) * self.PerDecade) + 1,
+                    len(self.__counts) - 1)
+        self.__counts[i] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p):
+        # Upper edge of the bucket containing the p-th percentile, in seconds
+        if not self.count:
+            return None
+        target = p / 100.0 * self.count
+        cumulative = 0
+        for i, c in enumerate(self.__counts):
+            cumulative += c
+            if c and cumulative >= target:
+                if i == len(self.__counts) - 1:
+                    # Longer than the last bucket, which has no upper edge
+                    return self.max
+                return min(self.Min * 10 ** (i / self.PerDecade), self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "max": self.max if self.count else None,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
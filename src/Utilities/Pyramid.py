@@ -0,0 +1,125 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -MinMaxPyramid
+
+Min/max level-of-detail pyramid of a series, for drawing long series at a
+    cost that depends on the number of pixels rather than samples.
+
+Level k holds the minimum and maximum of each bin of Factor**(k+1) samples,
+    built from the level below. Only complete bins are stored, so a growing
+    series only adds bins for its new samples. select() picks the coarsest
+    level that still has enough bins for the requested number of points and
+    returns the visible bins as (max, min) pairs, as pyqtgraph's peak
+    downsampling does. x must be non-decreasing, otherwise monotonic is False
+    and nothing is built.
+
+ToDo:
+
+'''
+import numpy as np
+# Local
+from .Buffers import SeriesBuffer
+
+
+class MinMaxPyramid(object):
+    # Samples per bin of a level, relative to the level below
+    Factor = 4
+
+    def __init__(self):
+        # [(mins, maxs)] of each level, as SeriesBuffers
+        self.__levels = []
+        self.__size = 0
+        self.monotonic = True
+
+    def __len__(self):
+        # Samples covered
+        return self.__size
+
+    @property
+    def nbytes(self):
+        return sum(mins.capacity * mins.data.itemsize * 2
+                   for mins, maxs in self.__levels)
+
+    def levels(self):
+        return len(self.__levels)
+
+    def reset(self):
+        self.__levels = []
+        self.__size = 0
+        self.monotonic = True
+
+    def update(self, x, y):
+        # x, y: The whole series. Samples already covered must not have
+        #   changed since the last update, if there are fewer it starts over.
+        n = min(len(x), len(y))
+        if n < self.__size:
+            self.reset()
+        if n == self.__size or not self.monotonic:
+            self.__size = n
+            return
+        start = max(self.__size - 1, 0)
+        if n - start > 1 and not np.all(x[start + 1:n] >= x[start:n - 1]):
+            # Also fails on NaN
+            self.monotonic = False
+            self.__levels = []
+            self.__size = n
+            return
+        F = self.Factor
+        lowMin = lowMax = np.asarray(y[:n], dtype=np.float64)
+        level = 0
+        while len(lowMin) >= F:
+            if level == len(self.__levels):
+                self.__levels.append((SeriesBuffer(), SeriesBuffer()))
+            mins, maxs = self.__levels[level]
+            done = len(mins)
+            count = len(lowMin) // F
+            if count > done:
+                # NaN is ignored, unless the whole bin is NaN
+                mins.extend(np.fmin.reduce(
+                    lowMin[done * F:count * F].reshape(-1, F), axis=1))
+                maxs.extend(np.fmax.reduce(
+                    lowMax[done * F:count * F].reshape(-1, F), axis=1))
+            lowMin, lowMax = mins.data, maxs.data
+            level += 1
+        self.__size = n
+
+    def select(self, x, y, left, right, points):
+        # Returns x and y to draw the samples between left and right with at
+        #   least points values, and at most Factor times as many. x and y are
+        #   the series given to update.
+        n = self.__size
+        x, y = x[:n], y[:n]
+        i0 = max(int(np.searchsorted(x, left)) - 1, 0)
+        i1 = min(int(np.searchsorted(x, right, side="right")) + 1, n)
+        if i1 <= i0:
+            return x[:0], y[:0]
+        # Samples per point, each bin is drawn with two points
+        ds = 2 * (i1 - i0) / max(points, 1)
+        level = -1
+        size = 1
+        while level + 1 < len(self.__levels) and size * self.Factor <= ds:
+            level += 1
+            size *= self.Factor
+        if level < 0:
+            return x[i0:i1], y[i0:i1]
+        mins, maxs = self.__levels[level]
+        mins, maxs = mins.data, maxs.data
+        b0 = i0 // size
+        b1 = min(-(-i1 // size), len(mins))
+        yMin = mins[b0:b1]
+        yMax = maxs[b0:b1]
+        centers = np.arange(b0, b1) * size + size // 2
+        tail = max(b1 * size, i0)
+        if tail < i1:
+            # Samples after the last complete bin, drawn as one more bin
+            yMin = np.append(yMin, np.fmin.reduce(y[tail:i1]))
+            yMax = np.append(yMax, np.fmax.reduce(y[tail:i1]))
+            centers = np.append(centers, (tail + i1 - 1) // 2)
+        xOut = np.empty(2 * len(centers))
+        xOut[0::2] = xOut[1::2] = x[centers]
+        yOut = np.empty(2 * len(centers))
+        yOut[0::2] = yMax
+        yOut[1::2] = yMin
+        return xOut, yOut
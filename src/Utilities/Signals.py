@@ -1,5 +1,5 @@
 '''
-    Last Modified: 2021-04-27
+    Last Modified: 2026-10-18
 
     @author: Jesse M. Barr
 
@@ -14,17 +14,51 @@
 
     This also works with args and kwargs, where pyqtSignal by itself can only
         use args.
+
+    Changes:
+        -2026-10-18:
+            -Added an optional batching mode. Events are collected in a deque
+                on the emitting thread and delivered to the callback as a
+                list, at most `rate` times per second, so high frequency
+                signals do not queue one Qt event each.
+            -Events are passed as an (args, kwargs) tuple instead of a dict.
+            -Added optional instrumentation. Events are timestamped when
+                emitted, and the time spent waiting in the Qt event queue
+                (latency) and running the callback (duration) are recorded
+                in histograms. See SignalTranslator.diagnostics().
+            -Events are numbered as they are emitted. Batched events are
+                delivered up to the next event waiting to be delivered without
+                batching, and the rest after it, so callbacks see events in
+                emitted order, e.g. a sent command before its response.
 '''
-from PyQt5.QtCore import QObject, pyqtSignal as Signal
+from collections import deque
+from itertools import count
+from time import perf_counter
+from weakref import WeakSet
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal as Signal
 from acestatpy import Signal as ACEstatSignal
+# Local
+from .Diagnostics import LatencyHistogram
 
 
 class SignalTranslator(QObject):
     __signal = Signal(object)
     __acestatSig = None
     __callback = None
+    # All live translators, for diagnostics
+    __instances = WeakSet()
+    # Default for new translators, see setInstrumentation()
+    __instrumentAll = False
+    # Numbers events in emitted order, next() is atomic
+    __sequence = count()
 
-    def __init__(self, acestatSig, callback):
+    def __init__(self, acestatSig, callback, batch=False, rate=30,
+                 maxQueued=None, name=None):
+        # batch: If True, callback receives a list of (args, kwargs) tuples.
+        # rate: Maximum number of batches delivered per second.
+        # maxQueued: Oldest events are dropped when more than this many are
+        #   waiting to be delivered. Unlimited if None.
+        # name: Used in diagnostics, defaults to the callback's name.
         if not isinstance(acestatSig, ACEstatSignal):
             raise Exception("Expected a ACEstatPy Signal object.")
         elif not callable(callback):
@@ -33,28 +67,200 @@ class SignalTranslator(QObject):
 
         self.__acestatSig = acestatSig
         self.__callback = callback
+        self.__batch = batch
+        # Numbers of events emitted but not delivered yet, without batching
+        self.__waiting = deque()
+        self.__queued = 0
+        self.__delivered = 0
+        self.__dropped = 0
+        self.name = name or getattr(callback, "__name__", repr(callback))
+        self.__instrumented = SignalTranslator.__instrumentAll
+        self.__latency = LatencyHistogram()
+        self.__duration = LatencyHistogram()
+        SignalTranslator.__instances.add(self)
+
+        if batch:
+            # deque.append/popleft are atomic, no lock is needed between the
+            #   emitting thread and the GUI thread.
+            self.__queue = deque(maxlen=maxQueued)
+            self.__pending = False
+            self.__batchStart = 0.0
+            self.__interval = 1.0 / max(rate, 1)
+            self.__lastDelivery = 0.0
+            self.__timer = QTimer(self)
+            self.__timer.setSingleShot(True)
+            self.__timer.timeout.connect(
+                lambda: self.__fnDeliver(SignalTranslator.__nextWaiting()))
+            self.__receiver = self.__fnDrain
+            self.__sender = self.__fnBatch
+        else:
+            self.__receiver = self.__fnCall
+            self.__sender = self.__fnSignal
 
-        self.__signal.connect(self.__fnCall)
-        self.__acestatSig.connect(self.__fnSignal, weak=False)
+        self.__signal.connect(self.__receiver)
+        self.__acestatSig.connect(self.__sender, weak=False)
 
     def __fnCall(self, data):
-        if not self.__callback:
-            return
-        return self.__callback(*data["args"], **data["kwargs"])
+        # Batched events emitted before this one are delivered first, the
+        #   ones emitted after it once it has been delivered.
+        #   Its number is removed whatever happens, or it would hold back
+        #   every batch. Not always the oldest, signals emitted on the GUI
+        #   thread are delivered at once, ahead of queued ones.
+        try:
+            SignalTranslator.flush(data[2])
+        finally:
+            self.__waiting.remove(data[2])
+        try:
+            if not self.__callback:
+                return
+            self.__delivered += 1
+            if len(data) < 4:
+                return self.__callback(*data[0], **data[1])
+            # Instrumented, data includes the time it was emitted.
+            start = perf_counter()
+            self.__latency.add(start - data[3])
+            try:
+                return self.__callback(*data[0], **data[1])
+            finally:
+                self.__duration.add(perf_counter() - start)
+        finally:
+            SignalTranslator.flush()
 
     def __fnSignal(self, *args, **kwargs):
         # ACEstatPy signals include the signal name and sender, which we don't
         #   need.
         kwargs.pop("sender", None)
         kwargs.pop("signal", None)
-        self.__signal.emit({
-            "args": args,
-            "kwargs": kwargs
-        })
+        self.__queued += 1
+        seq = next(SignalTranslator.__sequence)
+        self.__waiting.append(seq)
+        if self.__instrumented:
+            self.__signal.emit((args, kwargs, seq, perf_counter()))
+        else:
+            self.__signal.emit((args, kwargs, seq))
+
+    def __fnBatch(self, *args, **kwargs):
+        # Runs on the emitting thread
+        kwargs.pop("sender", None)
+        kwargs.pop("signal", None)
+        queue = self.__queue
+        if queue.maxlen is not None and len(queue) >= queue.maxlen:
+            self.__dropped += 1
+        queue.append((next(SignalTranslator.__sequence), (args, kwargs)))
+        self.__queued += 1
+        if not self.__pending:
+            # Only one Qt event is queued until the batch is delivered
+            self.__pending = True
+            self.__batchStart = perf_counter()
+            self.__signal.emit(None)
+
+    def __fnDrain(self, data):
+        # Runs on the GUI thread, delays delivery to respect the rate.
+        wait = self.__interval - (perf_counter() - self.__lastDelivery)
+        if wait > 0:
+            if not self.__timer.isActive():
+                self.__timer.start(int(wait * 1000) + 1)
+            return
+        self.__fnDeliver(SignalTranslator.__nextWaiting())
+
+    def __fnDeliver(self, before=None):
+        # before: Only events numbered lower are delivered, the rest stay
+        #   pending until the event numbered before has been delivered.
+        queue = self.__queue
+        if before is None:
+            self.__timer.stop()
+            # Reset before draining, anything added from here on queues
+            #   another event, so nothing is left behind.
+            self.__pending = False
+            batch = [queue.popleft()[1] for i in range(len(queue))]
+        else:
+            batch = []
+            while queue and queue[0][0] < before:
+                batch.append(queue.popleft()[1])
+        if not batch or not self.__callback:
+            return
+        start = self.__lastDelivery = perf_counter()
+        self.__delivered += len(batch)
+        if not self.__instrumented:
+            return self.__callback(batch)
+        # Latency of a batch is measured from its oldest event
+        self.__latency.add(start - self.__batchStart)
+        try:
+            return self.__callback(batch)
+        finally:
+            self.__duration.add(perf_counter() - start)
+
+    def stats(self):
+        # Event counters, dropped is only non-zero in batch mode
+        return {
+            "queued": self.__queued,
+            "delivered": self.__delivered,
+            "dropped": self.__dropped,
+        }
+
+    def isInstrumented(self):
+        return self.__instrumented
+
+    def setInstrumented(self, enabled=True):
+        self.__instrumented = enabled
+
+    def timing(self):
+        # Latency and callback duration summaries, in seconds
+        return {
+            "latency": self.__latency.summary(),
+            "duration": self.__duration.summary(),
+        }
+
+    def resetStats(self):
+        self.__queued = 0
+        self.__delivered = 0
+        self.__dropped = 0
+        self.__latency.reset()
+        self.__duration.reset()
+
+    @classmethod
+    def __nextWaiting(cls):
+        # Number of the oldest event waiting to be delivered without batching,
+        #   None if there is none. Only the GUI thread removes numbers.
+        waiting = [t.__waiting[0] for t in list(cls.__instances) if t.__waiting]
+        return min(waiting) if waiting else None
+
+    @classmethod
+    def flush(cls, before=None):
+        # Delivers batched events, on the GUI thread, up to the next event
+        #   waiting to be delivered without batching, or before, if lower.
+        waiting = cls.__nextWaiting()
+        if before is None or (waiting is not None and waiting < before):
+            before = waiting
+        for t in list(cls.__instances):
+            if t.__batch and t.__queue and (before is None or t.__queue[0][0] < before):
+                t.__fnDeliver(before)
+
+    @classmethod
+    def instances(cls):
+        return list(cls.__instances)
+
+    @classmethod
+    def setInstrumentation(cls, enabled=True):
+        # Enable/disable instrumentation for all current and new translators
+        cls.__instrumentAll = enabled
+        for t in cls.__instances:
+            t.setInstrumented(enabled)
+
+    @classmethod
+    def diagnostics(cls):
+        # Machine-readable dump of every translator
+        return [{
+            "name": t.name,
+            "batch": t.__batch,
+            "instrumented": t.__instrumented,
+            **t.stats(),
+            **t.timing(),
+        } for t in sorted(cls.__instances, key=lambda t: t.name)]
 
     def disconnect(self):
-        self.__acestatSig.disconnect(self.__fnSignal)
-        self.__signal.disconnect(self.__fnCall)
+        self.__acestatSig.disconnect(self.__sender)
+        self.__signal.disconnect(self.__receiver)
 
     def __del__(self):
         try:
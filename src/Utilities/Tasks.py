@@ -0,0 +1,39 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -BackgroundTask
+
+Runs a function on a worker thread and delivers its result, or the exception
+    it raised, on the GUI thread with sigDone or sigError. Used for start up
+    work that does not touch Qt, e.g. loading definitions or listing ports.
+
+ToDo:
+
+'''
+from threading import Thread
+from PyQt5.QtCore import QObject, pyqtSignal as Signal
+
+
+class BackgroundTask(QObject):
+    # Return value of the function
+    sigDone = Signal(object)
+    # Exception raised by the function
+    sigError = Signal(object)
+
+    def __init__(self, func, *args, parent=None, **kwargs):
+        super().__init__(parent)
+        self.__func = func
+        self.__args = args
+        self.__kwargs = kwargs
+
+    def start(self):
+        Thread(target=self.__run, name="BackgroundTask", daemon=True).start()
+
+    def __run(self):
+        try:
+            result = self.__func(*self.__args, **self.__kwargs)
+        except Exception as e:
+            self.sigError.emit(e)
+        else:
+            self.sigDone.emit(result)
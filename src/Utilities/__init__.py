@@ -1,2 +1,7 @@
+from .Buffers import SeriesBuffer
+from .DefinitionCache import DefinitionCache
+from .Diagnostics import LatencyHistogram
+from .Pyramid import MinMaxPyramid
 from .Signals import SignalTranslator
-from ._utils import resource_path
+from .Tasks import BackgroundTask
+from ._utils import data_path, resource_path
@@ -1,5 +1,7 @@
 import sys
 from os.path import join, dirname, realpath
+from tempfile import gettempdir
+from PyQt5.QtCore import QStandardPaths
 
 def resource_path(*args):
     fpath = "resources"
@@ -8,3 +10,11 @@ def resource_path(*args):
     if hasattr(sys, '_MEIPASS'):
         return join(sys._MEIPASS, fpath)
     return join(dirname(realpath(__file__)), '..', '..', fpath)
+
+
+def data_path(*args):
+    # Per-user data directory of the application, independent of the working
+    #   directory. Not created here.
+    fpath = QStandardPaths.writableLocation(
+        QStandardPaths.GenericDataLocation) or gettempdir()
+    return join(fpath, "ACEstatGUI", *args)
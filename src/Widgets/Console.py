@@ -0,0 +1,98 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -Console
+
+A read-only QPlainTextEdit that buffers written text and inserts it once per
+    frame, instead of re-laying out the document for every serial message.
+    Pending text is bounded by the maximum block count, since older lines
+    would be discarded by the document anyway.
+
+GUI-thread time under a message flood is measured by benchmarks/console.py.
+
+ToDo:
+
+'''
+from collections import deque
+from time import perf_counter
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QTextCursor
+from PyQt5.QtWidgets import QPlainTextEdit
+
+
+class Console(QPlainTextEdit):
+
+    def __init__(self, rate=30, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.setReadOnly(True)
+        self.__pending = deque()
+        self.__pendingLines = 0
+        self.__flushes = 0
+        self.__flushTime = 0.0
+        self.__written = 0
+        self.__dropped = 0
+        self.__timer = QTimer(self)
+        self.__timer.setSingleShot(True)
+        self.__timer.timeout.connect(self.flush)
+        self.setRate(rate)
+
+    def setRate(self, rate):
+        # Maximum number of inserts per second
+        self.__timer.setInterval(int(1000 / max(1, rate)))
+
+    def write(self, text):
+        if not text:
+            return
+        self.__pending.append(text)
+        self.__pendingLines += text.count("\n")
+        self.__written += len(text)
+        limit = self.maximumBlockCount()
+        # Drop whole chunks that can no longer be displayed
+        while limit > 0 and len(self.__pending) > 1 \
+                and self.__pendingLines - self.__pending[0].count("\n") >= limit:
+            dropped = self.__pending.popleft()
+            self.__pendingLines -= dropped.count("\n")
+            self.__dropped += len(dropped)
+        if not self.__timer.isActive():
+            self.__timer.start()
+
+    def flush(self):
+        self.__timer.stop()
+        if not self.__pending:
+            return
+        start = perf_counter()
+        text = "".join(self.__pending)
+        self.__pending.clear()
+        self.__pendingLines = 0
+        limit = self.maximumBlockCount()
+        if limit > 0 and text.count("\n") > limit:
+            # The document would discard the older lines anyway
+            text = "\n".join(text.split("\n")[-(limit + 1):])
+
+        scrollBar = self.verticalScrollBar()
+        follow = scrollBar.value() == scrollBar.maximum()
+        # Always append at the end, regardless of the user's cursor.
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+        if follow:
+            scrollBar.setValue(scrollBar.maximum())
+
+        self.__flushes += 1
+        self.__flushTime += perf_counter() - start
+
+    def clear(self):
+        self.__timer.stop()
+        self.__pending.clear()
+        self.__pendingLines = 0
+        super().clear()
+
+    def stats(self):
+        # Counters since creation; flush_time is GUI-thread seconds.
+        return {
+            "written": self.__written,
+            "dropped": self.__dropped,
+            "flushes": self.__flushes,
+            "flush_time": self.__flushTime,
+        }
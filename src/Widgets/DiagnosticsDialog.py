@@ -0,0 +1,100 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -DiagnosticsDialog
+
+Shows event counters and, when signal timing is enabled, the latency (time
+    spent in the Qt event queue) and callback duration percentiles of every
+    SignalTranslator. The same data can be saved as JSON.
+
+ToDo:
+
+'''
+import json
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtWidgets import (QDialog, QTableWidget, QTableWidgetItem,
+                             QVBoxLayout, QHBoxLayout, QPushButton, QCheckBox,
+                             QHeaderView, QFileDialog)
+# Local
+from Utilities import SignalTranslator
+
+
+class DiagnosticsDialog(QDialog):
+    Columns = ["Signal", "Queued", "Delivered", "Dropped",
+               "Latency p50", "p95", "p99", "Callback p50", "p95", "p99"]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.setWindowTitle("Signal Diagnostics")
+        self.initUI()
+        self.refresh()
+        self.resize(750, 300)
+
+    def initUI(self):
+        layout = QVBoxLayout()
+
+        self.__table = QTableWidget(0, len(self.Columns))
+        self.__table.setHorizontalHeaderLabels(self.Columns)
+        self.__table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.__table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.__table.verticalHeader().setVisible(False)
+        layout.addWidget(self.__table)
+
+        hLayout = QHBoxLayout()
+        self.__timing = QCheckBox("Record timing")
+        self.__timing.setChecked(any(
+            t.isInstrumented() for t in SignalTranslator.instances()))
+        self.__timing.toggled.connect(SignalTranslator.setInstrumentation)
+        hLayout.addWidget(self.__timing)
+        hLayout.addStretch()
+
+        btnReset = QPushButton("Reset")
+        btnReset.clicked.connect(self.reset)
+        hLayout.addWidget(btnReset)
+
+        btnSave = QPushButton("Save JSON")
+        btnSave.clicked.connect(self.save)
+        hLayout.addWidget(btnSave)
+
+        btnClose = QPushButton("Close")
+        btnClose.clicked.connect(self.close)
+        hLayout.addWidget(btnClose)
+        layout.addLayout(hLayout)
+        self.setLayout(layout)
+
+        self.__timer = QTimer(self)
+        self.__timer.timeout.connect(self.refresh)
+        self.__timer.start(1000)
+
+    @property
+    def timingEnabled(self):
+        return self.__timing.isChecked()
+
+    def refresh(self):
+        def ms(v):
+            return "" if v is None else "{0:.3f} ms".format(1000 * v)
+
+        rows = SignalTranslator.diagnostics()
+        self.__table.setRowCount(len(rows))
+        for r, d in enumerate(rows):
+            values = [d["name"], d["queued"], d["delivered"], d["dropped"]]
+            for k in ("latency", "duration"):
+                values += [ms(d[k][p]) for p in ("p50", "p95", "p99")]
+            for c, v in enumerate(values):
+                item = QTableWidgetItem("{0}".format(v))
+                if c:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.__table.setItem(r, c, item)
+
+    def reset(self):
+        for t in SignalTranslator.instances():
+            t.resetStats()
+        self.refresh()
+
+    def save(self):
+        fpath = QFileDialog.getSaveFileName(
+            self, "Save Diagnostics", filter="JSON (*.json)")
+        if fpath[0]:
+            with open(fpath[0], "w") as f:
+                json.dump(SignalTranslator.diagnostics(), f, indent=2)
@@ -0,0 +1,196 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -ExpandingDelegate
+    -ExpandedHeader
+    -ExpandingListView
+
+List view for long lists of collapsible entries. Collapsed rows are only
+    painted by ExpandingDelegate: an expand arrow, the display text and, right
+    aligned, the InfoRole text. Clicking a row creates its detail widget with
+    the view's factory and shows it in place of the row; it is deleted when
+    the row is collapsed or removed, so widgets only exist for expanded rows.
+
+ToDo:
+
+'''
+from PyQt5.QtCore import Qt, QEvent, QSize, QModelIndex, QPersistentModelIndex
+from PyQt5.QtGui import QColor, QPalette
+from PyQt5.QtWidgets import (QFrame, QListView, QStyledItemDelegate, QStyle,
+                             QAbstractItemView, QToolButton, QSizePolicy,
+                             QHBoxLayout, QLabel)
+# Local
+from .Formatting import ElideLabel
+from .Images import Pixmap
+
+
+class ExpandingDelegate(QStyledItemDelegate):
+    # Right aligned text of a collapsed row
+    InfoRole = Qt.UserRole + 1
+    Margin = 4
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__imgExpand = Pixmap("light:plus.png", QColor("white"))
+
+    def paint(self, painter, option, index):
+        if self.parent().isExpanded(index):
+            # Covered by the detail widget
+            return
+        self.initStyleOption(option, index)
+        widget = option.widget
+        style = widget.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, widget)
+
+        rect = option.rect.adjusted(self.Margin, 0, -self.Margin, 0)
+        img = self.__imgExpand
+        painter.drawPixmap(rect.left(),
+                           rect.top() + (rect.height() - img.height()) // 2, img)
+        rect.setLeft(rect.left() + img.width() + self.Margin)
+
+        painter.save()
+        painter.setPen(option.palette.color(QPalette.Text))
+        info = index.data(self.InfoRole)
+        if info:
+            infoWidth = option.fontMetrics.horizontalAdvance(info) + self.Margin
+            painter.drawText(rect, Qt.AlignVCenter | Qt.AlignRight, info)
+            rect.setRight(rect.right() - infoWidth)
+        painter.drawText(rect, Qt.AlignVCenter | Qt.AlignLeft,
+                         option.fontMetrics.elidedText(
+                             option.text, Qt.ElideRight, rect.width()))
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        widget = self.parent().indexWidget(index)
+        if widget is not None:
+            return QSize(option.rect.width(), widget.sizeHint().height())
+        height = max(option.fontMetrics.height(),
+                     self.__imgExpand.height()) + 2 * self.Margin
+        return QSize(option.rect.width(), height)
+
+
+class ExpandedHeader(QToolButton):
+    # Top of a detail widget, matches the collapsed row. Click to collapse.
+
+    def __init__(self, title, info="", *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.setStyleSheet("border: none;")
+        hLayout = QHBoxLayout()
+        margin = ExpandingDelegate.Margin
+        hLayout.setContentsMargins(margin, 0, margin, 0)
+        arrow = QLabel()
+        arrow.setPixmap(Pixmap("light:minus.png", QColor("white")))
+        hLayout.addWidget(arrow)
+        self.__title = QLabel()
+        self.__title.static = title
+        self.__title.installEventFilter(self)
+        hLayout.addWidget(self.__title, 1)
+        self.__info = QLabel(info)
+        hLayout.addWidget(self.__info)
+        self.setLayout(hLayout)
+
+    def setInfo(self, info):
+        self.__info.setText(info)
+
+    def eventFilter(self, obj, event):
+        if (event.type() == QEvent.Resize):
+            if hasattr(obj, "static"):
+                ElideLabel(obj, obj.static)
+        return super().eventFilter(obj, event)
+
+
+class ExpandingListView(QListView):
+
+    def __init__(self, factory=None, *args, **kwargs):
+        # factory: Called with the QModelIndex of a row being expanded,
+        #   returns its detail widget. If the widget has a sigCollapse signal,
+        #   it collapses the row.
+        super().__init__(*args, **kwargs)
+        self.__factory = factory
+        self.__details = []
+        self.setFrameStyle(QFrame.NoFrame | QFrame.Plain)
+        self.setItemDelegate(ExpandingDelegate(self))
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setResizeMode(QListView.Adjust)
+        self.clicked.connect(self.toggleExpanded)
+
+    def setDetailFactory(self, factory):
+        self.__factory = factory
+
+    def setModel(self, model):
+        old = self.model()
+        if old is not None:
+            old.rowsAboutToBeRemoved.disconnect(self.__rowsRemoved)
+            old.modelAboutToBeReset.disconnect(self.collapseAll)
+        super().setModel(model)
+        model.rowsAboutToBeRemoved.connect(self.__rowsRemoved)
+        model.modelAboutToBeReset.connect(self.collapseAll)
+
+    def isExpanded(self, index):
+        return self.indexWidget(index) is not None
+
+    def detailWidgets(self):
+        return list(self.__details)
+
+    def indexOf(self, widget):
+        # Index of the row a detail widget belongs to
+        if widget not in self.__details:
+            return QModelIndex()
+        return QModelIndex(widget.index)
+
+    def toggleExpanded(self, index):
+        if index.isValid():
+            self.setExpanded(index, not self.isExpanded(index))
+
+    def setExpanded(self, index, expanded):
+        if expanded == self.isExpanded(index) or not self.__factory:
+            return
+        if expanded:
+            w = self.__factory(index)
+            # Follows the row when rows are inserted, moved or removed
+            w.index = QPersistentModelIndex(index)
+            if hasattr(w, "sigCollapse"):
+                w.sigCollapse.connect(self.__collapseSender)
+            w.installEventFilter(self)
+            self.__details.append(w)
+            self.setIndexWidget(index, w)
+        else:
+            w = self.indexWidget(index)
+            if w in self.__details:
+                self.__details.remove(w)
+            # The previous widget is deleted
+            self.setIndexWidget(index, None)
+        self.itemDelegate().sizeHintChanged.emit(index)
+
+    def collapseAll(self):
+        for w in self.detailWidgets():
+            self.__release(w)
+
+    def __release(self, w):
+        # The view may already have let go of the widget, e.g. when its row is
+        #   removed, so it is deleted explicitly.
+        self.__details.remove(w)
+        index = QModelIndex(w.index)
+        if index.isValid() and self.indexWidget(index) is w:
+            self.setIndexWidget(index, None)
+        w.deleteLater()
+
+    def __collapseSender(self):
+        index = self.indexOf(self.sender())
+        if index.isValid():
+            self.setExpanded(index, False)
+
+    def __rowsRemoved(self, parent, first, last):
+        for w in self.detailWidgets():
+            if first <= w.index.row() <= last:
+                self.__release(w)
+
+    def eventFilter(self, obj, event):
+        # Row height follows the detail widget, e.g. while it animates
+        if event.type() == QEvent.LayoutRequest and obj in self.__details:
+            self.itemDelegate().sizeHintChanged.emit(QModelIndex(obj.index))
+        return super().eventFilter(obj, event)
@@ -1,5 +1,5 @@
 '''
-Last Modified: 2021-05-06
+Last Modified: 2026-10-18
 
 @author: Jesse M. Barr
 
@@ -7,6 +7,9 @@ Contains:
     -FuncComboBox
 
 Changes:
+-2026-10-18:
+    -Added setItems(), so the items can be given once they are known, e.g.
+        after listing them in the background.
 -2021-05-06:
     -Allow a list or a function.
     -Block signals while updating the list, to prevent triggering selection
@@ -25,12 +28,18 @@ from PyQt5.QtWidgets import QComboBox
 class FuncComboBox(QComboBox):
     def __init__(self, items, autoSelect=True, *args, **kwargs):
         super(QComboBox, self).__init__(*args, **kwargs)
+        self.setMinimumContentsLength(10)
+        self.__autoSelect = autoSelect
+        self.setItems(items)
+
+    def setItems(self, items, refresh=True):
+        # refresh: If False, the list is kept until the next refresh, e.g.
+        #   after setting it with updateList().
         if not callable(items) and not isinstance(items, list):
             raise Exception("Items must be a function or a list.")
-        self.setMinimumContentsLength(10)
         self.__items = items
-        self.__autoSelect = autoSelect
-        self.refreshItems()
+        if refresh:
+            self.refreshItems()
 
     def refreshItems(self):
         if callable(self.__items):
@@ -0,0 +1,111 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -LivePlot
+
+Streams the results of a running test into a PlotCanvas.
+
+ACEstatPy signals only mark the plot as dirty. A timer, running at a limited
+    rate, copies any new samples into SeriesBuffers and hands views of them to
+    the existing curves with setData, so the canvas and its curves are never
+    re-created and the series is never re-copied as a whole. Curves extend
+    their level-of-detail pyramid with the new samples only.
+
+ToDo:
+
+'''
+from PyQt5.QtCore import QObject, QTimer
+# Local
+from Utilities import SeriesBuffer
+
+
+class LivePlot(QObject):
+
+    def __init__(self, rate=25, parent=None):
+        super().__init__(parent)
+        self.__canvas = None
+        self.__test = None
+        self.__series = []
+        self.__dirty = False
+        self.__timer = QTimer(self)
+        self.__timer.timeout.connect(self.flush)
+        self.setRate(rate)
+
+    @property
+    def test(self):
+        return self.__test
+
+    @property
+    def canvas(self):
+        return self.__canvas
+
+    def isActive(self):
+        return self.__test is not None
+
+    def setRate(self, rate):
+        # Maximum number of redraws per second
+        self.__timer.setInterval(int(1000 / max(1, rate)))
+
+    def start(self, canvas, test, id):
+        self.stop()
+        info = test.info.plots[id]
+        self.__canvas = canvas
+        self.__test = test
+        canvas.setLabel("x", label=info.x_label)
+        canvas.setLabel("y", label=info.y_label)
+        curves = canvas.setCurves([{"x": [], "y": []} for s in info.series])
+        for s, curve in zip(info.series, curves):
+            self.__series.append((s, SeriesBuffer(), SeriesBuffer(), curve))
+        canvas.enableAutoRange()
+        canvas.setEnabled(True)
+        self.__dirty = True
+        self.__timer.start()
+
+    def update(self, *args, **kwargs):
+        # Called for every received message/result; only flags the plot.
+        self.__dirty = True
+
+    def flush(self):
+        if not self.__dirty or self.__test is None:
+            return
+        self.__dirty = False
+        results = getattr(self.__test, "results", None) or {}
+        for s, xBuf, yBuf, curve in self.__series:
+            try:
+                x = results[s.x.output][s.x.field]
+                y = results[s.y.output][s.y.field]
+            except (KeyError, TypeError):
+                # Output has not been received yet
+                continue
+            n = min(len(x), len(y))
+            if n < len(xBuf):
+                # Results were reset, start over
+                xBuf.clear()
+                yBuf.clear()
+                update = curve.setData
+            elif n == len(xBuf):
+                continue
+            else:
+                # The curve only processes the new samples
+                update = curve.appendData
+            # Only the new samples are copied
+            xBuf.extend(x[len(xBuf):n])
+            yBuf.extend(y[len(yBuf):n])
+            update(x=xBuf.data, y=yBuf.data)
+
+    def stop(self):
+        if self.__test is None:
+            return
+        self.__dirty = True
+        self.flush()
+        self.__timer.stop()
+        self.__canvas.plotChanged()
+        self.detach()
+
+    def detach(self):
+        # Stop streaming without touching the canvas, e.g. when it is closed.
+        self.__timer.stop()
+        self.__test = None
+        self.__canvas = None
+        self.__series = []
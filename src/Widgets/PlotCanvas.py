@@ -1,14 +1,35 @@
 '''
-Last Modified: 2021-05-03
+Last Modified: 2026-10-18
 
 @author: Jesse M. Barr
 
 Contains:
     -PlotHistory
+    -PointIndex
     -PlotToolbar
+    -CachedCurve
     -PlotWidget
     -PlotCanvas
 
+Changes:
+    -2026-10-18:
+        -plot() returns the created curve so callers can update it in place.
+        -Added enableAutoRange()/plotChanged() for live plotting.
+        -Added setCurves() to swap data into the existing curve items.
+        -Added setRenderOptions() for downsampling and clip-to-view.
+        -Frame times on large series are measured by
+            benchmarks/plot_canvas.py.
+        -Added showCurves() to show a set of prepared curves, optionally with
+            a legend, in place of the curves from setCurves().
+        -With peak downsampling, curves from setCurves() and createCurve()
+            draw long series from a min/max pyramid picked by the view range.
+        -The toolbar's coordinate readout is rate limited, and can snap to
+            the nearest data point (Snap).
+        -The export dialog is created when an exporter is first picked.
+        -CachedCurve keeps its own display cache and reads the data through
+            xData/yData, falling back to pyqtgraph's own drawing where
+            PlotDataset or getDisplayDataset are not available.
+
 ToDo:
     -Potentially customize the context menu.
         -It can unfortunately override some settings and cause things to not
@@ -25,11 +46,20 @@ from PyQt5.QtCore import Qt, pyqtSignal, QRectF, QEvent
 from PyQt5.QtWidgets import (QWidget, QLabel, QSizePolicy, QVBoxLayout, QMenu,
                              QToolBar, QToolButton)
 from PyQt5.QtGui import QColor
+from weakref import WeakKeyDictionary
 # PyQtGraph
-from pyqtgraph import PlotWidget as PW  # , SignalProxy
+import numpy as np
+from pyqtgraph import (PlotWidget as PW, PlotDataItem, ScatterPlotItem,
+                       SignalProxy)
+try:
+    from pyqtgraph.graphicsItems.PlotDataItem import PlotDataset
+except ImportError:
+    # Not available in every version, curves are then drawn by pyqtgraph
+    PlotDataset = None
 from pyqtgraph.graphicsItems.ViewBox import ViewBox
 # Local
-from Exporters import ExportDialog
+from Exporters import EXPORTERS, ExportDialog
+from Utilities import MinMaxPyramid
 from .Images import Icon
 
 
@@ -59,7 +89,46 @@ class PlotHistory(object):
         return self.plotRange
 
 
+class PointIndex(object):
+    # Finds the data point nearest to a position. Points are looked up by x
+    #   with a binary search, x is sorted once if it is not in order already.
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        n = min(len(x), len(y))
+        if n > 1 and not np.all(x[1:n] >= x[:n - 1]):
+            self.__order = np.argsort(x[:n], kind="stable")
+            self.__sorted = x[self.__order]
+        else:
+            self.__order = None
+            self.__sorted = x[:n]
+
+    def nearest(self, x, y, rx, ry):
+        # Index of the point closest to (x, y), with distances scaled by rx
+        #   and ry, or None if there is none within 1.
+        lo = np.searchsorted(self.__sorted, x - rx)
+        hi = np.searchsorted(self.__sorted, x + rx, side="right")
+        if hi <= lo:
+            return None
+        if self.__order is None:
+            candidates = np.arange(lo, hi)
+        else:
+            candidates = self.__order[lo:hi]
+        d = (((self.x[candidates] - x) / rx) ** 2
+             + ((self.y[candidates] - y) / ry) ** 2)
+        if np.isnan(d).all():
+            return None
+        i = np.nanargmin(d)
+        return int(candidates[i]) if d[i] <= 1 else None
+
+
 class PlotToolbar(QToolBar):
+    # Coordinate readout updates per second
+    ReadoutRate = 30
+    # Pixels from a data point within which the readout snaps to it
+    SnapRadius = 10
+
     def __init__(self, plot, *args, **kwargs):
         if not isinstance(plot, PW):
             raise Exception("Expected PlotWidget")
@@ -67,11 +136,20 @@ class PlotToolbar(QToolBar):
         self.setObjectName("PlotToolbar")
         self.plot = plot
         self.plotHistory = None
+        # PointIndex of each curve, for snapping
+        self.__indexes = WeakKeyDictionary()
         # Qt objects are not deleted on close, therefore, we will re-use them.
-        self.exporter = ExportDialog(self.plot)
+        #   Created on first use, see exporter.
+        self.__exporter = None
 
         self.initUI()
 
+    @property
+    def exporter(self):
+        if self.__exporter is None:
+            self.__exporter = ExportDialog(self.plot)
+        return self.__exporter
+
     def initUI(self):
         # Reversed because of dark theme
         # background_color = self.palette().color(self.backgroundRole())
@@ -152,6 +230,21 @@ class PlotToolbar(QToolBar):
                                       disabled_color), "Zoom", toggleZoom)
         btnZoom.setCheckable(True)
 
+        # Marks the point the readout snapped to
+        marker = ScatterPlotItem(size=8, pen=None, brush=QColor("white"))
+        marker.setZValue(1000)
+        marker.hide()
+        self.plot.plotItem.vb.addItem(marker, ignoreBounds=True)
+
+        def toggleSnap():
+            if not btnSnap.isChecked():
+                marker.hide()
+                self.__indexes.clear()
+
+        btnSnap = self.addAction("Snap", toggleSnap)
+        btnSnap.setCheckable(True)
+        btnSnap.setToolTip("Show the data point nearest to the mouse")
+
         self.addSeparator()
 
         saveButton = QToolButton(self)
@@ -160,9 +253,8 @@ class PlotToolbar(QToolBar):
         saveButton.setIcon(Icon("light:filesave.png", icon_color, disabled_color))
         saveButton.setPopupMode(QToolButton.InstantPopup)
         saveMenu = QMenu(saveButton)
-        for e in self.exporter.ExporterClasses:
-            saveMenu.addAction(e.Name,
-                               lambda item=e.Name: self.exporter.setTool(item))
+        for e in EXPORTERS:
+            saveMenu.addAction(e, lambda item=e: self.exporter.setTool(item))
         saveButton.setMenu(saveMenu)
         self.addWidget(saveButton)
 
@@ -180,21 +272,58 @@ class PlotToolbar(QToolBar):
             else:
                 lblInfo.setText("{0}".format(s))
 
-        def mouseMoved(ev):
+        def mouseMoved(args):
+            # Called at most ReadoutRate times per second, with the latest
+            #   position.
             if self.plot.mouseHeld and btnPan.isChecked():
                 return
-            coords = self.plot.plotItem.vb.mapSceneToView(ev)
-            coords = "x={0:<12g} y={1:<12g}".format(coords.x(), coords.y())
-            setLabel(coords)
+            coords = self.plot.plotItem.vb.mapSceneToView(args[0])
+            point = self.nearestPoint(coords.x(), coords.y()) \
+                if btnSnap.isChecked() else None
+            if point is None:
+                marker.hide()
+                setLabel("x={0:<12g} y={1:<12g}".format(coords.x(), coords.y()))
+            else:
+                marker.setData([point[0]], [point[1]])
+                marker.show()
+                setLabel("x={0:<12g} y={1:<12g} (data)".format(*point))
 
-        # proxy = SignalProxy(self.plot.scene().sigMouseMoved, rateLimit=60, slot=mouseMoved)
-        self.plot.scene().sigMouseMoved.connect(mouseMoved)
+        self.__mouseProxy = SignalProxy(self.plot.scene().sigMouseMoved,
+                                        rateLimit=self.ReadoutRate,
+                                        slot=mouseMoved)
 
         def mouseLeft(ev):
+            marker.hide()
             setLabel()
 
         self.plot.sigMouseLeave.connect(mouseLeft)
 
+    def nearestPoint(self, x, y):
+        # Data point of the shown curves closest to (x, y) in view
+        #   coordinates, within SnapRadius pixels, as (x, y) or None.
+        vb = self.plot.plotItem.vb
+        px, py = vb.viewPixelSize()
+        rx = abs(px) * self.SnapRadius
+        ry = abs(py) * self.SnapRadius
+        if not rx or not ry:
+            return None
+        best, bestDistance = None, None
+        for item in self.plot.plotItem.listDataItems():
+            if (not item.isVisible() or any(item.opts.get('logMode', ()))
+                    or item.xData is None or item.yData is None):
+                continue
+            index = self.__indexes.get(item)
+            if index is None or index.x is not item.xData:
+                index = self.__indexes[item] = PointIndex(item.xData, item.yData)
+            i = index.nearest(x, y, rx, ry)
+            if i is None:
+                continue
+            distance = ((index.x[i] - x) / rx) ** 2 + ((index.y[i] - y) / ry) ** 2
+            if bestDistance is None or distance < bestDistance:
+                best = (float(index.x[i]), float(index.y[i]))
+                bestDistance = distance
+        return best
+
     def addHistory(self):
         currRange = self.plot.plotItem.vb.viewRect()
         if self.plotHistory is None:
@@ -205,6 +334,92 @@ class PlotToolbar(QToolBar):
             self.btnUndo.setEnabled(True)
 
 
+class CachedCurve(PlotDataItem):
+    # Curve that is kept and shown again, see showCurves. With peak
+    #   downsampling, long series are drawn from a MinMaxPyramid, built once
+    #   and then only extended by appendData.
+    # Shorter series are left to pyqtgraph
+    LODMinimum = 10000
+
+    def __init__(self, *args, bounds=None, pyramid=None, **kwargs):
+        # bounds: Known ((xmin, xmax), (ymin, ymax)) of the data, used for
+        #   auto-range instead of scanning it.
+        # pyramid: MinMaxPyramid of the data, e.g. shared with other items.
+        #   Created when needed.
+        # Display data from the pyramid and the (left, right, points) it was
+        #   selected for.
+        self.__display = None
+        super().__init__(*args, **kwargs)
+        self.bounds = bounds
+        self.pyramid = pyramid
+
+    def setData(self, *args, **kwargs):
+        self.bounds = None
+        self.pyramid = None
+        self.__display = None
+        super().setData(*args, **kwargs)
+
+    def appendData(self, x, y):
+        # Same as setData, for a series that has only grown since the last
+        #   call, so its pyramid is extended instead of rebuilt.
+        self.bounds = None
+        self.__display = None
+        super().setData(x=x, y=y)
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        if (self.bounds is None or self.bounds[ax] is None or frac < 1.0
+                or orthoRange is not None or any(self.opts['logMode'])
+                or self.opts['fftMode']):
+            return super().dataBounds(ax, frac, orthoRange)
+        return self.bounds[ax]
+
+    def getDisplayDataset(self):
+        # Only called by pyqtgraph versions that have it, others draw the
+        #   curve themselves.
+        dataset = self.__pyramidDataset()
+        if dataset is None:
+            return super().getDisplayDataset()
+        return dataset
+
+    def __pyramidDataset(self):
+        # Display data from the pyramid, None if it does not apply
+        opts = self.opts
+        x, y = getattr(self, 'xData', None), getattr(self, 'yData', None)
+        view = self.getViewBox()
+        if (PlotDataset is None or opts.get('downsampleMethod') != 'peak'
+                or not opts.get('autoDownsample') or any(opts['logMode'])
+                or opts.get('fftMode') or opts.get('derivativeMode')
+                or opts.get('phasemapMode') or x is None or y is None
+                or len(x) < self.LODMinimum or not isinstance(view, ViewBox)):
+            return None
+        if self.pyramid is None:
+            self.pyramid = MinMaxPyramid()
+        self.pyramid.update(x, y)
+        if not self.pyramid.monotonic:
+            return None
+        if view.autoRangeEnabled()[0]:
+            # The view is about to follow the data
+            left, right = -np.inf, np.inf
+        else:
+            rect = view.viewRect()
+            left, right = rect.left(), rect.right()
+        key = (left, right,
+               max(view.width(), 1) * opts.get('autoDownsampleFactor', 1.0))
+        if self.__display is not None and self.__display[1] == key:
+            return self.__display[0]
+        x, y = self.pyramid.select(x, y, *key)
+        dataset = PlotDataset(x, y)
+        dataset.containsNonfinite = not np.isfinite(y).all()
+        self.__display = (dataset, key)
+        return dataset
+
+    def viewRangeChanged(self, *args, **kwargs):
+        # Once removed from the plot, the item is briefly outside of a
+        #   ViewBox and downsampling would query the PlotWidget instead.
+        if isinstance(self.getViewBox(), ViewBox):
+            super().viewRangeChanged(*args, **kwargs)
+
+
 class PlotWidget(PW):
     # Custom PlotWidget for custom event handling
     # # Might be able to use an event filter in PlotToolbar
@@ -216,11 +431,17 @@ class PlotWidget(PW):
     mouseHeld = None
     myPlot = None
     mode = None
+    pointsPerPixel = 5.0
+    DownsampleModes = ["off", "peak", "mean", "subsample"]
 
     def __init__(self, *args, **kwargs):
         super(PlotWidget, self).__init__(*args, **kwargs)
         self.scene().installEventFilter(self)
         self.mouseHeld = False
+        # Items shown by setCurves and showCurves
+        self.__curves = []
+        self.__shown = []
+        self.__legend = None
 
     def mouseReleaseEvent(self, ev):
         self.mouseHeld = False
@@ -274,15 +495,112 @@ class PlotWidget(PW):
 
     def clear(self):
         self.plotItem.clear()
+        self.__curves = []
+        self.__shown = []
+        if self.__legend is not None:
+            self.__legend.setVisible(False)
         self.sigPlotChanged.emit()
 
+    def setRenderOptions(self, downsample=None, clipToView=None,
+                         pointsPerPixel=None):
+        # downsample: one of DownsampleModes. When enabled, the downsampling
+        #   factor is picked from the visible range so that roughly
+        #   pointsPerPixel samples are drawn per horizontal pixel.
+        # New curves pick up the PlotItem's settings when they are added.
+        if downsample is not None:
+            if downsample not in self.DownsampleModes:
+                raise Exception("Unrecognized downsample mode")
+            if downsample == "off":
+                self.plotItem.setDownsampling(ds=False, auto=False)
+            else:
+                self.plotItem.setDownsampling(ds=True, auto=True,
+                                              mode=downsample)
+        if clipToView is not None:
+            self.plotItem.setClipToView(clipToView)
+        if pointsPerPixel is not None:
+            self.pointsPerPixel = float(max(pointsPerPixel, 1))
+            for item in self.plotItem.listDataItems():
+                self.__applyDensity(item)
+
+    def __applyDensity(self, item):
+        # PlotDataItem has no setter for this option.
+        item.opts['autoDownsampleFactor'] = self.pointsPerPixel
+        # Drops the downsampled data, as if the view had changed
+        item.viewRangeChanged()
+
     def plot(self, *args, **kwargs):
-        self.plotItem.plot(*args, **kwargs)
+        item = self.plotItem.plot(*args, **kwargs)
+        self.__applyDensity(item)
         # if self.myPlot is None:
         #     self.myPlot = self.plotItem.plot(*args, **kwargs)
         # else:
         #     self.myPlot.setData(*args, **kwargs)
         self.sigPlotChanged.emit()
+        return item
+
+    def setCurves(self, curves):
+        # Reuse the existing curve items, only adding or removing the
+        #   difference, instead of clearing and re-creating them.
+        if curves and self.__shown:
+            self.showCurves([], emit=False)
+        items = [i for i in self.__curves if i in self.plotItem.items]
+        for item in items[len(curves):]:
+            self.plotItem.removeItem(item)
+        items = items[:len(curves)]
+        for i, data in enumerate(curves):
+            if i < len(items):
+                items[i].setData(**data)
+            else:
+                items.append(CachedCurve(**data))
+                self.plotItem.addItem(items[-1])
+                self.__applyDensity(items[-1])
+        self.__curves = items
+        self.sigPlotChanged.emit()
+        return items
+
+    def createCurve(self, **kwargs):
+        # A CachedCurve for showCurves, not shown until it is passed to it.
+        return CachedCurve(**kwargs)
+
+    def showCurves(self, items, legend=True, emit=True):
+        # Shows exactly the given curves, from createCurve, in place of the
+        #   curves from setCurves. Items are only added or removed, their data
+        #   is not touched, so they can be kept and shown again at no cost.
+        # legend: Named items are listed in a legend.
+        if items:
+            for item in self.__curves:
+                self.plotItem.removeItem(item)
+            self.__curves = []
+        shown = set(items)
+        for item in self.__shown:
+            if item not in shown:
+                self.plotItem.removeItem(item)
+        for item in items:
+            if item not in self.plotItem.items:
+                self.plotItem.addItem(item)
+                self.__applyDensity(item)
+        self.__shown = list(items)
+        legend = legend and bool(items)
+        if legend and self.__legend is None:
+            self.__legend = self.plotItem.addLegend()
+        if self.__legend is not None:
+            # Lists the shown items in order, and nothing when hidden
+            self.__legend.clear()
+            self.__legend.setVisible(legend)
+            for item in items if legend else []:
+                if item.name():
+                    self.__legend.addItem(item, item.name())
+        if emit:
+            self.sigPlotChanged.emit()
+
+    def plotChanged(self):
+        # Curves updated in place with setData do not emit sigPlotChanged,
+        #   call this once they are complete to reset the view history.
+        self.sigPlotChanged.emit()
+
+    def enableAutoRange(self):
+        # Follow the data as it grows, until the user pans or zooms.
+        self.plotItem.enableAutoRange()
 
     def setLabel(self, axis=None, label=None, units=None):
         if axis == 'x':
@@ -317,7 +635,25 @@ class PlotCanvas(QWidget):
         self.setLayout(vLayout)
 
     def plot(self, *args, **kwargs):
-        self.__plot.plot(*args, **kwargs)
+        return self.__plot.plot(*args, **kwargs)
+
+    def setCurves(self, curves):
+        return self.__plot.setCurves(curves)
+
+    def createCurve(self, **kwargs):
+        return self.__plot.createCurve(**kwargs)
+
+    def showCurves(self, items, legend=True):
+        self.__plot.showCurves(items, legend)
+
+    def setRenderOptions(self, *args, **kwargs):
+        self.__plot.setRenderOptions(*args, **kwargs)
+
+    def plotChanged(self):
+        self.__plot.plotChanged()
+
+    def enableAutoRange(self):
+        self.__plot.enableAutoRange()
 
     # @property
     # def plot(self):
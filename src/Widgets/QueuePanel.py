@@ -1,13 +1,30 @@
 '''
-Last Modified: 2021-05-07
+Last Modified: 2026-10-18
 
 @author: Jesse M. Barr
 
 Contains:
-    -QueueItem
+    -QueueModel
+    -QueueDetail
     -QueuePanel
 
 Changes:
+-2026-10-18:
+    -Replaced the per-test QueueItem widgets with a model/view list. Collapsed
+        tests are only painted by the delegate; a QueueDetail widget is
+        created for a test when it is expanded, and deleted when it is
+        collapsed or leaves the queue. See ExpandingListView.
+    -Queue is synchronized by test, as remove/move/insert operations, so it
+        can be reordered. Tests can be dragged or moved from the context menu.
+    -Removed the lock, the queue is copied before it is synchronized.
+    -Added setQueue(), the panel can be created before the instrument.
+    -Tests added here are applied to the model as they are added
+        (appendTest), and updateFront only compares the front of the queue,
+        so an update does not depend on the queue length. updateQueue
+        compares the whole queue, e.g. after a move or a cancel.
+    -Moves and cancels name the test rather than its row, the model can
+        lag behind the queue. Tests can only be moved while setMovable
+        allows it, see ACEstatGUI.handleMove.
 -2021-05-07:
     -Cleaner list widget.
     -Fixed bug with list updating too quickly.
@@ -21,37 +38,195 @@ Changes:
 ToDo:
 
 '''
-from PyQt5.QtCore import pyqtSignal as Signal, QEvent
-from PyQt5.QtGui import QColor
+from PyQt5.QtCore import (pyqtSignal as Signal, Qt, QEvent,
+                          QAbstractListModel, QModelIndex, QMimeData)
 from PyQt5.QtWidgets import (
-    QWidget, QFrame, QLabel, QPushButton, QScrollArea, QGridLayout, QVBoxLayout,
-    QHBoxLayout, QSizePolicy, QMenu, QGridLayout
+    QWidget, QLabel, QPushButton, QGridLayout, QVBoxLayout, QHBoxLayout,
+    QSizePolicy, QMenu, QAbstractItemView
 )
-from threading import Lock
 # Local
-from Widgets import CollapsibleBox, ElideLabel
+from Widgets import ElideLabel
+from .ExpandingList import ExpandedHeader, ExpandingDelegate, ExpandingListView
 
 
-class QueueItem(QWidget):
+def countText(test):
+    if test.run_forever:
+        return u"\N{INFINITY}"
+    return "{0}".format(test.iterations)
+
+
+class QueueModel(QAbstractListModel):
+    TestRole = Qt.UserRole
+    CountRole = ExpandingDelegate.InfoRole
+    MimeType = "application/x-acestat-queue-row"
+    # Emitted with the test and its new row when a row is dropped. The queue
+    #   itself must be reordered, then synchronized.
+    sigMoveRequest = Signal(object, int)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Tests are keyed by id(). The model holds a reference to every test,
+        #   so keys stay unique while the test is listed.
+        self.__tests = []
+        self.__keys = []
+        self.__counts = []
+        self.__listed = set()
+        # Rows can be dragged, see setMovable
+        self.__movable = True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.__tests)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        test = self.__tests[index.row()]
+        if role == Qt.DisplayRole:
+            return "{0}".format(test.info.name)
+        elif role == Qt.ToolTipRole:
+            return "{0}".format(test.info.name)
+        elif role == self.TestRole:
+            return test
+        elif role == self.CountRole:
+            return self.__counts[index.row()]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled if self.__movable else Qt.NoItemFlags
+        if not self.__movable:
+            return super().flags(index)
+        return super().flags(index) | Qt.ItemIsDragEnabled
+
+    def isMovable(self):
+        return self.__movable
+
+    def setMovable(self, movable):
+        self.__movable = movable
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def mimeTypes(self):
+        return [self.MimeType]
+
+    def mimeData(self, indexes):
+        data = QMimeData()
+        data.setData(self.MimeType, str(indexes[0].row()).encode())
+        return data
+
+    def dropMimeData(self, data, action, row, column, parent):
+        if (action != Qt.MoveAction or not self.__movable
+                or not data.hasFormat(self.MimeType)):
+            return False
+        src = int(bytes(data.data(self.MimeType)).decode())
+        if row < 0:
+            row = parent.row() if parent.isValid() else len(self.__tests)
+        # row is the insertion point before the source is taken out
+        dst = row - 1 if row > src else row
+        if dst != src:
+            self.sigMoveRequest.emit(self.__tests[src], dst)
+        # The move is applied to the queue, the view must not remove the
+        #   source row itself.
+        return False
+
+    def test(self, row):
+        return self.__tests[row]
+
+    def insertTest(self, row, test):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.__tests.insert(row, test)
+        self.__keys.insert(row, id(test))
+        self.__counts.insert(row, countText(test))
+        self.__listed.add(id(test))
+        self.endInsertRows()
+
+    def removeTest(self, row, count=1):
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        del self.__tests[row:row + count]
+        self.__listed.difference_update(self.__keys[row:row + count])
+        del self.__keys[row:row + count]
+        del self.__counts[row:row + count]
+        self.endRemoveRows()
+
+    def moveTest(self, src, dst):
+        # After the move, the test is at row dst.
+        if src == dst:
+            return
+        # Qt expects the destination before the source is removed
+        self.beginMoveRows(QModelIndex(), src, src, QModelIndex(),
+                           dst + 1 if dst > src else dst)
+        for l in (self.__tests, self.__keys, self.__counts):
+            l.insert(dst, l.pop(src))
+        self.endMoveRows()
+
+    def updateCount(self, row):
+        count = countText(self.__tests[row])
+        if count != self.__counts[row]:
+            self.__counts[row] = count
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [self.CountRole])
+
+    def syncFront(self, queue):
+        # The instrument only takes tests off the front of the queue and
+        #   counts down the first one, so only the front is compared. Returns
+        #   False, without changes, if the queue changed otherwise.
+        head = queue[0] if queue else None
+        if head is None:
+            if self.__tests:
+                self.removeTest(0, len(self.__tests))
+            return True
+        if id(head) not in self.__listed:
+            return False
+        done = self.__keys.index(id(head))
+        if done:
+            self.removeTest(0, done)
+        self.updateCount(0)
+        return True
+
+    def sync(self, queue):
+        # Applies the difference between the listed tests and the queue as
+        #   remove, move and insert operations, unchanged rows are untouched.
+        #   Compares every row, e.g. for when the queue is replaced.
+        queue = list(queue) # The queue may be changed by another thread
+        keys = [id(t) for t in queue]
+        if keys != self.__keys:
+            queued = set(keys)
+            for row in reversed(range(len(self.__keys))):
+                if self.__keys[row] not in queued:
+                    self.removeTest(row)
+            listed = set(self.__keys)
+            for row, key in enumerate(keys):
+                if row < len(self.__keys) and self.__keys[row] == key:
+                    continue
+                if key in listed:
+                    # Rows before this one already match, so it is further down
+                    self.moveTest(self.__keys.index(key, row), row)
+                else:
+                    self.insertTest(row, queue[row])
+                    listed.add(key)
+        # Only tests with a new count are repainted
+        for row in range(len(self.__tests)):
+            self.updateCount(row)
+
+
+class QueueDetail(QWidget):
+    # Shown in place of an expanded row
     sigCancel = Signal()
+    sigCollapse = Signal()
 
-    def __init__(self, test):
-        super().__init__()
+    def __init__(self, test, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         self.test = test
+        self.setAutoFillBackground(True)
         self.initUI()
 
     def initUI(self):
         relTest = self.test.info
-        qItem = CollapsibleBox("{0}".format(relTest.name))
-        hLayout = qItem.header().layout()
-        hLayout.addStretch()
 
-        if self.test.run_forever:
-            self.__count1 = QLabel(u"\N{INFINITY}")
-        else:
-            self.__count1 = QLabel("{0}".format(self.test.iterations))
-        self.__count1.setStyleSheet("padding-right: 3px;")
-        hLayout.addWidget(self.__count1)
+        self.__header = ExpandedHeader(
+            "{0}".format(relTest.name), countText(self.test))
+        self.__header.clicked.connect(self.sigCollapse.emit)
 
         boxLayout = QVBoxLayout()
         boxLayout.setContentsMargins(15, 3, 3, 3)
@@ -78,10 +253,7 @@ class QueueItem(QWidget):
             self.test.start_delay)), paramLayout.rowCount()-1, 1)
 
         paramLayout.addWidget(QLabel("Remaining:"), paramLayout.rowCount(), 0)
-        if self.test.run_forever:
-            self.__count2 = QLabel(u"\N{INFINITY}")
-        else:
-            self.__count2 = QLabel("{0}".format(self.test.iterations))
+        self.__count2 = QLabel(countText(self.test))
         paramLayout.addWidget(self.__count2, paramLayout.rowCount()-1, 1)
 
         paramLayout.addWidget(QLabel("Iteration delay:"), paramLayout.rowCount(), 0)
@@ -106,18 +278,17 @@ class QueueItem(QWidget):
         btnRemove.clicked.connect(self.sigCancel.emit)
         hl.addWidget(btnRemove)
         boxLayout.addLayout(hl)
-        qItem.setContentLayout(boxLayout)
 
         l = QVBoxLayout()
         l.setContentsMargins(0, 0, 0, 0)
-        l.addWidget(qItem)
+        l.setSpacing(0)
+        l.addWidget(self.__header)
+        l.addLayout(boxLayout)
         self.setLayout(l)
 
     def updateCount(self):
-        # Count only needs updated if not run_forever
-        if not self.test.run_forever:
-            self.__count1.setText("{0}".format(self.test.iterations))
-            self.__count2.setText("{0}".format(self.test.iterations))
+        self.__header.setInfo(countText(self.test))
+        self.__count2.setText(countText(self.test))
 
     def contextMenuEvent(self, event):
         menu = QMenu(self)
@@ -135,31 +306,31 @@ class QueueItem(QWidget):
 
 class QueuePanel(QWidget):
     sigPause = Signal()
-    sigCancel = Signal(int)
+    # The test, not its row, the model may lag behind the queue
+    sigCancel = Signal(object)
+    # The test and the row it is moved to
+    sigMove = Signal(object, int)
 
     def __init__(self, paused, queue, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.__lock = Lock()
         self.__queue = queue # Hold reference to queue
         self.initUI()
         self.setPause(paused)
+        self.setMovable(False)
         self.updateQueue()
 
     def initUI(self):
-        ui = QWidget(self)
-        ui.setObjectName("TestQueue")
-
-        testScroll = QScrollArea()
-        testScroll.setFrameStyle(QFrame.NoFrame | QFrame.Plain)
-        testScroll.setWidget(ui)
-        testScroll.setWidgetResizable(True)
-
-        listLayout = QVBoxLayout()
-
-        self.__list = QVBoxLayout()
-        listLayout.addLayout(self.__list)
-        listLayout.addStretch(1)
-        ui.setLayout(listLayout)
+        self.__model = QueueModel(self)
+        self.__model.sigMoveRequest.connect(self.sigMove.emit)
+
+        self.__view = ExpandingListView(self.__createDetail)
+        self.__view.setObjectName("TestQueue")
+        self.__view.setModel(self.__model)
+        self.__view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.__view.setDragDropMode(QAbstractItemView.InternalMove)
+        self.__view.setDefaultDropAction(Qt.MoveAction)
+        self.__view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.__view.customContextMenuRequested.connect(self.__contextMenu)
 
         mainLayout = QVBoxLayout()
         mainLayout.setContentsMargins(0, 0, 0, 0)
@@ -170,33 +341,75 @@ class QueuePanel(QWidget):
         self.__pauseButton.clicked.connect(self.sigPause.emit)
         hLayout.addWidget(self.__pauseButton)
         mainLayout.addLayout(hLayout)
-        mainLayout.addWidget(testScroll)
+        mainLayout.addWidget(self.__view)
         self.setLayout(mainLayout)
 
+    def __createDetail(self, index):
+        w = QueueDetail(index.data(QueueModel.TestRole))
+        w.sigCancel.connect(lambda: self.sigCancel.emit(w.test))
+        return w
+
+    def setQueue(self, queue):
+        # Lists another queue, e.g. once the instrument is initialized
+        self.__queue = queue
+        self.updateQueue()
+
     def updateQueue(self):
-        with self.__lock:
-            queue = self.__queue
-            for i in reversed(range(self.__list.count())):
-                w = self.__list.itemAt(i).widget()
-                if not hasattr(w, "test"):
-                    # deleteLater() has been called, but has not completed yet
-                    continue
-                elif w.test in queue:
-                    # If the test is still in the queue, just update it
-                    w.updateCount()
-                else:
-                    # print("Deleting:", i)
-                    w.deleteLater()
-            # Add new items.
-            # Note:
-            #   If we ever make it possible to rearrange tests, this will not work!
-            for i in queue[self.__list.count():]:
-                item = QueueItem(i)
-                item.sigCancel.connect(self.cancelTest)
-                self.__list.insertWidget(self.__list.count(), item)
-
-    def cancelTest(self):
-        self.sigCancel.emit(self.__list.indexOf(self.sender()))
+        # Compares the whole queue. Runs on the GUI thread, the model works
+        #   on a copy of the queue.
+        self.__model.sync(self.__queue)
+        # Only expanded tests have widgets to update
+        for w in self.__view.detailWidgets():
+            w.updateCount()
+
+    def updateFront(self):
+        # After the instrument started or finished a test, only the front of
+        #   the queue is compared.
+        if not self.__model.syncFront(list(self.__queue[:1])):
+            self.updateQueue()
+            return
+        for w in self.__view.detailWidgets():
+            if w.index.row() == 0:
+                w.updateCount()
+
+    def appendTest(self):
+        # Call after adding a test to the end of the queue.
+        queue = list(self.__queue)
+        if len(queue) != self.__model.rowCount() + 1:
+            self.updateQueue()
+            return
+        self.__model.insertTest(len(queue) - 1, queue[-1])
+
+    def setMovable(self, movable):
+        # Whether tests can be dragged or moved from the context menu
+        self.__model.setMovable(movable)
+        self.__view.setDragEnabled(movable)
+
+    def __contextMenu(self, pos):
+        index = self.__view.indexAt(pos)
+        if not index.isValid():
+            return
+        row = index.row()
+        test = self.__model.test(row)
+        movable = self.__model.isMovable()
+        menu = QMenu(self)
+        top = menu.addAction("Move to Top")
+        up = menu.addAction("Move Up")
+        down = menu.addAction("Move Down")
+        top.setEnabled(movable and row > 0)
+        up.setEnabled(movable and row > 0)
+        down.setEnabled(movable and row < self.__model.rowCount() - 1)
+        menu.addSeparator()
+        cancel = menu.addAction("Cancel")
+        action = menu.exec_(self.__view.viewport().mapToGlobal(pos))
+        if action == cancel:
+            self.sigCancel.emit(test)
+        elif action == top:
+            self.sigMove.emit(test, 0)
+        elif action == up:
+            self.sigMove.emit(test, row - 1)
+        elif action == down:
+            self.sigMove.emit(test, row + 1)
 
     def setPause(self, pause):
         self.__pauseButton.setText("Resume Queue" if pause else "Pause Queue")
@@ -206,6 +419,11 @@ class QueuePanel(QWidget):
             return
         self.sigCancel.connect(fn)
 
+    def onMoveItem(self, fn):
+        if not callable(fn):
+            return
+        self.sigMove.connect(fn)
+
     def onPause(self, fn):
         if not callable(fn):
             return
@@ -0,0 +1,209 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -ResultDisplay
+
+Keeps a single PlotCanvas and a single ResultTable alive for the lifetime of
+    the window. Plotting or viewing a result swaps the data into the existing
+    widgets instead of closing and re-creating them (along with the toolbar,
+    export dialog and matplotlib figure), which Qt does not free on close.
+
+Plot data is prepared once per (result, plot id) and kept in a CurveCache,
+    along with the plot items showing it and their level-of-detail pyramids,
+    so switching back to a recently viewed plot only swaps items on the
+    canvas.
+
+Overlay mode draws the same plot of several results on the canvas at once.
+    Turning a result on or off only adds or removes its curves.
+
+Memory over repeated plot switches, and the time to toggle overlaid results,
+    are measured by benchmarks/result_display.py.
+
+ToDo:
+
+'''
+from weakref import WeakKeyDictionary
+from PyQt5.QtCore import Qt, pyqtSignal as Signal
+from PyQt5.QtWidgets import QLabel, QStackedWidget
+from pyqtgraph import intColor
+# Local
+from Results import Columns, CurveCache
+from Utilities import MinMaxPyramid
+from .PlotCanvas import PlotCanvas
+from .ResultPanel import resultName
+from .ResultTable import ResultTable
+
+
+class ResultDisplay(QStackedWidget):
+    # Emitted when results are added to or removed from the overlay
+    sigOverlayChanged = Signal()
+    # A result's hue is picked per result, its series get darker shades.
+    #   Dashed lines are slow to draw over noisy data.
+    SeriesShades = 3
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__canvas = None
+        self.__table = None
+        self.__renderOptions = {}
+        # Prepared data of recently plotted results
+        self.__curves = CurveCache()
+        # Plot items of prepared curves, dropped along with them
+        self.__plotItems = WeakKeyDictionary()
+        self.__overlayItems = WeakKeyDictionary()
+        # Overlaid keys in the order they were added, and their plot id
+        self.__overlay = []
+        self.__overlayId = None
+        self.__colors = 0
+
+        self.__placeholder = QLabel("No results to display")
+        self.__placeholder.setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
+        self.__placeholder.setEnabled(False)
+        self.addWidget(self.__placeholder)
+
+    @property
+    def canvas(self):
+        # Created on first use, then reused.
+        if self.__canvas is None:
+            self.__canvas = PlotCanvas(self)
+            self.__canvas.setRenderOptions(**self.__renderOptions)
+            self.addWidget(self.__canvas)
+        return self.__canvas
+
+    @property
+    def table(self):
+        if self.__table is None:
+            self.__table = ResultTable(parent=self)
+            self.addWidget(self.__table)
+        return self.__table
+
+    @property
+    def curves(self):
+        return self.__curves
+
+    def setRenderOptions(self, **kwargs):
+        # See PlotWidget.setRenderOptions
+        self.__renderOptions.update(kwargs)
+        if self.__canvas is not None:
+            self.__canvas.setRenderOptions(**kwargs)
+
+    def setCacheBudget(self, budget):
+        # Bytes of prepared plot data kept, see CurveCache
+        self.__curves.setBudget(budget)
+
+    def showCanvas(self):
+        self.setCurrentWidget(self.canvas)
+        self.__canvas.setEnabled(True)
+        return self.__canvas
+
+    def showTable(self):
+        self.setCurrentWidget(self.table)
+        self.__table.setEnabled(True)
+        return self.__table
+
+    def plotResult(self, id, test, key=None):
+        # key: Identifies the test, see setOverlaid.
+        self.clearOverlay()
+        info = test.info.plots[id]
+        canvas = self.showCanvas()
+        canvas.setLabel("x", label=info.x_label)
+        canvas.setLabel("y", label=info.y_label)
+        items = []
+        for c in self.__curves.get(test if key is None else key, id, test):
+            item = self.__plotItems.get(c)
+            if item is None:
+                item = self.__plotItems[c] = canvas.createCurve(
+                    x=c.x, y=c.y, bounds=c.bounds, pyramid=self.__pyramid(c))
+            items.append(item)
+        canvas.showCurves(items, legend=False)
+        return canvas
+
+    def __pyramid(self, curve):
+        # Shared by the items of a prepared curve, and counted by the cache
+        pyramid = curve.extra.get("pyramid")
+        if pyramid is None:
+            pyramid = curve.extra["pyramid"] = MinMaxPyramid()
+        return pyramid
+
+    def overlaid(self):
+        # The overlaid results, as (key, plot id)
+        return [(key, self.__overlayId) for key in self.__overlay]
+
+    def isOverlaid(self, id, key):
+        return id == self.__overlayId and key in self.__overlay
+
+    def setOverlaid(self, id, test, shown, key=None):
+        # Adds or removes the plot id of a test from the overlay. Only results
+        #   of the same plot id are overlaid, adding a different one starts a
+        #   new overlay.
+        # key: Identifies the test, e.g. when it is read again from an
+        #   archive. The test itself is used by default.
+        if key is None:
+            key = test
+        if shown:
+            if id != self.__overlayId:
+                self.__overlay = []
+                self.__overlayId = id
+            if key not in self.__overlay:
+                self.__overlay.append(key)
+        elif self.isOverlaid(id, key):
+            self.__overlay.remove(key)
+        else:
+            return
+        self.__showOverlay(test, key)
+
+    def clearOverlay(self):
+        if not self.__overlay:
+            return
+        self.__overlay = []
+        self.__overlayId = None
+        self.__curves.setPinned([])
+        if self.__canvas is not None:
+            self.__canvas.showCurves([])
+        self.sigOverlayChanged.emit()
+
+    def __overlayCurves(self, id, test, key):
+        # Overlay items of a test's plot, created on first use
+        curves = self.__curves.get(key, id, test)
+        items = [self.__overlayItems.get(c) for c in curves]
+        if None not in items:
+            return items
+        color = intColor(self.__colors, hues=9)
+        self.__colors += 1
+        name = resultName(test)
+        for i, c in enumerate(curves):
+            items[i] = self.__overlayItems[c] = self.canvas.createCurve(
+                x=c.x, y=c.y, bounds=c.bounds, pyramid=self.__pyramid(c),
+                pen=color.darker(100 + 50 * (i % self.SeriesShades)),
+                name=name if len(curves) == 1 else "{0} ({1})".format(
+                    name, c.name or i + 1))
+        return items
+
+    def __showOverlay(self, test, key):
+        id = self.__overlayId
+        canvas = self.showCanvas()
+        # Overlaid results stay cached
+        self.__curves.setPinned(self.overlaid())
+        if self.__overlay:
+            info = test.info.plots[id]
+            canvas.setLabel("x", label=info.x_label)
+            canvas.setLabel("y", label=info.y_label)
+        items = []
+        for k in self.__overlay:
+            items.extend(self.__overlayCurves(id, test if k == key else None, k))
+        canvas.showCurves(items)
+        self.sigOverlayChanged.emit()
+
+    def tableResult(self, id, test):
+        info = test.info.outputs[id]
+        columns = Columns(test)[id]
+        table = self.showTable()
+        table.setData([
+            f"{f.label}{f' ({f.units})' if hasattr(f, 'units') else ''}"
+            for f in info.fields], [columns[f.label] for f in info.fields])
+        return table
+
+    def clear(self):
+        self.clearOverlay()
+        self.setCurrentWidget(self.__placeholder)
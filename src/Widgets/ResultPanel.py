@@ -1,47 +1,230 @@
 '''
-Last Modified: 2021-08-19
+Last Modified: 2026-10-18
 
 @author: Jesse M. Barr
 
 Contains:
+    -summaryText
+    -ResultModel
     -ResultItem
+    -ResultError
     -ResultPanel
 
 Changes:
+-2026-10-18:
+    -Results are listed by a ResultModel in an ExpandingListView. Collapsed
+        results are only painted, a ResultItem is built when a result is
+        expanded and deleted when it is collapsed or removed.
+    -Added archive mode. Finished results are stored in a ResultArchive and
+        the panel pages and searches through the archive, only the most
+        recently used results are kept in memory.
+    -Results can be saved as NumPy .npz files.
+    -Results are saved by the sigSave handler, e.g. in the background.
+    -Plots can be overlaid, see ResultDisplay. Each plot of a ResultItem has
+        an Overlay toggle, which emits sigOverlay with the result's key.
+    -sigPlot includes the result's key, so its prepared plots are found again
+        when an archived result is read back.
+    -List outputs are shown as a summary (count, min, max, mean, first and
+        last value) with a View button for the table, instead of formatting
+        every value into a label.
+    -In archive mode, new results are inserted into the current page rather
+        than reloading it, results of tests that are no longer defined are not
+        listed, and results opened from files are listed without archiving
+        them again.
 
 ToDo:
 
 '''
-from PyQt5.QtCore import pyqtSignal as Signal, QEvent, Qt
-from PyQt5.QtGui import QColor
+from PyQt5.QtCore import (pyqtSignal as Signal, QEvent, Qt, QTimer,
+                          QAbstractListModel, QModelIndex)
 from PyQt5.QtWidgets import (
-    QWidget, QFrame, QLabel, QPushButton, QScrollArea, QGridLayout, QVBoxLayout,
-    QHBoxLayout, QSizePolicy, QGridLayout, QMenu, QFileDialog
+    QWidget, QLabel, QPushButton, QGridLayout, QVBoxLayout, QHBoxLayout,
+    QMenu, QFileDialog, QLineEdit, QToolButton, QMessageBox
 )
+from collections import OrderedDict
 from os import path as _path
 from datetime import datetime
+import numpy as np
 # Local
+from Results import FILTERS, ArchiveRecord, Columns, saveResult
 from Widgets import CollapsibleBox, ElideLabel
+from .ExpandingList import ExpandedHeader, ExpandingListView
 
 
 LASTDIR = None
 
+
+def resultName(test):
+    # test may be an ArchiveRecord
+    name = test.name if isinstance(test, ArchiveRecord) else test.info.name
+    return "{0} {1}".format(datetime.fromtimestamp(
+        test.startTime).strftime('%Y%m%d-%H%M%S'), name)
+
+
+def summaryText(summary, units=""):
+    # One line description of a list output's Summary
+    def value(v):
+        return "{0:.6g}{1}".format(v, units) if isinstance(
+            v, float) else "{0}{1}".format(v, units)
+
+    if not summary.count:
+        return "No values"
+    text = "{0} values".format(summary.count)
+    if summary.min is not None:
+        text += ", min {0}, max {1}, mean {2}".format(
+            value(summary.min), value(summary.max), value(summary.mean))
+    return text + ", first {0}, last {1}".format(
+        value(summary.first), value(summary.last))
+
+
+def resultMenu(parent, test, pos, save=saveResult):
+    # save: Called with the test and path to save results.
+    menu = QMenu(parent)
+    saveResults = menu.addAction("Save Results")
+    savePreset = menu.addAction("Save as Preset")
+    action = menu.exec_(pos)
+    if action == saveResults:
+        global LASTDIR
+        filepath = test.generateFilename()
+        if LASTDIR:
+            filepath = _path.join(LASTDIR, filepath)
+        path = QFileDialog.getSaveFileName(
+            parent, "Save Results", filepath, filter=";;".join(FILTERS.values()))
+        if path[0]:
+            LASTDIR = _path.split(path[0])[0]
+            filepath = path[0]
+            if path[1] == FILTERS["npz"] and not filepath.lower().endswith(".npz"):
+                filepath = _path.splitext(filepath)[0] + ".npz"
+            save(test, filepath)
+        # path = QFileDialog.getExistingDirectory(
+        #     self, "Choose Directory")
+        # if path:
+        #     test.export(path)
+    elif action == savePreset:
+        path = QFileDialog.getSaveFileName(
+            parent, "Save Preset", filter="JSON (*.json)")
+        if path[0]:
+            test.parameters.export(path[0])
+
+
+class ResultModel(QAbstractListModel):
+    TestRole = Qt.UserRole
+    # Identifies a result: its archive key, or the test itself
+    KeyRole = Qt.UserRole + 2
+
+    def __init__(self, loader=None, *args, **kwargs):
+        # loader: Called with the key of an ArchiveRecord, returns the test.
+        super().__init__(*args, **kwargs)
+        # Stored in display order, tests or ArchiveRecords
+        self.__loader = loader
+        self.__tests = []
+        self.__names = []
+        self.__newestFirst = True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.__tests)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self.__names[index.row()]
+        elif role == self.TestRole:
+            test = self.__tests[index.row()]
+            if isinstance(test, ArchiveRecord):
+                return self.__loader(test.key)
+            return test
+        elif role == self.KeyRole:
+            test = self.__tests[index.row()]
+            return test.key if isinstance(test, ArchiveRecord) else test
+        return None
+
+    def append(self, test):
+        self.insert(0 if self.__newestFirst else len(self.__tests), test)
+
+    def insert(self, row, test):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.__tests.insert(row, test)
+        self.__names.insert(row, resultName(test))
+        self.endInsertRows()
+
+    def remove(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.__tests[row]
+        del self.__names[row]
+        self.endRemoveRows()
+
+    def rowOf(self, test):
+        # Row of a test or of an ArchiveRecord with the same key, -1 if none
+        if isinstance(test, ArchiveRecord):
+            return self.rowOfKey(test.key)
+        for i, t in enumerate(self.__tests):
+            if t is test:
+                return i
+        return -1
+
+    def rowOfKey(self, key):
+        # Row of the ArchiveRecord with an archive key, -1 if none
+        for i, t in enumerate(self.__tests):
+            if isinstance(t, ArchiveRecord) and t.key == key:
+                return i
+        return -1
+
+    def trim(self, limit):
+        # Removes the oldest results, so at most limit are left
+        extra = len(self.__tests) - limit
+        if extra <= 0:
+            return
+        first = len(self.__tests) - extra if self.__newestFirst else 0
+        self.beginRemoveRows(QModelIndex(), first, first + extra - 1)
+        del self.__tests[first:first + extra]
+        del self.__names[first:first + extra]
+        self.endRemoveRows()
+
+    def setNewestFirst(self, newestFirst):
+        if newestFirst == self.__newestFirst:
+            return
+        self.beginResetModel()
+        self.__newestFirst = newestFirst
+        self.__tests.reverse()
+        self.__names.reverse()
+        self.endResetModel()
+
+    def setTests(self, tests):
+        self.beginResetModel()
+        self.__tests = list(tests)
+        self.__names = [resultName(t) for t in self.__tests]
+        self.endResetModel()
+
+    def clear(self):
+        self.setTests([])
+
+
 class ResultItem(QWidget):
-    sigPlot = Signal(str, object)
+    # Shown in place of an expanded result
+    # Plot id, test and key
+    sigPlot = Signal(str, object, object)
     sigTable = Signal(str, object)
-
-    def __init__(self, test):
+    sigSave = Signal(object, str)
+    # Plot id, test, key and whether it is overlaid
+    sigOverlay = Signal(str, object, object, bool)
+    sigCollapse = Signal()
+
+    def __init__(self, test, key=None, overlaid=()):
+        # key: Identifies the result in the overlay, the test by default.
+        # overlaid: Overlaid (key, plot id) pairs.
         super().__init__()
         self.test = test
+        self.key = test if key is None else key
+        self.__overlayButtons = {}
+        self.setAutoFillBackground(True)
         self.initUI()
+        self.setOverlaid(overlaid)
 
     def initUI(self):
         relTest = self.test.info
-        name = "{0} {1}".format(datetime.fromtimestamp(
-            self.test.startTime).strftime('%Y%m%d-%H%M%S'), self.test.info.name)
-        rItem = CollapsibleBox("{0}".format(name))
-        hLayout = rItem.header().layout()
-        hLayout.addStretch()
+        header = ExpandedHeader(resultName(self.test))
+        header.clicked.connect(self.sigCollapse.emit)
 
         boxLayout = QVBoxLayout()
         boxLayout.setContentsMargins(15, 0, 3, 3)
@@ -79,14 +262,28 @@ class ResultItem(QWidget):
                 self.sigTable.emit(id, self.test)
             return signalTable
 
+        columns = Columns(self.test)
         for p in relTest.outputs:
             rInfo = relTest.outputs[p]
 
             if rInfo.type in ["field", "list"]:
                 for f in rInfo.fields:
+                    units = getattr(f, 'units', '')
+                    value = columns[p][f.label]
                     resultLayout.addWidget(QLabel(f"{p}.{f.label}:"), resultLayout.rowCount(), 0)
-                    resultLayout.addWidget(
-                        QLabel(f"{self.test.results[p][f.label]}{getattr(f, 'units', '')}"), resultLayout.rowCount()-1, 1)
+                    if isinstance(value, np.ndarray) and value.ndim:
+                        # Lists are summarized, the values are in the table
+                        lbl = QLabel(summaryText(
+                            columns.summary(p, f.label), units))
+                        lbl.setWordWrap(True)
+                    else:
+                        lbl = QLabel(f"{value}{units}")
+                    resultLayout.addWidget(lbl, resultLayout.rowCount()-1, 1)
+                if rInfo.type == "list":
+                    resultLayout.addWidget(QLabel(f"{p}:"), resultLayout.rowCount(), 0)
+                    btnTable = QPushButton("View")
+                    btnTable.clicked.connect(createSignalTable(p))
+                    resultLayout.addWidget(btnTable, resultLayout.rowCount()-1, 1)
             elif rInfo.type == "matrix":
                 resultLayout.addWidget(QLabel(f"{p}:"), resultLayout.rowCount(), 0)
                 btnTable = QPushButton("View")
@@ -106,9 +303,14 @@ class ResultItem(QWidget):
 
         def createSignalPlot(id):
             def signalPlot():
-                self.sigPlot.emit(id, self.test)
+                self.sigPlot.emit(id, self.test, self.key)
             return signalPlot
 
+        def createSignalOverlay(id):
+            def signalOverlay(checked):
+                self.sigOverlay.emit(id, self.test, self.key, checked)
+            return signalOverlay
+
         for p in relTest.plots:
             pInfo = relTest.plots[p]
 
@@ -116,43 +318,36 @@ class ResultItem(QWidget):
             btnPlot = QPushButton("Plot")
             btnPlot.clicked.connect(createSignalPlot(p))
             plotLayout.addWidget(btnPlot, plotLayout.rowCount()-1, 1)
+            btnOverlay = QPushButton("Overlay")
+            btnOverlay.setCheckable(True)
+            btnOverlay.setToolTip("Draw this plot together with other results")
+            btnOverlay.toggled.connect(createSignalOverlay(p))
+            plotLayout.addWidget(btnOverlay, plotLayout.rowCount()-1, 2)
+            self.__overlayButtons[p] = btnOverlay
 
         plotLayout.setColumnStretch(0, 0)
         plotLayout.setColumnStretch(1, 1)
+        plotLayout.setColumnStretch(2, 1)
         plots.setContentLayout(plotLayout)
         boxLayout.addWidget(plots)
 
-        rItem.setContentLayout(boxLayout)
-
         l = QVBoxLayout()
         l.setContentsMargins(0, 0, 0, 0)
-        l.addWidget(rItem)
+        l.setSpacing(0)
+        l.addWidget(header)
+        l.addLayout(boxLayout)
         self.setLayout(l)
 
+    def setOverlaid(self, overlaid):
+        # overlaid: Overlaid (key, plot id) pairs, only updates the buttons.
+        for id, btn in self.__overlayButtons.items():
+            btn.blockSignals(True)
+            btn.setChecked((self.key, id) in overlaid)
+            btn.blockSignals(False)
+
     def contextMenuEvent(self, event):
-        menu = QMenu(self)
-        saveResults = menu.addAction("Save Results")
-        savePreset = menu.addAction("Save as Preset")
-        action = menu.exec_(self.mapToGlobal(event.pos()))
-        if action == saveResults:
-            global LASTDIR
-            filepath = self.test.generateFilename()
-            if LASTDIR:
-                filepath = _path.join(LASTDIR, filepath)
-            path = QFileDialog.getSaveFileName(
-                self, "Save Results", filepath, filter="CSV (*.CSV)")
-            if path[0]:
-                LASTDIR = _path.split(path[0])[0]
-                self.test.export(path[0])
-            # path = QFileDialog.getExistingDirectory(
-            #     self, "Choose Directory")
-            # if path:
-            #     self.test.export(path)
-        elif action == savePreset:
-            path = QFileDialog.getSaveFileName(
-                self, "Save Preset", filter="JSON (*.json)")
-            if path[0]:
-                self.test.parameters.export(path[0])
+        resultMenu(self, self.test, self.mapToGlobal(event.pos()),
+                   self.sigSave.emit)
 
     def eventFilter(self, obj, event):
         if (event.type() == QEvent.Resize):
@@ -161,43 +356,197 @@ class ResultItem(QWidget):
         return super().eventFilter(obj, event)
 
 
+class ResultError(QWidget):
+    # Shown in place of an archived result that could not be read
+    sigCollapse = Signal()
+
+    def __init__(self, name, error):
+        super().__init__()
+        self.setAutoFillBackground(True)
+        header = ExpandedHeader(name)
+        header.clicked.connect(self.sigCollapse.emit)
+        l = QVBoxLayout()
+        l.setContentsMargins(0, 0, 0, 3)
+        l.addWidget(header)
+        lbl = QLabel("Unable to load result: {0}".format(error))
+        lbl.setWordWrap(True)
+        l.addWidget(lbl)
+        self.setLayout(l)
+
+
 class ResultPanel(QWidget):
-    sigPlot = Signal(str, object)
+    # Plot id, test and key, see ResultItem
+    sigPlot = Signal(str, object, object)
     sigTable = Signal(str, object)
+    # Plot id, test, key and whether it is overlaid, see ResultItem
+    sigOverlay = Signal(str, object, object, bool)
+    # Test and path, emitted when results are saved from the menu
+    sigSave = Signal(object, str)
+    # Archived results listed at once
+    PageSize = 100
 
     def __init__(self, *args, **kwargs):
         self.__limit = kwargs.pop("limit", 5)
         self.__direction = kwargs.pop("direction", 0)
         super().__init__(*args, **kwargs)
-        self.__tests = []
+        self.__archive = None
+        self.__definitions = None
+        # Most recently used tests, by archive key
+        self.__working = OrderedDict()
+        # Results opened from files in archive mode, oldest first. Listed
+        #   above the first page, they are not archived.
+        self.__opened = []
+        self.__offset = 0
+        self.__total = 0
+        # Overlaid (key, plot id) pairs
+        self.__overlaid = set()
         self.initUI()
 
     def initUI(self):
-        ui = QWidget(self)
-        ui.setObjectName("ResultPanel")
-        # self.ui.setStyleSheet("background-color: #0000FF")
-
-        testScroll = QScrollArea()
-        testScroll.setFrameStyle(QFrame.NoFrame | QFrame.Plain)
-        testScroll.setWidget(ui)
-        testScroll.setWidgetResizable(True)
-
-        listLayout = QVBoxLayout()
-
-        self.__list = QVBoxLayout()
+        self.__model = ResultModel(self.__load, self)
         self.applySort(self.__direction)
-        listLayout.addLayout(self.__list)
-        listLayout.addStretch(1)
-        ui.setLayout(listLayout)
+
+        self.__view = ExpandingListView(self.__createItem)
+        self.__view.setObjectName("ResultPanel")
+        self.__view.setModel(self.__model)
+        self.__view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.__view.customContextMenuRequested.connect(self.__contextMenu)
+
+        self.__search = QLineEdit()
+        self.__search.setPlaceholderText("Search results")
+        self.__search.setClearButtonEnabled(True)
+        searchTimer = QTimer(self)
+        searchTimer.setSingleShot(True)
+        searchTimer.setInterval(300)
+        searchTimer.timeout.connect(self.__searchChanged)
+        self.__search.textChanged.connect(searchTimer.start)
+        self.__prev = QToolButton()
+        self.__prev.setArrowType(Qt.LeftArrow)
+        self.__prev.clicked.connect(lambda: self.setPage(self.__offset - self.PageSize))
+        self.__next = QToolButton()
+        self.__next.setArrowType(Qt.RightArrow)
+        self.__next.clicked.connect(lambda: self.setPage(self.__offset + self.PageSize))
+        self.__pageLabel = QLabel()
 
         mainLayout = QVBoxLayout()
         mainLayout.setContentsMargins(0, 0, 0, 0)
+        self.__pager = QWidget()
         hLayout = QHBoxLayout()
-        hLayout.setContentsMargins(0, 0, 0, 0)
-        mainLayout.addLayout(hLayout)
-        mainLayout.addWidget(testScroll)
+        hLayout.setContentsMargins(3, 3, 3, 0)
+        hLayout.addWidget(self.__search, 1)
+        hLayout.addWidget(self.__prev)
+        hLayout.addWidget(self.__pageLabel)
+        hLayout.addWidget(self.__next)
+        self.__pager.setLayout(hLayout)
+        self.__pager.setVisible(False)
+        mainLayout.addWidget(self.__pager)
+        mainLayout.addWidget(self.__view)
         self.setLayout(mainLayout)
 
+    def __load(self, key):
+        test = self.__working.get(key)
+        if test is None:
+            test = self.__archive.load(key, self.__definitions)
+            self.__working[key] = test
+            self.__trimWorking()
+        else:
+            self.__working.move_to_end(key)
+        return test
+
+    def __trimWorking(self):
+        while len(self.__working) > self.__limit:
+            self.__working.popitem(last=False)
+
+    def __createItem(self, index):
+        try:
+            item = ResultItem(index.data(ResultModel.TestRole),
+                              index.data(ResultModel.KeyRole), self.__overlaid)
+        except Exception as e:
+            return ResultError(index.data(), e)
+        item.sigPlot.connect(self.sigPlot.emit)
+        item.sigOverlay.connect(self.sigOverlay.emit)
+        item.sigTable.connect(self.sigTable.emit)
+        item.sigSave.connect(self.sigSave.emit)
+        return item
+
+    def __contextMenu(self, pos):
+        index = self.__view.indexAt(pos)
+        if not index.isValid():
+            return
+        try:
+            test = index.data(ResultModel.TestRole)
+        except Exception as e:
+            QMessageBox.warning(self, "Result Error",
+                                "Unable to load result: {0}".format(e))
+            return
+        resultMenu(self, test, self.__view.viewport().mapToGlobal(pos),
+                   self.sigSave.emit)
+
+    def setOverlaid(self, overlaid):
+        # Shows which plots are overlaid, as (key, plot id) pairs
+        self.__overlaid = set(overlaid)
+        for w in self.__view.detailWidgets():
+            if isinstance(w, ResultItem):
+                w.setOverlaid(self.__overlaid)
+
+    def setArchive(self, archive, definitions=None):
+        # archive: A ResultArchive, finished tests are stored in it and the
+        #   panel lists its contents. If None, results are only kept in memory.
+        # definitions: Used to read stored results.
+        self.__archive = archive
+        self.__definitions = definitions
+        self.__working.clear()
+        self.__offset = 0
+        self.__pager.setVisible(archive is not None)
+        if archive is None:
+            self.__model.clear()
+            for test in self.__opened:
+                self.__model.append(test)
+            self.__opened.clear()
+            self.setLimit()
+        else:
+            self.refreshPage()
+
+    def archive(self):
+        return self.__archive
+
+    def setPage(self, offset):
+        self.__offset = max(0, offset)
+        self.refreshPage()
+
+    def __ids(self):
+        # Tests that are still defined, records of others are not listed
+        return None if self.__definitions is None else list(self.__definitions)
+
+    def __shownOpened(self):
+        # Opened results listed above the page, newest first
+        if self.__offset:
+            return []
+        search = self.__search.text().lower()
+        return [t for t in reversed(self.__opened)
+                if search in resultName(t).lower() or search in t.id.lower()]
+
+    def refreshPage(self):
+        search = self.__search.text()
+        self.__total = self.__archive.count(search, self.__ids())
+        if self.__offset >= self.__total:
+            self.__offset = max(0, (self.__total - 1) // self.PageSize * self.PageSize)
+        self.__model.setTests(self.__shownOpened() + self.__archive.page(
+            self.__offset, self.PageSize, search, self.__direction < 0,
+            self.__ids()))
+        self.__updatePager()
+
+    def __updatePager(self):
+        shown = self.__model.rowCount() - len(self.__shownOpened())
+        self.__pageLabel.setText("{0}-{1} of {2}".format(
+            self.__offset + 1 if shown else 0, self.__offset + shown, self.__total))
+        self.__prev.setEnabled(self.__offset > 0)
+        self.__next.setEnabled(self.__offset + shown < self.__total)
+
+    def __searchChanged(self):
+        if self.__archive is not None:
+            self.setPage(0)
+
     def setLimit(self, limit=None):
         if limit is None:
             pass
@@ -205,26 +554,78 @@ class ResultPanel(QWidget):
             raise Exception("Result limit must be 1 or more.")
         else:
             self.__limit = limit
-        while len(self.__tests) > self.__limit:
-            self.__tests[0].deleteLater()
-            del self.__tests[0]
+        if self.__archive is None:
+            self.__model.trim(self.__limit)
+        else:
+            # Everything is archived, only the number kept in memory changes
+            self.__trimWorking()
+            self.__trimOpened()
+
+    def __trimOpened(self):
+        while len(self.__opened) > self.__limit:
+            row = self.__model.rowOf(self.__opened.pop(0))
+            if row >= 0:
+                self.__model.remove(row)
 
     def applySort(self, direction):
         # For now, anything other than 0 reverses order
-        if direction >= 0:
-            self.__list.setDirection(self.__list.BottomToTop)
+        self.__direction = direction
+        self.__model.setNewestFirst(direction < 0)
+        if self.__archive is not None:
+            self.setPage(0)
+
+    def append(self, test, store=True):
+        # store: Whether the archive keeps the test, False for results opened
+        #   from files, which are only listed.
+        if self.__archive is None:
+            self.__model.append(test)
+            self.setLimit()
+            return
+        if not store:
+            self.__opened.append(test)
+            if test in self.__shownOpened():
+                self.__model.insert(0, test)
+            self.__trimOpened()
+            return
+        key = self.__archive.add(test)
+        self.__working[key] = test
+        self.__trimWorking()
+        # The page is updated in place, so expanded results stay open
+        for k in self.__archive.prune():
+            row = self.__model.rowOfKey(k)
+            if row >= 0:
+                self.__model.remove(row)
+        search = self.__search.text()
+        newestFirst = self.__direction < 0
+        self.__total = self.__archive.count(search, self.__ids())
+        position = self.__archive.position(key, search, self.__ids(), newestFirst)
+        top = len(self.__shownOpened())
+        if position is None or position >= self.__offset + self.PageSize:
+            pass
+        elif position < self.__offset:
+            # Before this page, which moves down by one
+            self.__model.insert(top, self.__archive.page(
+                self.__offset, 1, search, newestFirst, self.__ids())[0])
         else:
-            self.__list.setDirection(self.__list.TopToBottom)
-
-    def append(self, test):
-        item = ResultItem(test)
-        item.sigPlot.connect(self.sigPlot.emit)
-        item.sigTable.connect(self.sigTable.emit)
-        self.__tests.append(item)
-        self.setLimit()
-        self.__list.insertWidget(0, item)
+            self.__model.insert(top + position - self.__offset,
+                                self.__archive.record(key))
+        shown = self.__model.rowCount() - top
+        if shown > self.PageSize:
+            self.__model.remove(self.__model.rowCount() - 1)
+        elif shown < self.PageSize and self.__offset + shown < self.__total:
+            # Removed by prune
+            for record in self.__archive.page(
+                    self.__offset + shown, self.PageSize - shown, search,
+                    newestFirst, self.__ids()):
+                self.__model.insert(self.__model.rowCount(), record)
+        self.__updatePager()
 
     def clear(self):
-        for i in self.__tests:
-            i.deleteLater()
-        self.__tests.clear()
+        # Called when the test definitions change
+        if self.__archive is None:
+            self.__model.clear()
+        else:
+            self.__working.clear()
+            self.__opened.clear()
+            # Only records of tests that are still defined are listed
+            self.refreshPage()
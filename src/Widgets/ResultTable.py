@@ -1,49 +1,103 @@
 '''
-Last Modified: 2021-08-20
+Last Modified: 2026-10-18
 
 @author: Jesse M. Barr
 
 Contains:
+    -ResultTableModel
     -ResultTable
 
 Changes:
+    -2026-10-18:
+        -Data can be replaced with setData() so the table can be reused.
+        -Data is given as columns, rather than rows.
+        -Replaced the QTableWidget with a QTableView backed by
+            ResultTableModel, which formats cells on demand from the column
+            arrays instead of creating an item per cell.
+        -Columns of different lengths are shown with empty cells, so the
+            lists of an output can be viewed together.
 
 ToDo:
 
 '''
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import (QWidget, QTableWidget, QTableWidgetItem,
-                             QVBoxLayout, QHeaderView)
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtWidgets import (QWidget, QTableView, QVBoxLayout, QHeaderView)
+
+
+class ResultTableModel(QAbstractTableModel):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__labels = []
+        self.__columns = []
+        self.__rows = 0
+
+    def setColumns(self, labels, columns):
+        # columns is a list of sequences (e.g. numpy arrays), matching labels.
+        #   They are referenced, not copied.
+        self.beginResetModel()
+        self.__labels = list(labels)
+        self.__columns = list(columns)
+        # Columns may differ in length, e.g. the lists of an output
+        self.__rows = max((len(c) for c in self.__columns), default=0)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.__rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.__columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            column = self.__columns[index.column()]
+            if index.row() >= len(column):
+                return None
+            return str(column[index.row()])
+        elif role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            if section < len(self.__labels):
+                return self.__labels[section]
+            return None
+        return str(section + 1)
 
 
 class ResultTable(QWidget):
 
-    def __init__(self, labels, data, *args, **kwargs):
+    def __init__(self, labels=None, data=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._columnHeaders = labels
-        self._data = data
         self.setObjectName("ResultTable")
+        self.__model = ResultTableModel(self)
         self.initUI()
+        self.setData(labels or [], data or [])
 
     def initUI(self):
 
-        tableWidget = QTableWidget()
-        tableWidget.setRowCount(len(self._data))
-        tableWidget.setColumnCount(len(self._columnHeaders))
-        for i in range(0, len(self._columnHeaders)):
-            tableWidget.setHorizontalHeaderItem(
-                i, QTableWidgetItem(self._columnHeaders[i]))
+        self.__table = QTableView()
+        self.__table.setModel(self.__model)
+        self.__table.move(0, 0)
 
-        for r in range(0, len(self._data)):
-            for c in range(0, len(self._data[r])):
-                item = QTableWidgetItem(str(self._data[r][c]))
-                item.setTextAlignment(Qt.AlignCenter)
-                tableWidget.setItem(r, c, item)
-        tableWidget.move(0, 0)
-
-        tableWidget.horizontalHeader().setTextElideMode(Qt.ElideRight)
-        tableWidget.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.__table.horizontalHeader().setTextElideMode(Qt.ElideRight)
+        self.__table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        # Keep fixed row heights, so rows are never measured.
+        self.__table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
 
         layout = QVBoxLayout()
-        layout.addWidget(tableWidget)
+        layout.addWidget(self.__table)
         self.setLayout(layout)
+
+    def model(self):
+        return self.__model
+
+    def setData(self, labels, data):
+        # data is a list of columns, matching labels
+        self.__model.setColumns(labels, data)
+        self.__table.scrollToTop()
@@ -0,0 +1,93 @@
+'''
+Last Modified: 2026-10-18
+
+Contains:
+    -StatusLabel
+
+Status bar label for the running test.
+
+Received data only updates counters. The label is re-formatted from a timer,
+    a few times per second at most, with the test's estimated time remaining,
+    the amount of data received and the message rate, so status bookkeeping
+    does not compete with data handling on the GUI thread.
+
+ToDo:
+
+'''
+from time import perf_counter
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QLabel
+
+
+class StatusLabel(QLabel):
+
+    def __init__(self, text="", rate=4, *args, **kwargs):
+        super().__init__(text, *args, **kwargs)
+        self.__test = None
+        self.__message = None
+        self.__timer = QTimer(self)
+        self.__timer.timeout.connect(self.refresh)
+        self.__timer.setInterval(int(1000 / max(1, rate)))
+        self.reset()
+
+    def reset(self):
+        self.__bytes = 0
+        self.__lines = 0
+        self.__messages = 0
+        self.__lastCount = 0
+        self.__lastTime = perf_counter()
+        self.__rate = 0.0
+
+    @property
+    def test(self):
+        return self.__test
+
+    def startTest(self, test):
+        self.__test = test
+        self.__message = None
+        self.reset()
+        self.refresh()
+        self.__timer.start()
+
+    def stopTest(self):
+        self.__timer.stop()
+        self.__test = None
+
+    def received(self, msg):
+        # Called for every received message, only counts.
+        self.__messages += 1
+        self.__bytes += len(msg)
+        self.__lines += msg.count("\n")
+
+    def setText(self, text):
+        # While a test is running, the message replaces the countdown.
+        self.__message = text if self.__test is not None else None
+        super().setText(text)
+
+    def refresh(self):
+        test = self.__test
+        if test is None:
+            return
+        now = perf_counter()
+        elapsed = now - self.__lastTime
+        if elapsed > 0:
+            # Smooth the rate, so it is readable at a few updates per second
+            rate = (self.__messages - self.__lastCount) / elapsed
+            self.__rate = rate if not self.__lastCount else \
+                0.5 * self.__rate + 0.5 * rate
+        self.__lastCount = self.__messages
+        self.__lastTime = now
+
+        if self.__message:
+            text = self.__message
+        else:
+            rem = test.estimateRemaining()
+            if rem is None:
+                text = "Running {0}...".format(test.id)
+            else:
+                text = "Running {0}: ~{1}s".format(test.id, round(rem))
+        if self.__messages:
+            text = "{0}  |  Received {1} lines, {2:.1f} kB, {3:.0f} msg/s".format(
+                text, self.__lines, self.__bytes / 1024, self.__rate)
+        if text != self.text():
+            super().setText(text)
@@ -1,14 +1,23 @@
 '''
-Last Modified: 2021-05-27
+Last Modified: 2026-10-18
 
 @author: Jesse M. Barr
 
 Contains:
+    -definitionKey
     -TestParameter
     -TestPanel
     -TestForm
 
 Changes:
+    -2026-10-18:
+        -Added autosave format.
+        -Added setTests(), the form can be created empty and filled in once
+            the definitions are loaded.
+        -A test's TestPanel is created when the test is first selected, and
+            kept. When the definitions are set again, e.g. after importing
+            tests, only panels of tests whose parameters changed are rebuilt.
+            Building the form is measured by benchmarks/form.py.
     -2021-05-05:
         -Hide repeat/export if unchecked
     -2021-04-27:
@@ -29,9 +38,25 @@ from PyQt5.QtWidgets import (
 
 
 # Local
+from Results import FILTERS
 from . import ElideLabel, FuncComboBox, GroupComboBox, NumberSpinBox
 
 
+def definitionKey(value, path=()):
+    # Comparable snapshot of a definition, e.g. a test's parameters. path
+    #   holds the ids of the objects being converted, to stop at cycles.
+    if id(value) in path:
+        return None
+    path += (id(value),)
+    if isinstance(value, dict):
+        return tuple((k, definitionKey(v, path)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(definitionKey(v, path) for v in value)
+    if hasattr(value, "__dict__"):
+        return (type(value).__name__, definitionKey(vars(value), path))
+    return value
+
+
 class TestParameter(QWidget):
     sigChanged = Signal(object)
 
@@ -156,10 +181,43 @@ class TestForm(QWidget):
         self.tests = tests
         self.exportDir = getcwd()
         self.sigSubmit = ACEstatSignal("testform_submit")
+        # Test id: (definitionKey of the test, TestPanel), see __panel
+        self.__panels = {}
+        # Kept with the cached panels when the rest of the form is rebuilt
+        self.__testPanels = QStackedWidget()
+        self.__testPanels.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Maximum)
         self.initUI()
 
+    def __panel(self, id, test):
+        # The test's panel, created on first use
+        cached = self.__panels.get(id)
+        if cached is not None:
+            cached[1].test = test
+            return cached[1]
+        p = TestPanel(test)
+        p.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        self.__panels[id] = (self.__key(test), p)
+        return p
+
+    @staticmethod
+    def __key(test):
+        # A panel only shows the name and parameters, presets are read
+        #   when its list is opened.
+        return (test.name, definitionKey(test.parameters))
+
     def initUI(self):
+        # Panels of unchanged tests are kept, the others are rebuilt when
+        #   selected.
+        for id in list(self.__panels):
+            key, panel = self.__panels[id]
+            test = self.tests[id] if id in self.tests else None
+            if test is None or self.__key(test) != key:
+                del self.__panels[id]
+                self.__testPanels.removeWidget(panel)
+                panel.deleteLater()
         if self.layout():
+            # Not deleted with the old layout
+            self.__testPanels.setParent(None)
             QWidget().setLayout(self.layout())
         ui = QWidget()
         ui.setObjectName("TestStaging")
@@ -190,23 +248,25 @@ class TestForm(QWidget):
         hLayout.addStretch()
         vLayout.addLayout(hLayout)
 
-        self.__testPanels = QStackedWidget()
-        self.__testPanels.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Maximum)
+        # Name: (id, test)
         tests = {}
 
-        for t in self.tests.values():
+        for id, t in self.tests.items():
             testSelect.Group(t.technique).addChild(t.name, t.description)
-            p = TestPanel(t)
-            p.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
-            tests[t.name] = self.__testPanels.addWidget(p)
+            tests[t.name] = (id, t)
 
         def setTest():
             testSelect.setToolTip(testSelect.currentText())
-            self.__testPanels.currentWidget().setSizePolicy(QSizePolicy.Ignored,
-                                                     QSizePolicy.Ignored)
-            self.__testPanels.setCurrentIndex(tests[testSelect.currentText()])
-            self.__testPanels.currentWidget().setSizePolicy(QSizePolicy.Expanding,
-                                                     QSizePolicy.Expanding)
+            if testSelect.currentText() not in tests:
+                return
+            if self.__testPanels.currentWidget() is not None:
+                self.__testPanels.currentWidget().setSizePolicy(
+                    QSizePolicy.Ignored, QSizePolicy.Ignored)
+            panel = self.__panel(*tests[testSelect.currentText()])
+            if self.__testPanels.indexOf(panel) < 0:
+                self.__testPanels.addWidget(panel)
+            self.__testPanels.setCurrentWidget(panel)
+            panel.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
         vLayout.addWidget(self.__testPanels)
 
@@ -277,6 +337,16 @@ class TestForm(QWidget):
 
         rLayout.addWidget(outpath)
 
+        hLayout = QHBoxLayout()
+        hLayout.setContentsMargins(0, 0, 0, 0)
+        hLayout.addWidget(QLabel("Format:"))
+        exportFormat = QComboBox()
+        for ext, name in FILTERS.items():
+            exportFormat.addItem(name, ext)
+        hLayout.addWidget(exportFormat)
+        hLayout.addStretch()
+        rLayout.addLayout(hLayout)
+
         hLayout = QHBoxLayout()
         hLayout.setContentsMargins(0, 0, 0, 0)
         exportBtn = QPushButton("Choose Location")
@@ -312,7 +382,8 @@ class TestForm(QWidget):
                 inner_delay=inDelay.value(),
                 run_forever=run_forever,
                 iterations=iterations,
-                export=export
+                export=export,
+                export_format=exportFormat.currentData()
             )
 
         hl = QHBoxLayout()
@@ -336,6 +407,10 @@ class TestForm(QWidget):
         mainLayout.addWidget(testScroll)
         self.setLayout(mainLayout)
 
+    def setTests(self, tests):
+        self.tests = tests
+        self.initUI()
+
     @property
     def CurrentParameters(self):
         params = {}
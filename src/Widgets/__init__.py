@@ -1,11 +1,17 @@
 from .CollapsibleBox import CollapsibleBox
+from .Console import Console
+from .DiagnosticsDialog import DiagnosticsDialog
+from .ExpandingList import ExpandingListView
 from .Formatting import ElideLabel
 from .GroupComboBox import GroupComboBox
 from . import Images
 from .PlotCanvas import PlotCanvas
+from .LivePlot import LivePlot
 from .FuncComboBox import FuncComboBox
 from .NumberSpinBox import NumberSpinBox
 from .TestForm import TestForm
 from .QueuePanel import QueuePanel
 from .ResultPanel import ResultPanel
 from .ResultTable import ResultTable
+from .ResultDisplay import ResultDisplay
+from .StatusLabel import StatusLabel
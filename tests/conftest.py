@@ -0,0 +1,40 @@
+import os
+import sys
+
+# The application runs from src, e.g. "python Main.py"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), "src"))
+# Widgets are tested without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from types import SimpleNamespace as NS  # noqa: E402
+import pytest  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def app():
+    from PyQt5.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+class LiveTest(object):
+    # Finished ACEstatPy test, with its results as lists
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+def definition(id, name, technique=None):
+    # ACEstatPy test definition, with an output of each type
+    return NS(
+        id=id, name=name, technique=technique,
+        parameters={
+            "rate": NS(name="Scan Rate", type="int", min=0, max=1000, units="mV/s"),
+            "gain": NS(name="Gain", type="float", min=0, max=10),
+            "mode": NS(name="Mode", type="select", options={"ox": "Oxidation", "red": "Reduction"}),
+        },
+        outputs={
+            "data": NS(type="matrix", fields=[NS(label="Time", units="s"),
+                                              NS(label="Current", units="A")]),
+            "peak": NS(type="field", fields=[NS(label="Peak", units="A")]),
+            "samples": NS(type="list", fields=[NS(label="Samples")]),
+        },
+        presets={}, plots={})
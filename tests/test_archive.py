@@ -0,0 +1,85 @@
+import os
+import numpy as np
+import pytest
+from Results import ResultArchive
+from conftest import LiveTest, definition
+
+
+@pytest.fixture
+def definitions():
+    return {"cv": definition("cv", "Cyclic Voltammetry", "Voltammetry"),
+            "ca": definition("ca", "Chronoamperometry", "Amperometry")}
+
+
+def liveTest(definitions, id, start, rate):
+    return LiveTest(id=id, info=definitions[id], startTime=start,
+                    parameters={"rate": rate},
+                    results={"data": {"Time": [0.0, 1.0, 2.0],
+                                      "Current": [rate, rate + 1.0, rate + 2.0]}})
+
+
+@pytest.fixture
+def archive(tmp_path, definitions):
+    archive = ResultArchive(str(tmp_path / "archive"))
+    # Added out of order, listed by start time
+    for i, start in enumerate((3, 1, 4, 0, 2)):
+        archive.add(liveTest(definitions, ("cv", "ca")[i % 2], 100.0 + start,
+                             10 * start))
+    yield archive
+    archive.close()
+
+
+def test_page_and_search(archive):
+    assert archive.count() == 5
+    newest = archive.page(0, 10)
+    assert [r.startTime for r in newest] == [104, 103, 102, 101, 100]
+    assert [r.startTime for r in archive.page(1, 2, newestFirst=False)] == [101, 102]
+    assert [r.startTime for r in archive.page(3, 10)] == [101, 100]
+    record = newest[1]
+    assert (record.id, record.name, record.technique, record.parameters) == (
+        "cv", "Cyclic Voltammetry", "Voltammetry", {"rate": 30})
+    assert archive.record(record.key) == record
+    # By name, technique or parameters, and by test id
+    assert archive.count("chrono") == 2
+    assert archive.count("voltam") == 3
+    assert [r.startTime for r in archive.page(0, 10, '"rate": 40')] == [104]
+    assert archive.count(ids=["ca"]) == 2
+    assert archive.count(ids=[]) == 0
+    assert archive.count("amper", ids=["cv"]) == 0
+
+
+def test_position_matches_page(archive):
+    for search, ids in (("", None), ("cyclic", None), ("", ["ca"])):
+        for newestFirst in (True, False):
+            page = archive.page(0, 10, search, newestFirst, ids)
+            for i, r in enumerate(page):
+                assert archive.position(r.key, search, ids, newestFirst) == i
+    ca = archive.page(0, 10, ids=["ca"])[0]
+    assert archive.position(ca.key, ids=["cv"]) is None
+    assert archive.position(-1) is None
+
+
+def test_load(archive, definitions):
+    record = archive.page(0, 1)[0]
+    test = archive.load(record.key, definitions)
+    assert test.archiveKey == record.key
+    assert (test.id, test.startTime, dict(test.parameters)) == ("cv", 104, {"rate": 40})
+    np.testing.assert_array_equal(test.results["data"]["Current"], [40, 41, 42])
+    with pytest.raises(Exception):
+        archive.record(-1)
+
+
+def test_prune_removes_the_oldest(archive):
+    assert archive.prune() == []
+    oldest = archive.page(0, 2, newestFirst=False)
+    archive.setLimit(3)
+    assert sorted(archive.prune()) == sorted(r.key for r in oldest)
+    assert [r.startTime for r in archive.page(0, 10)] == [104, 103, 102]
+    for r in oldest:
+        assert not os.path.exists(os.path.join(archive.path, "{0}.npz".format(r.key)))
+    assert len([f for f in os.listdir(archive.path) if f.endswith(".npz")]) == 3
+    # Kept across reopening
+    archive.close()
+    reopened = ResultArchive(archive.path)
+    assert reopened.count() == 3
+    reopened.close()
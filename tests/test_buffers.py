@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("acestatpy")
+from Utilities import SeriesBuffer  # noqa: E402
+
+
+def test_growth_keeps_samples():
+    buffer = SeriesBuffer(capacity=4)
+    values = np.random.default_rng(0).standard_normal(1000)
+    capacities = set()
+    for i in range(0, len(values), 7):
+        buffer.extend(values[i:i + 7])
+        capacities.add(buffer.capacity)
+        assert len(buffer) == min(i + 7, len(values))
+    np.testing.assert_array_equal(buffer.data, values)
+    # Doubled each time it was full
+    assert sorted(capacities) == [2 ** k for k in range(3, 11)]
+    buffer.append(1.5)
+    assert buffer.data[-1] == 1.5 and len(buffer) == 1001
+
+
+def test_views_after_reallocation():
+    buffer = SeriesBuffer(capacity=4)
+    buffer.extend([1.0, 2.0, 3.0])
+    view = buffer.data
+    assert view.base is not None
+    buffer.extend(np.arange(10.0))
+    # The old view still holds the old samples, a new one sees all of them
+    np.testing.assert_array_equal(view, [1.0, 2.0, 3.0])
+    assert not np.shares_memory(view, buffer.data)
+    assert len(buffer.data) == 13
+    # Without reallocating, views share the buffer
+    buffer.reserve(100)
+    view = buffer.data
+    buffer.extend([20.0])
+    assert np.shares_memory(view, buffer.data)
+
+
+def test_clear_keeps_capacity():
+    buffer = SeriesBuffer(dtype=np.int64, capacity=2)
+    buffer.extend(range(100))
+    capacity = buffer.capacity
+    buffer.clear()
+    assert len(buffer) == 0 and buffer.capacity == capacity
+    buffer.extend([5])
+    assert buffer.data.dtype == np.int64 and list(buffer.data) == [5]
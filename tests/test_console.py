@@ -0,0 +1,71 @@
+import pytest
+
+pytest.importorskip("acestatpy")
+pytest.importorskip("PyQt5")
+from PyQt5.QtGui import QTextCursor  # noqa: E402
+from Widgets.Console import Console  # noqa: E402
+
+
+@pytest.fixture
+def console(app):
+    console = Console()
+    console.resize(300, 100)
+    yield console
+    console.deleteLater()
+
+
+def lines(start, count):
+    return "".join("line {0}\n".format(i) for i in range(start, start + count))
+
+
+def test_pending_text_is_bounded(console):
+    console.setMaximumBlockCount(10)
+    for i in range(100):
+        console.write(lines(i, 1))
+    stats = console.stats()
+    # Chunks older than the last 10 lines are dropped before the insert
+    assert stats["dropped"] == len(lines(0, 90))
+    console.flush()
+    text = console.toPlainText()
+    assert text.split("\n")[-2] == "line 99"
+    assert console.document().blockCount() <= 10
+    # A single chunk is cut to its last lines
+    console.clear()
+    console.write(lines(0, 50))
+    console.flush()
+    assert console.toPlainText().split("\n")[-2] == "line 49"
+    assert console.document().blockCount() <= 10
+    assert console.stats()["flushes"] == 2
+
+
+def test_appends_at_the_end(console):
+    console.write(lines(0, 3))
+    console.flush()
+    # The user's cursor, e.g. selecting text, is left alone
+    cursor = console.textCursor()
+    cursor.movePosition(QTextCursor.Start)
+    console.setTextCursor(cursor)
+    console.write("last\n")
+    console.flush()
+    assert console.toPlainText() == lines(0, 3) + "last\n"
+    assert console.textCursor().position() == 0
+
+
+def test_follows_the_tail_only_at_the_bottom(console):
+    console.show()
+    scrollBar = console.verticalScrollBar()
+    console.write(lines(0, 100))
+    console.flush()
+    assert scrollBar.maximum() > 0
+    assert scrollBar.value() == scrollBar.maximum()
+    # Scrolled up, new text doesn't move the view
+    scrollBar.setValue(10)
+    console.write(lines(100, 20))
+    console.flush()
+    assert scrollBar.value() == 10
+    # Back at the bottom, it follows again
+    scrollBar.setValue(scrollBar.maximum())
+    console.write(lines(120, 20))
+    console.flush()
+    assert scrollBar.value() == scrollBar.maximum()
+    console.hide()
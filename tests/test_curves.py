@@ -0,0 +1,68 @@
+from types import SimpleNamespace as NS
+import numpy as np
+from Results import CurveCache, prepareCurves
+
+
+class Result(object):
+    # Finished test with one plot of two series over n points
+    def __init__(self, n):
+        self.results = {"data": {"t": np.arange(n, dtype=np.int32),
+                                 "a": np.random.random(n),
+                                 "b": [np.nan] + [1.0] * (n - 1)}}
+        self.info = NS(plots={"plot": NS(series=[
+            NS(x=NS(output="data", field="t"), y=NS(output="data", field="a"),
+               name="A"),
+            NS(x=NS(output="data", field="t"), y=NS(output="data", field="b")),
+        ])})
+
+
+# Bytes of a Result's prepared plot
+def size(n):
+    return 4 * 8 * n
+
+
+def test_prepared_curves():
+    test = Result(10)
+    a, b = prepareCurves(test, "plot")
+    assert a.x.dtype == np.float64 and not a.x.flags.writeable
+    assert (a.name, b.name) == ("A", "")
+    assert a.bounds[0] == (0, 9)
+    assert a.bounds[1] == (test.results["data"]["a"].min(), test.results["data"]["a"].max())
+    # Not finite values are skipped
+    assert b.bounds[1] == (1, 1)
+    a.extra["pyramid"] = np.zeros(4)
+    assert a.nbytes == 2 * 80 + 32
+
+
+def test_least_recently_used_are_evicted():
+    tests = [Result(100) for i in range(4)]
+    cache = CurveCache(budget=3 * size(100))
+    curves = [cache.get(i, "plot", t) for i, t in enumerate(tests[:3])]
+    assert len(cache) == 3 and cache.nbytes == 3 * size(100)
+    # Cached by key, the test is not read again
+    assert cache.get(0, "plot", None) is curves[0]
+    cache.get(3, "plot", tests[3])
+    assert (1, "plot") not in cache
+    assert [k in cache for k in ((0, "plot"), (2, "plot"), (3, "plot"))] == [True] * 3
+    cache.setBudget(size(100))
+    assert len(cache) == 1 and (3, "plot") in cache
+
+
+def test_most_recent_is_kept_over_budget():
+    cache = CurveCache(budget=size(10))
+    cache.get("small", "plot", Result(10))
+    cache.get("large", "plot", Result(1000))
+    assert len(cache) == 1 and ("large", "plot") in cache
+
+
+def test_pinned_are_not_evicted():
+    cache = CurveCache(budget=2 * size(100))
+    cache.get(0, "plot", Result(100))
+    cache.get(1, "plot", Result(100))
+    cache.setPinned([(0, "plot"), (1, "plot")])
+    cache.get(2, "plot", Result(100))
+    assert len(cache) == 3
+    cache.setPinned([(1, "plot")])
+    assert [k for k in range(3) if (k, "plot") in cache] == [1, 2]
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
@@ -0,0 +1,161 @@
+import json
+import os
+import pickle
+import sys
+from types import SimpleNamespace as NS
+import pytest
+
+pytest.importorskip("acestatpy")
+from Utilities.DefinitionCache import DefinitionCache  # noqa: E402
+
+# The package exports the class under the module's name
+module = sys.modules[DefinitionCache.__module__]
+
+
+class Definitions(dict):
+    # Stand-in for ACEstatPy's Definitions, reading tests from JSON
+    parsed = 0
+
+    def importTests(self, path):
+        Definitions.parsed += 1
+        self.clear()
+        with open(path) as f:
+            for id, name in json.load(f).items():
+                self[id] = NS(id=id, name=name, presets={})
+
+    def loadCustomPreset(self, path):
+        with open(path) as f:
+            preset = json.load(f)
+        self[preset["test"]].presets[preset["name"]] = preset["parameters"]
+
+
+class Bundled(Definitions):
+    # Parses its own tests as it is created, as ACEstatPy does
+    parsed = 0
+
+    def __init__(self):
+        Bundled.parsed += 1
+        super().__init__(b0=NS(id="b0", name="Bundled", presets={}))
+
+
+class Instrument(object):
+    def __init__(self):
+        self.Definitions = Bundled()
+
+
+class Catalog(object):
+    # Definitions that aren't a dict
+    parsed = 0
+
+    def __init__(self):
+        self.tests = {}
+
+    def items(self):
+        return self.tests.items()
+
+    def importTests(self, path):
+        Catalog.parsed += 1
+
+
+class Payload(object):
+    # Sets ran when it is unpickled
+    ran = False
+
+    def __reduce__(self):
+        return (setattr, (Payload, "ran", True))
+
+
+@pytest.fixture
+def files(tmp_path, monkeypatch):
+    monkeypatch.setattr(module, "acestatpyVersion", lambda: "1.0")
+    Definitions.parsed = Bundled.parsed = Catalog.parsed = 0
+    tests = tmp_path / "tests.json"
+    tests.write_text(json.dumps({"t0": "Test 0", "t1": "Test 1"}))
+    preset = tmp_path / "preset.json"
+    preset.write_text(json.dumps(
+        {"test": "t0", "name": "Custom", "parameters": {"a": 1}}))
+    cache = DefinitionCache(str(tmp_path / "user" / "definitions.cache"))
+    return cache, str(tests), [str(preset)]
+
+
+def test_restored_while_unchanged(files):
+    cache, tests, presets = files
+    assert not cache.load(Definitions(), tests, presets)
+    definitions = Definitions({"old": NS()})
+    assert cache.load(definitions, tests, presets)
+    assert Definitions.parsed == 1
+    assert sorted(definitions) == ["t0", "t1"]
+    assert definitions["t0"].presets == {"Custom": {"a": 1}}
+
+
+def test_changed_sources_are_parsed(files, monkeypatch):
+    cache, tests, presets = files
+    cache.load(Definitions(), tests, presets)
+    # Same size, newer modification time
+    stat = os.stat(tests)
+    os.utime(tests, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert not cache.load(Definitions(), tests, presets)
+    # Different size
+    with open(tests, "w") as f:
+        json.dump({"t0": "Test 0"}, f)
+    definitions = Definitions()
+    assert not cache.load(definitions, tests, presets)
+    assert sorted(definitions) == ["t0"]
+    # A preset less
+    assert not cache.load(Definitions(), tests)
+    assert cache.load(Definitions(), tests)
+    # Another ACEstatPy version
+    monkeypatch.setattr(module, "acestatpyVersion", lambda: "1.1")
+    assert not cache.load(Definitions(), tests)
+    assert Definitions.parsed == 5
+
+
+def test_unknown_version_is_not_cached(files, monkeypatch):
+    cache, tests, presets = files
+    monkeypatch.setattr(module, "acestatpyVersion", lambda: None)
+    assert not cache.load(Definitions(), tests, presets)
+    assert not os.path.exists(cache.path)
+    assert not cache.load(Definitions(), tests, presets)
+
+
+def test_header_checked_before_unpickling(files):
+    cache, tests, presets = files
+    cache.load(Definitions(), tests, presets)
+    with open(cache.path, "rb") as f:
+        header = json.loads(f.readline())
+    header["sources"][0][2] += 1
+    for first in (json.dumps(header).encode() + b"\n", b""):
+        with open(cache.path, "wb") as f:
+            f.write(first + pickle.dumps(Payload()))
+        assert not cache.load(Definitions(), tests, presets)
+        assert not Payload.ran
+    # Stored again once parsed
+    assert cache.load(Definitions(), tests, presets)
+
+
+def test_bundled_restored_before_parsing(files):
+    cache, tests, presets = files
+    assert cache.create(Instrument)[1] is None
+    instance, error = cache.create(Instrument)
+    assert error is None and Bundled.parsed == 1
+    assert type(instance.Definitions) is Bundled
+    assert sorted(instance.Definitions) == ["b0"]
+    # The class is put back
+    assert type(Instrument().Definitions) is Bundled and Bundled.parsed == 2
+    # Imported tests are restored in the same way
+    cache.create(Instrument, tests, presets)
+    instance, error = cache.create(Instrument, tests, presets)
+    assert error is None and (Bundled.parsed, Definitions.parsed) == (3, 1)
+    assert instance.Definitions["t0"].presets == {"Custom": {"a": 1}}
+    # A missing preset leaves the bundled definitions
+    os.remove(presets[0])
+    instance, error = cache.create(Instrument, tests, presets)
+    assert isinstance(error, OSError)
+    assert sorted(instance.Definitions) == ["b0"]
+
+
+def test_only_dicts_are_restored(files):
+    cache, tests, presets = files
+    assert not cache.load(Catalog(), tests)
+    assert not cache.load(Catalog(), tests)
+    assert Catalog.parsed == 2
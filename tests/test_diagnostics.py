@@ -0,0 +1,43 @@
+import math
+import numpy as np
+import pytest
+
+pytest.importorskip("acestatpy")
+from Utilities import LatencyHistogram  # noqa: E402
+
+# Ratio between bucket edges
+WIDTH = 10 ** (1 / LatencyHistogram.PerDecade)
+
+
+def test_percentiles_within_a_bucket():
+    rng = np.random.default_rng(0)
+    samples = np.exp(rng.normal(math.log(2e-3), 1.5, 20000))
+    histogram = LatencyHistogram()
+    for s in samples:
+        histogram.add(float(s))
+    ordered = np.sort(samples)
+    for p in (1, 25, 50, 90, 95, 99, 99.9, 100):
+        # Nearest rank
+        exact = ordered[max(math.ceil(p / 100 * len(ordered)) - 1, 0)]
+        assert exact <= histogram.percentile(p) <= exact * WIDTH
+    summary = histogram.summary()
+    assert summary["count"] == len(samples)
+    assert summary["mean"] == pytest.approx(samples.mean())
+    assert summary["max"] == samples.max()
+    assert summary["p50"] == histogram.percentile(50)
+
+
+def test_out_of_range_and_reset():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+    assert histogram.summary()["mean"] is None
+    histogram.add(0.0)
+    histogram.add(1e-9)
+    assert histogram.percentile(100) == 1e-9
+    # Longer than the last bucket
+    histogram.add(1e4)
+    assert histogram.percentile(100) == 1e4
+    assert histogram.percentile(50) <= LatencyHistogram.Min
+    histogram.reset()
+    assert histogram.count == 0 and histogram.max == 0.0
+    assert histogram.percentile(50) is None
@@ -0,0 +1,27 @@
+import os
+import subprocess
+import sys
+import pytest
+
+pytest.importorskip("acestatpy")
+pytest.importorskip("PyQt5")
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+CHECK = """
+import sys
+import ACEstatGUI
+print(sorted(m for m in ("matplotlib", "pyqtgraph.exporters") if m in sys.modules))
+from Exporters import MPLExporter
+print(MPLExporter.__name__, "matplotlib" in sys.modules)
+"""
+
+
+def test_exporters_imported_on_first_use():
+    # A new interpreter, other tests may have imported them
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        [SRC] + [p for p in sys.path if p]))
+    out = subprocess.run([sys.executable, "-c", CHECK], cwd=SRC, env=env,
+                         capture_output=True, text=True, timeout=120)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.split("\n")[:2] == ["[]", "MPLExporter True"]
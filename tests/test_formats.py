@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+from Results import Formats
+from Results.Formats import StoredResult, loadResult, readCsv, saveNpz
+from conftest import LiveTest, definition
+
+
+@pytest.fixture
+def definitions():
+    return {"cv": definition("cv", "Cyclic Voltammetry"),
+            "ca": definition("ca", "Chronoamperometry")}
+
+
+def write(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+def test_stored_export_round_trip(tmp_path, definitions):
+    results = {"data": {"Time": np.arange(5.0), "Current": np.linspace(0, 1, 5)},
+               "peak": {"Peak": 1.5},
+               "samples": {"Samples": np.array([3.0, 4.0])}}
+    original = StoredResult("ca", definitions["ca"], 1790000000.0,
+                            {"rate": 100, "gain": 2.5, "mode": "red"},
+                            results, definitions)
+    path = str(tmp_path / original.generateFilename())
+    original.export(path)
+    test = readCsv(path, definitions)
+    assert test.id == "ca"
+    assert test.startTime == original.startTime
+    assert dict(test.parameters) == {"rate": 100, "gain": 2.5, "mode": "red"}
+    np.testing.assert_array_equal(test.results["data"]["Current"], results["data"]["Current"])
+    np.testing.assert_array_equal(test.results["samples"]["Samples"], [3, 4])
+    assert test.results["peak"]["Peak"] == 1.5
+
+
+def test_export_by_names(tmp_path, definitions):
+    # Names, units and colons as a test's own export may write them, with
+    #   matrix and list columns side by side
+    path = write(tmp_path / "result.csv", "\n".join([
+        "Test:,Cyclic Voltammetry",
+        "Start Time:,2026-10-18 12:30:00",
+        "Parameters",
+        "Scan Rate (mV/s):,50",
+        "Gain,1.25",
+        "Mode,Oxidation",
+        "Results",
+        "Peak (A),0.75",
+        "",
+        "Time (s),Current (A),Samples",
+        "0,0.1,7",
+        "1,0.2,8",
+        "2,0.3,",
+        ""]))
+    test = readCsv(path, definitions)
+    assert test.id == "cv"
+    assert dict(test.parameters) == {"rate": 50, "gain": 1.25, "mode": "ox"}
+    assert test.results["peak"]["Peak"] == 0.75
+    np.testing.assert_array_equal(test.results["data"]["Time"], [0, 1, 2])
+    np.testing.assert_array_equal(test.results["data"]["Current"], [0.1, 0.2, 0.3])
+    np.testing.assert_array_equal(test.results["samples"]["Samples"], [7, 8])
+    assert test.startTime == pytest.approx(
+        Formats.datetime(2026, 10, 18, 12, 30).timestamp())
+
+
+def test_unknown_and_invalid_parameters_are_dropped(tmp_path, definitions):
+    path = write(tmp_path / "x.csv", "\n".join([
+        "Test,cv", "rate,abc", "gain,3", "mode,sideways", "removed,1",
+        "Time,Current", "0,1", ""]))
+    test = readCsv(path, definitions)
+    assert dict(test.parameters) == {"gain": 3.0}
+
+
+def test_test_matched_by_headers(tmp_path, definitions):
+    # Both tests have the same outputs, the file name decides
+    path = write(tmp_path / "20261018-123000_ca.csv", "Time,Current\n0,1\n1,2\n")
+    test = readCsv(path, definitions)
+    assert test.id == "ca"
+    assert test.startTime == Formats.datetime(2026, 10, 18, 12, 30).timestamp()
+    path = write(tmp_path / "other.csv", "Unrelated,Header\n0,1\n")
+    with pytest.raises(Exception):
+        readCsv(path, {"cv": definitions["cv"]})
+
+
+def test_large_matrix_is_read_in_chunks(tmp_path, definitions, monkeypatch):
+    monkeypatch.setattr(Formats, "CSV_CHUNK", 7)
+    rows = ["{0},{1}".format(i, i * 0.5) for i in range(100)]
+    path = write(tmp_path / "cv.csv", "\n".join(["#test,cv", "Time,Current"] + rows))
+    test = readCsv(path, definitions)
+    np.testing.assert_array_equal(test.results["data"]["Time"], np.arange(100))
+    assert not test.results["data"]["Time"].flags.writeable
+
+
+def test_npz_parameters_are_converted(tmp_path, definitions):
+    live = LiveTest(id="cv", startTime=1.0, info=definitions["cv"],
+                    parameters={"rate": "10", "mode": "ox", "old": "1"},
+                    results={"data": {"Time": [0, 1], "Current": [2, 3]}})
+    path = str(tmp_path / "r.npz")
+    saveNpz(live, path)
+    test = loadResult(path, definitions)
+    assert dict(test.parameters) == {"rate": 10, "mode": "ox"}
+    np.testing.assert_array_equal(test.results["data"]["Current"], [2, 3])
@@ -0,0 +1,89 @@
+from types import SimpleNamespace as NS
+import numpy as np
+import pytest
+
+pytest.importorskip("acestatpy")
+pytest.importorskip("PyQt5")
+from Widgets.LivePlot import LivePlot  # noqa: E402
+
+
+class Curve(object):
+    # Records what the plot is given
+    def __init__(self):
+        self.calls = []
+        self.x = self.y = []
+
+    def setData(self, x, y):
+        self.calls.append(("set", len(x)))
+        self.x, self.y = x, y
+
+    def appendData(self, x, y):
+        self.calls.append(("append", len(x) - len(self.x)))
+        self.x, self.y = x, y
+
+
+class Canvas(object):
+    # Stand-in for PlotCanvas
+    def __init__(self):
+        self.curves = []
+        self.changed = 0
+
+    def setLabel(self, *args, **kwargs):
+        pass
+
+    def setCurves(self, curves):
+        self.curves = [Curve() for c in curves]
+        return self.curves
+
+    def enableAutoRange(self):
+        pass
+
+    def setEnabled(self, enabled):
+        pass
+
+    def plotChanged(self):
+        self.changed += 1
+
+
+def running():
+    series = NS(x=NS(output="data", field="t"), y=NS(output="data", field="i"))
+    info = NS(plots={"main": NS(x_label="t", y_label="i", series=[series])})
+    return NS(info=info, results={})
+
+
+def receive(test, count):
+    # Results are lists that grow as messages arrive
+    data = test.results.setdefault("data", {"t": [], "i": []})
+    start = len(data["t"])
+    data["t"].extend(float(k) for k in range(start, start + count))
+    data["i"].extend(float(-k) for k in range(start, start + count))
+
+
+def test_update_appends_new_samples(app):
+    plot = LivePlot()
+    canvas = Canvas()
+    test = running()
+    plot.start(canvas, test, "main")
+    curve = canvas.curves[0]
+    # Nothing received yet
+    plot.flush()
+    assert curve.calls == []
+    for count in (5, 0, 300, 2):
+        receive(test, count)
+        plot.update()
+        plot.flush()
+    # Only the new samples each time, the empty message is skipped
+    assert curve.calls == [("append", 5), ("append", 300), ("append", 2)]
+    np.testing.assert_array_equal(curve.x, np.arange(307.0))
+    np.testing.assert_array_equal(curve.y, -np.arange(307.0))
+    # Flushing without an update does nothing
+    plot.flush()
+    assert len(curve.calls) == 3
+    # Results were reset, the curve starts over
+    test.results.clear()
+    receive(test, 4)
+    plot.update()
+    plot.flush()
+    assert curve.calls[-1] == ("set", 4)
+    plot.stop()
+    assert canvas.changed == 1 and not plot.isActive()
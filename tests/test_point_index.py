@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("acestatpy")
+pytest.importorskip("PyQt5")
+from Widgets.PlotCanvas import PointIndex  # noqa: E402
+
+
+def nearest(x, y, qx, qy, rx, ry):
+    # Brute force, as the scaled distance of the closest point within 1
+    d = ((x - qx) / rx) ** 2 + ((y - qy) / ry) ** 2
+    if np.isnan(d).all() or np.nanmin(d) > 1:
+        return None
+    return np.nanmin(d)
+
+
+@pytest.mark.parametrize("layout", ["sorted", "unsorted", "repeated"])
+def test_nearest_matches_brute_force(layout):
+    rng = np.random.default_rng(0)
+    n = 5000
+    if layout == "sorted":
+        x = np.sort(rng.uniform(0, 100, n))
+    elif layout == "unsorted":
+        t = np.linspace(0, 8 * np.pi, n)
+        x = 50 + 50 * np.sin(t)
+    else:
+        x = np.repeat(np.arange(n // 10, dtype=float), 10) / 5
+    y = rng.uniform(0, 100, n)
+    y[rng.random(n) < 0.05] = np.nan
+    index = PointIndex(x, y)
+    found = 0
+    for qx, qy, rx, ry in zip(rng.uniform(-5, 105, 500), rng.uniform(-5, 105, 500),
+                              rng.uniform(0.1, 3, 500), rng.uniform(0.1, 3, 500)):
+        expected = nearest(x, y, qx, qy, rx, ry)
+        i = index.nearest(qx, qy, rx, ry)
+        if expected is None:
+            assert i is None
+            continue
+        found += 1
+        assert ((x[i] - qx) / rx) ** 2 + ((y[i] - qy) / ry) ** 2 == pytest.approx(expected)
+    assert found > 50
+
+
+def test_empty_and_all_nan():
+    assert PointIndex(np.array([]), np.array([])).nearest(0, 0, 1, 1) is None
+    index = PointIndex(np.array([0.0, 1.0]), np.array([np.nan, np.nan]))
+    assert index.nearest(0, 0, 1, 1) is None
+    # Only as many points as both series have
+    index = PointIndex(np.array([2.0, 0.0, 1.0]), np.array([0.0, 0.0]))
+    assert index.nearest(1, 0, 1.5, 1) == 1
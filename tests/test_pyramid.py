@@ -0,0 +1,97 @@
+import warnings
+import numpy as np
+import pytest
+
+pytest.importorskip("acestatpy")
+from Utilities import MinMaxPyramid  # noqa: E402
+
+F = MinMaxPyramid.Factor
+
+
+def series(n, seed=0):
+    # Non-decreasing x with repeats, y with NaN runs
+    rng = np.random.default_rng(seed)
+    x = np.cumsum(rng.integers(0, 3, n)).astype(float)
+    y = rng.standard_normal(n)
+    y[rng.random(n) < 0.05] = np.nan
+    y[100:100 + 2 * F] = np.nan
+    return x, y
+
+
+def grown(x, y, seed=0):
+    # Pyramid built as the series grows in uneven chunks
+    rng = np.random.default_rng(seed)
+    pyramid = MinMaxPyramid()
+    n = 0
+    while n < len(x):
+        n = min(n + int(rng.integers(1, 700)), len(x))
+        pyramid.update(x[:n], y[:n])
+    return pyramid
+
+
+def test_levels_match_brute_force():
+    x, y = series(10000)
+    pyramid = grown(x, y)
+    assert len(pyramid) == len(x) and pyramid.monotonic
+    size = 1
+    for level in range(pyramid.levels()):
+        size *= F
+        # Every sample shown, at exactly two values per bin of this level
+        xOut, yOut = pyramid.select(x, y, -np.inf, np.inf, 2 * len(x) / size)
+        bins = len(x) // size
+        with warnings.catch_warnings():
+            # All-NaN bins
+            warnings.simplefilter("ignore", RuntimeWarning)
+            blocks = y[:bins * size].reshape(-1, size)
+            np.testing.assert_array_equal(yOut[0:2 * bins:2], np.nanmax(blocks, axis=1))
+            np.testing.assert_array_equal(yOut[1:2 * bins:2], np.nanmin(blocks, axis=1))
+        np.testing.assert_array_equal(
+            xOut[0:2 * bins:2], x[np.arange(bins) * size + size // 2])
+        if len(x) % size:
+            tail = y[bins * size:]
+            assert yOut[-2] == np.nanmax(tail) and yOut[-1] == np.nanmin(tail)
+    # The coarsest level still has at least Factor bins
+    assert len(x) // (size * F) < F
+
+
+def test_selection_covers_the_view():
+    x, y = series(20000, seed=1)
+    pyramid = grown(x, y, seed=1)
+    rng = np.random.default_rng(2)
+    for i in range(200):
+        left, right = np.sort(rng.uniform(x[0] - 10, x[-1] + 10, 2))
+        points = int(rng.integers(10, 2000))
+        xOut, yOut = pyramid.select(x, y, left, right, points)
+        i0 = max(np.searchsorted(x, left) - 1, 0)
+        i1 = min(np.searchsorted(x, right, side="right") + 1, len(x))
+        shown = y[i0:i1]
+        if 2 * (i1 - i0) < F * points:
+            # Few enough to be drawn as they are
+            np.testing.assert_array_equal(xOut, x[i0:i1])
+            np.testing.assert_array_equal(yOut, shown)
+            continue
+        # Every visible sample lies within the drawn envelope, from bins
+        #   around the view
+        assert points <= len(yOut) <= F * points + 4
+        assert np.nanmax(yOut) >= np.nanmax(shown)
+        assert np.nanmin(yOut) <= np.nanmin(shown)
+        assert np.all(np.diff(xOut) >= 0)
+
+
+def test_changes_start_over():
+    x, y = series(5000)
+    pyramid = grown(x, y)
+    levels = pyramid.levels()
+    # Fewer samples than covered
+    pyramid.update(x[:10], y[:10])
+    assert len(pyramid) == 10 and pyramid.levels() == 1
+    pyramid.update(x, y)
+    assert pyramid.levels() == levels
+    # x going back
+    x = x.copy()
+    x[-1] = x[-2] - 1
+    pyramid.reset()
+    pyramid.update(x, y)
+    assert not pyramid.monotonic and pyramid.levels() == 0 and pyramid.nbytes == 0
+    pyramid.reset()
+    assert pyramid.monotonic and len(pyramid) == 0
@@ -0,0 +1,139 @@
+import random
+from types import SimpleNamespace as NS
+import pytest
+
+pytest.importorskip("acestatpy")
+pytest.importorskip("PyQt5")
+from PyQt5.QtCore import Qt  # noqa: E402
+from Widgets.QueuePanel import QueueModel  # noqa: E402
+
+
+def queued(iterations=1):
+    return NS(info=NS(name="Test"), iterations=iterations, run_forever=False)
+
+
+def listed(model):
+    return [model.test(row) for row in range(model.rowCount())]
+
+
+def counts(model):
+    return [model.data(model.index(row), QueueModel.CountRole)
+            for row in range(model.rowCount())]
+
+
+class Spy(object):
+    # Records the model's change signals
+    def __init__(self, model):
+        self.events = []
+        for name in ("rowsInserted", "rowsRemoved", "rowsMoved",
+                     "dataChanged", "modelReset"):
+            getattr(model, name).connect(
+                lambda *args, name=name: self.events.append(name))
+
+    def count(self, name):
+        return self.events.count(name)
+
+
+def test_sync_applies_moves_inserts_and_removes():
+    rng = random.Random(0)
+    model = QueueModel()
+    spy = Spy(model)
+    queue = [queued() for i in range(20)]
+    model.sync(queue)
+    assert listed(model) == queue
+    for step in range(200):
+        op = rng.choice(("insert", "remove", "move", "count"))
+        if op == "insert" or not queue:
+            queue.insert(rng.randint(0, len(queue)), queued())
+        elif op == "remove":
+            del queue[rng.randrange(len(queue))]
+        elif op == "move":
+            queue.insert(rng.randint(0, len(queue) - 1),
+                         queue.pop(rng.randrange(len(queue))))
+        else:
+            queue[rng.randrange(len(queue))].iterations += 1
+        model.sync(queue)
+        assert listed(model) == queue
+        assert counts(model) == [str(t.iterations) for t in queue]
+    assert spy.count("modelReset") == 0
+
+
+def test_sync_only_touches_changed_rows():
+    model = QueueModel()
+    queue = [queued() for i in range(10)]
+    model.sync(queue)
+    spy = Spy(model)
+    queue.insert(2, queue.pop(7))
+    model.sync(queue)
+    assert spy.events == ["rowsMoved"]
+    spy.events.clear()
+    queue[3].iterations = 5
+    model.sync(queue)
+    assert spy.events == ["dataChanged"]
+    spy.events.clear()
+    model.sync(queue)
+    assert spy.events == []
+
+
+def test_known_changes():
+    model = QueueModel()
+    queue = [queued() for i in range(5)]
+    for t in queue:
+        model.insertTest(model.rowCount(), t)
+    model.moveTest(0, 3)
+    queue.insert(3, queue.pop(0))
+    assert listed(model) == queue
+    model.moveTest(4, 1)
+    queue.insert(1, queue.pop(4))
+    assert listed(model) == queue
+    model.removeTest(1, 2)
+    del queue[1:3]
+    assert listed(model) == queue
+
+
+def test_sync_front():
+    model = QueueModel()
+    queue = [queued(3) for i in range(5)]
+    model.sync(queue)
+    spy = Spy(model)
+    # The instrument counts down the first test, then takes it off
+    queue[0].iterations = 2
+    assert model.syncFront(queue)
+    assert spy.events == ["dataChanged"]
+    del queue[:2]
+    assert model.syncFront(queue)
+    assert listed(model) == queue
+    # Anything else needs a full sync
+    queue.insert(0, queued())
+    assert not model.syncFront(queue)
+    assert listed(model) == queue[1:]
+    assert model.syncFront([])
+    assert model.rowCount() == 0
+
+
+def test_drop_requests_a_move():
+    model = QueueModel()
+    queue = [queued() for i in range(5)]
+    model.sync(queue)
+    moves = []
+    model.sigMoveRequest.connect(lambda test, dst: moves.append((test, dst)))
+    for src, row in ((0, 3), (4, 1), (2, -1), (1, 1)):
+        data = model.mimeData([model.index(src)])
+        assert not model.dropMimeData(data, Qt.MoveAction, row, 0, model.index(-1))
+    # Inserting before row 3 puts row 0 at 2, -1 drops at the end
+    assert moves == [(queue[0], 2), (queue[4], 1), (queue[2], 4)]
+
+
+def test_not_movable():
+    model = QueueModel()
+    model.sync([queued() for i in range(3)])
+    moves = []
+    model.sigMoveRequest.connect(lambda test, dst: moves.append((test, dst)))
+    model.setMovable(False)
+    assert not model.flags(model.index(0)) & Qt.ItemIsDragEnabled
+    assert not model.flags(model.index(-1)) & Qt.ItemIsDropEnabled
+    data = model.mimeData([model.index(0)])
+    model.dropMimeData(data, Qt.MoveAction, 2, 0, model.index(-1))
+    assert moves == []
+    model.setMovable(True)
+    assert model.flags(model.index(0)) & Qt.ItemIsDragEnabled
@@ -0,0 +1,80 @@
+from types import SimpleNamespace as NS
+import numpy as np
+import pytest
+
+pytest.importorskip("acestatpy")
+pytest.importorskip("PyQt5")
+from Widgets.PlotCanvas import PlotWidget  # noqa: E402
+from Widgets.ResultDisplay import ResultDisplay  # noqa: E402
+
+
+class Result(object):
+    # Finished test with two plots of one series each
+    def __init__(self, name="Test"):
+        self.startTime = 0.0
+        self.results = {"data": {"t": np.arange(50.0),
+                                 "a": np.random.random(50),
+                                 "b": np.random.random(50)}}
+        self.info = NS(name=name, plots={
+            id: NS(x_label="t", y_label=id, series=[
+                NS(x=NS(output="data", field="t"), y=NS(output="data", field=id))])
+            for id in ("a", "b")})
+
+
+def shown(display):
+    return display.canvas.findChild(PlotWidget).plotItem.listDataItems()
+
+
+@pytest.fixture
+def display(app):
+    display = ResultDisplay()
+    yield display
+    display.deleteLater()
+
+
+def test_overlay_toggles_results(display):
+    tests = [Result(f"Test {i}") for i in range(3)]
+    changes = []
+    display.sigOverlayChanged.connect(lambda: changes.append(display.overlaid()))
+    for t in tests:
+        display.setOverlaid("a", t, True)
+    assert display.overlaid() == [(t, "a") for t in tests]
+    assert len(shown(display)) == 3
+    items = shown(display)
+    display.setOverlaid("a", tests[1], False)
+    assert not display.isOverlaid("a", tests[1])
+    assert shown(display) == [items[0], items[2]]
+    # Shown again with the same curve
+    display.setOverlaid("a", tests[1], True)
+    assert set(shown(display)) == set(items)
+    # Removing a result that is not overlaid changes nothing
+    count = len(changes)
+    display.setOverlaid("b", tests[0], False)
+    assert len(changes) == count
+
+
+def test_overlaid_results_stay_cached(display):
+    tests = [Result() for i in range(3)]
+    display.setCacheBudget(1)
+    display.setOverlaid("a", tests[0], True)
+    display.setOverlaid("a", tests[1], True)
+    display.plotResult("a", tests[2])
+    # Plotting a single result ends the overlay, only it is kept
+    assert display.overlaid() == []
+    assert len(display.curves) == 1 and (tests[2], "a") in display.curves
+    display.setOverlaid("a", tests[0], True)
+    display.setOverlaid("a", tests[1], True)
+    assert (tests[0], "a") in display.curves and (tests[1], "a") in display.curves
+
+
+def test_another_plot_starts_a_new_overlay(display):
+    tests = [Result() for i in range(2)]
+    display.setOverlaid("a", tests[0], True)
+    display.setOverlaid("b", tests[1], True)
+    assert display.overlaid() == [(tests[1], "b")]
+    assert len(shown(display)) == 1
+    # By key, e.g. an archived result read again
+    display.setOverlaid("b", Result(), True, key=7)
+    assert display.isOverlaid("b", 7)
+    display.clear()
+    assert display.overlaid() == [] and shown(display) == []
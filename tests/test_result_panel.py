@@ -0,0 +1,99 @@
+import pytest
+
+pytest.importorskip("acestatpy")
+pytest.importorskip("PyQt5")
+from Results import ResultArchive  # noqa: E402
+from Widgets.ExpandingList import ExpandingListView  # noqa: E402
+from Widgets.ResultPanel import ResultModel, ResultPanel  # noqa: E402
+from conftest import LiveTest, definition  # noqa: E402
+
+
+@pytest.fixture
+def definitions():
+    return {"cv": definition("cv", "Cyclic Voltammetry", "Voltammetry")}
+
+
+def liveTest(definitions, start):
+    return LiveTest(id="cv", info=definitions["cv"], startTime=start,
+                    parameters={"rate": 10},
+                    results={"data": {"Time": [0.0, 1.0], "Current": [1.0, 2.0]}})
+
+
+@pytest.fixture
+def panel(app, tmp_path, definitions):
+    # Pages of three, archived results started at 100 to 104
+    def create(direction=-1, limit=None):
+        archive = ResultArchive(str(tmp_path / "archive"), limit=limit)
+        for start in range(100, 105):
+            archive.add(liveTest(definitions, float(start)))
+        panel = ResultPanel(direction=direction)
+        panel.PageSize = 3
+        panel.setArchive(archive, definitions)
+        panels.append(panel)
+        return panel
+    panels = []
+    yield create
+    for panel in panels:
+        panel.archive().close()
+        panel.deleteLater()
+
+
+def model(panel):
+    return panel.findChild(ExpandingListView).model()
+
+
+def shown(panel):
+    # Start times of the listed records
+    m = model(panel)
+    return [panel.archive().record(m.index(row).data(ResultModel.KeyRole)).startTime
+            for row in range(m.rowCount())]
+
+
+def changes(panel):
+    events = []
+    for name in ("rowsInserted", "rowsRemoved", "modelReset"):
+        getattr(model(panel), name).connect(
+            lambda *args, name=name: events.append(name))
+    return events
+
+
+def test_row_of_key(panel):
+    panel = panel()
+    m = model(panel)
+    keys = [m.index(row).data(ResultModel.KeyRole) for row in range(3)]
+    assert [m.rowOfKey(k) for k in keys] == [0, 1, 2]
+    assert m.rowOfKey(-1) == -1
+    assert m.rowOf(panel.archive().record(keys[1])) == 1
+
+
+def test_inserted_into_the_page(panel, definitions):
+    panel = panel()
+    assert shown(panel) == [104, 103, 102]
+    events = changes(panel)
+    panel.append(liveTest(definitions, 103.5))
+    # The last row moves to the next page
+    assert shown(panel) == [104, 103.5, 103]
+    assert events == ["rowsInserted", "rowsRemoved"]
+    # Newer than the page, on the next one
+    panel.setPage(3)
+    assert shown(panel) == [102, 101, 100]
+    events = changes(panel)
+    panel.append(liveTest(definitions, 200))
+    assert shown(panel) == [103, 102, 101]
+    assert events == ["rowsInserted", "rowsRemoved"]
+    # Older than the page, not shown
+    panel.setPage(0)
+    panel.append(liveTest(definitions, 50))
+    assert shown(panel) == [200, 104, 103.5]
+
+
+def test_refilled_after_prune(panel, definitions):
+    # Oldest first, the archive keeps five results
+    panel = panel(direction=0, limit=5)
+    assert shown(panel) == [100, 101, 102]
+    events = changes(panel)
+    panel.append(liveTest(definitions, 200))
+    # 100 is pruned, the next record fills the page
+    assert shown(panel) == [101, 102, 103]
+    assert events == ["rowsRemoved", "rowsInserted"]
+    assert panel.archive().count() == 5
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("acestatpy")
+pytest.importorskip("PyQt5")
+from PyQt5.QtCore import Qt  # noqa: E402
+from Widgets.ResultTable import ResultTable, ResultTableModel  # noqa: E402
+
+
+def cells(model):
+    return [[model.data(model.index(row, column))
+             for column in range(model.columnCount())]
+            for row in range(model.rowCount())]
+
+
+def test_ragged_columns_give_empty_cells():
+    model = ResultTableModel()
+    model.setColumns(["Time", "Peak", "Samples"],
+                     [np.arange(3.0), [1.5], np.array([7, 8])])
+    assert (model.rowCount(), model.columnCount()) == (3, 3)
+    assert cells(model) == [["0.0", "1.5", "7"],
+                            ["1.0", None, "8"],
+                            ["2.0", None, None]]
+    assert [model.headerData(c, Qt.Horizontal) for c in range(3)] == \
+        ["Time", "Peak", "Samples"]
+    assert model.headerData(2, Qt.Vertical) == "3"
+    # Children of a cell, as for any table
+    assert model.rowCount(model.index(0, 0)) == 0
+    assert model.columnCount(model.index(0, 0)) == 0
+
+
+def test_columns_are_replaced(app):
+    table = ResultTable(["a"], [np.arange(1000000.0)])
+    model = table.model()
+    assert (model.rowCount(), model.columnCount()) == (1000000, 1)
+    resets = []
+    model.modelReset.connect(lambda: resets.append(model.rowCount()))
+    table.setData(["a", "b"], [[], []])
+    assert (model.rowCount(), model.columnCount()) == (0, 2)
+    table.setData([], [])
+    assert resets == [0, 0] and model.columnCount() == 0
+    table.deleteLater()
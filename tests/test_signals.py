@@ -0,0 +1,65 @@
+import threading
+import time
+import pytest
+
+acestatpy = pytest.importorskip("acestatpy")
+pytest.importorskip("PyQt5")
+from Utilities import SignalTranslator  # noqa: E402
+
+
+def wait(app, done, timeout=5.0):
+    end = time.perf_counter() + timeout
+    while not done() and time.perf_counter() < end:
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def emitted(*calls):
+    # Emits from another thread, as the instrument does
+    thread = threading.Thread(target=lambda: [s.emit(m) for s, m in calls])
+    thread.start()
+    thread.join()
+
+
+def test_batched_and_unbatched_keep_emitted_order(app):
+    log = []
+    sent = acestatpy.Signal("test_sent")
+    received = acestatpy.Signal("test_received")
+    translators = [
+        SignalTranslator(sent, lambda m: log.append(m)),
+        SignalTranslator(received, lambda batch: log.extend(
+            args[0] for args, kwargs in batch), batch=True, rate=1000),
+    ]
+    calls = []
+    for i in range(20):
+        calls.append((sent, "c{0}".format(i)))
+        calls.extend((received, "r{0}.{1}".format(i, j)) for j in range(i % 4))
+    emitted(*calls)
+    wait(app, lambda: len(log) == len(calls))
+    assert log == [m for s, m in calls]
+    # Nothing is held back once every event has been delivered
+    log.clear()
+    emitted((received, "r"), (received, "s"))
+    wait(app, lambda: len(log) == 2)
+    assert log == ["r", "s"]
+    for t in translators:
+        assert t.stats()["queued"] == t.stats()["delivered"]
+
+
+def test_direct_emission_among_queued(app):
+    log = []
+    sent = acestatpy.Signal("test_direct")
+    received = acestatpy.Signal("test_direct_received")
+    translators = [
+        SignalTranslator(sent, lambda m: log.append(m)),
+        SignalTranslator(received, lambda batch: log.extend(
+            args[0] for args, kwargs in batch), batch=True, rate=1000),
+    ]
+    emitted((received, "r1"), (sent, "c1"), (received, "r2"), (sent, "c2"))
+    # Emitted on the GUI thread, e.g. a sent command, it is delivered at once
+    sent.emit("c0")
+    assert log == ["r1", "c0"]
+    wait(app, lambda: len(log) == 5)
+    assert log == ["r1", "c0", "c1", "r2", "c2"]
+    for t in translators:
+        assert t.stats()["queued"] == t.stats()["delivered"]
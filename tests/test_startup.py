@@ -0,0 +1,117 @@
+import threading
+import time
+import pytest
+
+acestatpy = pytest.importorskip("acestatpy")
+pytest.importorskip("PyQt5")
+from PyQt5.QtCore import QEvent  # noqa: E402
+from PyQt5.QtWidgets import QAction, QApplication  # noqa: E402
+import ACEstatGUI  # noqa: E402
+from Utilities import BackgroundTask  # noqa: E402
+
+
+def wait(app, done, timeout=10.0):
+    end = time.perf_counter() + timeout
+    while not done() and time.perf_counter() < end:
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def delivered(app, task):
+    # (signal, value, on the GUI thread) once the task has finished
+    results = []
+    for name in ("sigDone", "sigError"):
+        getattr(task, name).connect(lambda value, name=name: results.append(
+            (name, value, threading.current_thread() is threading.main_thread())))
+    task.start()
+    wait(app, lambda: results)
+    return results
+
+
+def test_task_result_on_gui_thread(app):
+    def slow(a, b=0):
+        time.sleep(0.05)
+        return threading.current_thread() is threading.main_thread(), a + b
+
+    assert delivered(app, BackgroundTask(slow, 1, b=2)) == [
+        ("sigDone", (False, 3), True)]
+
+
+def test_task_error_on_gui_thread(app):
+    def fail():
+        raise ValueError("No instrument")
+
+    [(name, error, gui)] = delivered(app, BackgroundTask(fail))
+    assert (name, type(error), str(error), gui) == (
+        "sigError", ValueError, "No instrument", True)
+
+
+class Failing(object):
+    def __init__(self):
+        raise Exception("Definitions missing")
+
+
+class Slow(acestatpy.ACEstatPy):
+    created = None
+
+    def __init__(self):
+        time.sleep(0.3)
+        super().__init__()
+        Slow.created = threading.current_thread()
+
+
+@pytest.fixture
+def started(app, monkeypatch, tmp_path):
+    # Creates the window with a stand-in ACEstatPy, records its stages
+    monkeypatch.setattr(ACEstatGUI, "DEFINITION_CACHE", str(tmp_path / "cache"))
+    dialogs = []
+    monkeypatch.setattr(ACEstatGUI.ACEstatGUI, "messageDialog",
+                        lambda self, *args, **kwargs: dialogs.append(args))
+    windows = []
+
+    def start(factory):
+        monkeypatch.setattr(ACEstatGUI, "ACEstatPy", factory)
+        stages = []
+        window = ACEstatGUI.ACEstatGUI()
+        # Stages are delivered by the event loop, none have been yet
+        window.sigStartupStage.connect(lambda stage: stages.append(
+            (stage, threading.current_thread() is threading.main_thread())))
+        windows.append(window)
+        return window, stages, dialogs
+
+    yield start
+    for window in windows:
+        window.writer.close()
+        window.loader.close()
+        window.deleteLater()
+    # Deleted before the next test, as closing the window would
+    QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+def startupActions(window):
+    return [a for a in window.findChildren(QAction) if a.text() in (
+        "Import Tests", "Open Results", "Import Presets", "Save Preset")]
+
+
+def test_failed_startup(app, started):
+    window, stages, dialogs = started(Failing)
+    wait(app, lambda: stages)
+    assert stages == [("failed", True)]
+    assert window.acestat is None
+    assert len(dialogs) == 1 and "Definitions missing" in dialogs[0][3]
+    actions = startupActions(window)
+    assert len(actions) == 4 and not any(a.isEnabled() for a in actions)
+
+
+def test_slow_instrument(app, started):
+    window, stages, dialogs = started(Slow)
+    # The window is usable while ACEstatPy is created
+    assert window.acestat is None and stages == []
+    assert not any(a.isEnabled() for a in startupActions(window))
+    wait(app, lambda: ("interactive", True) in stages)
+    assert Slow.created is not threading.main_thread()
+    assert {s for s, gui in stages} == {"definitions", "forms", "ports",
+                                         "interactive"}
+    assert all(gui for s, gui in stages) and stages[-1][0] == "interactive"
+    assert isinstance(window.acestat, Slow) and dialogs == []
+    assert all(a.isEnabled() for a in startupActions(window))
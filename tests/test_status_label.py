@@ -0,0 +1,60 @@
+import pytest
+
+pytest.importorskip("acestatpy")
+pytest.importorskip("PyQt5")
+from Widgets.StatusLabel import StatusLabel  # noqa: E402
+
+
+class Running(object):
+    # Running ACEstatPy test, counting how often the label asks for the time
+    def __init__(self, remaining=12.4):
+        self.id = "cv"
+        self.remaining = remaining
+        self.asked = 0
+
+    def estimateRemaining(self):
+        self.asked += 1
+        return self.remaining
+
+
+@pytest.fixture
+def label(app):
+    label = StatusLabel()
+    yield label
+    label.stopTest()
+    label.deleteLater()
+
+
+def test_received_only_counts(label):
+    test = Running()
+    label.startTest(test)
+    text = label.text()
+    assert text == "Running cv: ~12s" and test.asked == 1
+    for i in range(1000):
+        label.received("0123456789\n")
+    # Shown at the next refresh
+    assert label.text() == text and test.asked == 1
+    label.refresh()
+    assert label.text().startswith(
+        "Running cv: ~12s  |  Received 1000 lines, 10.7 kB")
+    assert test.asked == 2
+
+
+def test_message_kept_over_the_countdown(label):
+    test = Running(remaining=None)
+    label.startTest(test)
+    assert label.text() == "Running cv..."
+    label.setText("Overcurrent")
+    label.refresh()
+    assert label.text() == "Overcurrent"
+    label.received("x\n")
+    label.refresh()
+    assert label.text().startswith("Overcurrent  |  Received 1 lines")
+    # A new test shows its countdown again
+    label.startTest(Running())
+    assert label.text() == "Running cv: ~12s"
+    # Without a test, text is shown as it is
+    label.stopTest()
+    label.setText("Ready")
+    label.refresh()
+    assert label.text() == "Ready"
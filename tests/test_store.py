@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from Results import Columns, summarize
+from conftest import LiveTest
+
+
+def test_summaries_match_numpy():
+    values = np.random.default_rng(0).standard_normal(1000)
+    values[1::7] = np.nan
+    values[3] = np.inf
+    summary = summarize(values)
+    finite = values[np.isfinite(values)]
+    assert summary.count == 1000
+    assert (summary.min, summary.max) == (finite.min(), finite.max())
+    assert summary.mean == pytest.approx(finite.mean())
+    assert (summary.first, summary.last) == (values[0], values[-1])
+
+
+def test_summaries_without_numbers():
+    assert summarize(np.array([])).count == 0
+    assert summarize(np.array([np.nan, np.nan]))[:4] == (2, None, None, None)
+    text = summarize(np.array(["a", "b", "c"]))
+    assert text == (3, None, None, None, "a", "c")
+    integers = summarize(np.array([3, 1, 2], dtype=np.int64))
+    assert integers == (3, 1, 3, 2.0, 3, 2)
+    assert type(integers.min) is int
+
+
+def test_columns_are_converted_once():
+    test = LiveTest(results={"list": {"a": [1.5, 2.5], "b": ["1", "2"], "c": ["x"]},
+                             "field": {"Peak": 3.0}})
+    columns = Columns(test)
+    assert Columns(test) is columns
+    a = columns["list"]["a"]
+    assert a.dtype == np.float64 and not a.flags.writeable
+    # Numbers that arrived as text
+    assert columns["list"]["b"].dtype == np.float64
+    assert columns["list"]["c"].dtype.kind == "U"
+    assert columns["field"]["Peak"] == 3.0
+    assert columns.summary("list", "a") is columns.summary("list", "a")
+    assert columns.summary("list", "a").mean == 2.0
+    assert columns.nbytes == a.nbytes + columns["list"]["b"].nbytes \
+        + columns["list"]["c"].nbytes
@@ -0,0 +1,68 @@
+import sys
+from copy import deepcopy
+from types import SimpleNamespace as NS
+import pytest
+
+pytest.importorskip("acestatpy")
+pytest.importorskip("PyQt5")
+from PyQt5.QtCore import QEvent  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+from Widgets import GroupComboBox  # noqa: E402
+from Widgets.TestForm import definitionKey  # noqa: E402
+
+# Not imported by name, pytest would try to collect the Test* classes
+module = sys.modules[definitionKey.__module__]
+
+
+def definitions(count=6):
+    return {f"t{i}": NS(
+        id=f"t{i}", name=f"Test {i}", technique=f"Technique {i % 2}",
+        description="", presets={},
+        parameters={
+            "a": NS(name="Value", type="int", min=0, max=1000, units="mV"),
+            "b": NS(name="Option", type="select", options={"x": "X", "y": "Y"}),
+        }) for i in range(count)}
+
+
+def test_definition_key():
+    tests = definitions()
+    copy = deepcopy(tests)
+    assert definitionKey(tests) == definitionKey(copy)
+    copy["t1"].parameters["b"].options["z"] = "Z"
+    assert definitionKey(tests["t1"]) != definitionKey(copy["t1"])
+    assert definitionKey(tests["t0"]) == definitionKey(copy["t0"])
+    # Stops at cycles
+    tests["t0"].parent = tests
+    assert definitionKey(tests["t0"]) == definitionKey(tests["t0"])
+
+
+def panels(form):
+    # Selects every test, so each has its panel
+    select = form.findChild(GroupComboBox)
+    for i in range(select.count()):
+        select.setCurrentIndex(i)
+    return set(form.findChildren(module.TestPanel))
+
+
+def test_panels_built_on_selection_and_kept(app):
+    tests = definitions()
+    form = module.TestForm(tests)
+    # Only the selected test's panel is built
+    assert len(form.findChildren(module.TestPanel)) == 1
+    built = panels(form)
+    assert len(built) == len(tests)
+    assert form.CurrentParameters[0] in tests
+    # Imported again with one test changed and one removed
+    imported = deepcopy(tests)
+    imported["t0"].parameters["a"].max = 2000
+    del imported["t1"]
+    form.setTests(imported)
+    QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    rebuilt = panels(form)
+    assert len(rebuilt) == len(imported)
+    assert len(rebuilt & built) == len(imported) - 1
+    kept = {p.test.id for p in rebuilt & built}
+    assert kept == set(imported) - {"t0"}
+    # Kept panels show the new definitions
+    assert all(p.test is imported[p.test.id] for p in rebuilt)
+    form.deleteLater()
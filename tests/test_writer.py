@@ -0,0 +1,81 @@
+import threading
+import time
+import numpy as np
+import pytest
+
+pytest.importorskip("PyQt5")
+from Results import ResultWriter, loadResult  # noqa: E402
+from conftest import LiveTest, definition  # noqa: E402
+
+
+@pytest.fixture
+def writer(app):
+    writer = ResultWriter()
+    yield writer
+    writer.close()
+
+
+def wait(app, done, timeout=5.0):
+    end = time.perf_counter() + timeout
+    while not done() and time.perf_counter() < end:
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def test_files_written_in_order(app, writer, tmp_path):
+    written = []
+    saved = []
+    writer.sigSaved.connect(saved.append)
+    for i in range(20):
+        # The first is the slowest, later ones still wait for it
+        writer.submit(str(i), lambda i: (time.sleep(0.02 if i == 0 else 0),
+                                         written.append(i)), i)
+    writer.flush()
+    assert written == list(range(20))
+    wait(app, lambda: len(saved) == 20)
+    assert saved == [str(i) for i in range(20)]
+    # And results, as .npz
+    definitions = {"cv": definition("cv", "Cyclic Voltammetry")}
+    test = LiveTest(id="cv", startTime=1.0, info=definitions["cv"],
+                    parameters={"rate": "10"},
+                    results={"data": {"Time": [0, 1], "Current": [2, 3]}})
+    path = str(tmp_path / "r.npz")
+    writer.save(test, path)
+    writer.flush()
+    np.testing.assert_array_equal(
+        loadResult(path, definitions).results["data"]["Current"], [2, 3])
+
+
+def test_errors_are_reported(app, writer):
+    errors = []
+    progress = []
+    writer.sigError.connect(lambda path, msg: errors.append((path, msg)))
+    writer.sigProgress.connect(progress.append)
+    saved = []
+    writer.sigSaved.connect(saved.append)
+
+    def fail():
+        raise Exception("Disk full")
+
+    writer.submit("a.csv", fail)
+    writer.submit("b.csv", lambda: None)
+    writer.flush()
+    wait(app, lambda: saved)
+    assert errors == [("a.csv", "Disk full")]
+    # The next file is still written
+    assert saved == ["b.csv"] and writer.pending() == 0
+
+
+def test_close_writes_pending_files(app):
+    writer = ResultWriter()
+    release = threading.Event()
+    written = []
+    writer.submit("first", release.wait)
+    for i in range(5):
+        writer.submit(str(i), written.append, i)
+    assert writer.pending() == 6
+    threading.Timer(0.05, release.set).start()
+    writer.close()
+    assert written == list(range(5)) and writer.pending() == 0
+    with pytest.raises(RuntimeError):
+        writer.submit("late", written.append, 5)